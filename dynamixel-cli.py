@@ -1,12 +1,66 @@
 import sys
 import os
+import argparse
+import socket
+
+# Unix socket on which --service accepts one-shot commands, so scripted calls reuse its open port.
+# In the per-user runtime dir rather than world-writable /tmp; DYNAMIXEL_CLI_SOCKET overrides it
+# (e.g. when the service runs as another user than the client).
+SERVICE_SOCKET = os.environ.get('DYNAMIXEL_CLI_SOCKET') or os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or '/tmp', 'dynamixel-cli.sock')
+
+# --- Service command socket: client side ---
+def send_service_command(argv):
+    """Send one command to a running --service instance and print its reply.
+    Returns False if no service is listening on SERVICE_SOCKET."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(SERVICE_SOCKET)
+            sock.sendall((" ".join(argv) + "\n").encode())
+            sock.shutdown(socket.SHUT_WR)
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                sys.stdout.write(chunk.decode(errors="replace"))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    return True
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Dynamixel CLI and Service")
+    parser.add_argument("--service", action="store_true", help="Run in headless service mode (for systemd)")
+    parser.add_argument("command", nargs="*", help="Send one command (e.g. 'set 1 50') to the running service and exit")
+    return parser.parse_args()
+
+# A one-shot command only talks to the running service, so it is sent before any of the
+# config, serial port and SDK setup below (and before their imports)
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command:
+        if not send_service_command(args.command):
+            print(f"No service is listening on {SERVICE_SOCKET}. Start one with --service.")
+            sys.exit(1)
+        sys.exit(0)
+
 import yaml
+try:
+    from yaml import CSafeLoader as _YamlLoader # libyaml C extension
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 import time
 import threading
 import glob
 import logging
-import argparse
+import json
 import signal
+import struct
+import selectors
+import io
+import contextlib
+import queue
+from concurrent.futures import Future
+from serial.tools import list_ports
 
 # Conditional import for getch (not actively used in the main CLI input loop)
 if os.name == 'nt':
@@ -42,22 +96,55 @@ except ImportError:
 
 # --- Configuration & Constants ---
 CONFIG_FILE = 'config.yaml'
+CONFIG_JSON_FILE = os.path.splitext(CONFIG_FILE)[0] + '.json' # Parsed copy of the YAML, keyed on its mtime and size
 # This value represents how many RPM corresponds to one unit of the Dynamixel velocity.
 # For XL430-W250, this is approximately 0.229 RPM per unit.
 # YOU MAY NEED TO ADJUST THIS for your specific servo model and voltage for accurate RPM.
 RPM_PER_UNIT_VELOCITY = 0.229
+# USB VID:PID of the ROBOTIS U2D2 (FTDI FT232H)
+U2D2_VID = 0x0403
+U2D2_PID = 0x6014
+# FTDI USB latency timer in ms. The Linux default of 16ms dominates every Dynamixel round-trip.
+USB_LATENCY_TIMER_MS = 1
+# Longest single wait for the first byte of a Sync Read reply before handing over to the SDK's own timeout.
+STATUS_REPLY_WAIT_S = 0.05
 
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 
 # --- Load Configuration from YAML ---
+def load_config():
+    """Return the parsed config.yaml, from the JSON copy when it was written for the YAML's current
+    mtime and size. JSON rather than pickle: loading the copy can never run code, whoever wrote it."""
+    st = os.stat(CONFIG_FILE)
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(CONFIG_JSON_FILE, 'r') as f:
+            cached = json.load(f)
+        if cached['source'] == source:
+            return cached['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass # Missing, stale or unreadable JSON copy: fall back to parsing the YAML
+    with open(CONFIG_FILE, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    # Written to a temp file and renamed over the copy, so a failed dump never leaves it truncated
+    tmp_file = f"{CONFIG_JSON_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump({'source': source, 'data': data}, f)
+        os.replace(tmp_file, CONFIG_JSON_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Could not write {CONFIG_JSON_FILE}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+    return data
+
 config = None
 try:
-    with open(CONFIG_FILE, 'r') as f:
-        config_full = yaml.safe_load(f)
-        if 'dynamixel_settings' not in config_full:
-            print(f"Error: 'dynamixel_settings' key not found at the top level of '{CONFIG_FILE}'.")
-            sys.exit(1)
-        config = config_full['dynamixel_settings']
+    config_full = load_config()
+    if 'dynamixel_settings' not in config_full:
+        print(f"Error: 'dynamixel_settings' key not found at the top level of '{CONFIG_FILE}'.")
+        sys.exit(1)
+    config = config_full['dynamixel_settings']
     print(f"Loaded configuration from {CONFIG_FILE}")
 except FileNotFoundError:
     print(f"Error: Configuration file '{CONFIG_FILE}' not found.")
@@ -83,6 +170,7 @@ try:
     ADDR_TORQUE_ENABLE      = int(config['ADDR_TORQUE_ENABLE'])
     ADDR_GOAL_VELOCITY      = int(config['ADDR_GOAL_VELOCITY'])
     ADDR_PRESENT_VELOCITY   = int(config.get('ADDR_PRESENT_VELOCITY', 128)) # Default for many X-series
+    ADDR_RETURN_DELAY_TIME  = int(config.get('ADDR_RETURN_DELAY_TIME', 9))   # Default for many X-series
 
     MODE_VELOCITY_CONTROL   = int(config['MODE_VELOCITY_CONTROL'])
 
@@ -91,6 +179,9 @@ try:
     MAX_VELOCITY_UNIT       = int(config.get('MAX_VELOCITY_UNIT', 1023)) # Default for many X-series
 
     DEFAULT_START_RPM       = float(config.get('DEFAULT_START_RPM', 25.0))
+    TELEMETRY_HZ            = float(config.get('TELEMETRY_HZ', 10.0))
+    if TELEMETRY_HZ <= 0:
+        raise ValueError("TELEMETRY_HZ must be greater than 0.")
 
 except KeyError as e:
     print(f"Error: Missing required key {e} in 'dynamixel_settings' in '{CONFIG_FILE}'.")
@@ -104,6 +195,21 @@ except Exception as e:
 
 # --- Auto-detect Serial Port if Needed ---
 def auto_detect_serial_port():
+    """Find the U2D2 by USB VID:PID, falling back to the first matching /dev/tty* path."""
+    ports = list_ports.comports()
+    for p in ports:
+        logging.info(f"Serial port candidate: {p.device} (VID:PID={p.vid}:{p.pid}, manufacturer={p.manufacturer})")
+    u2d2_ports = [p for p in ports if p.vid == U2D2_VID and p.pid == U2D2_PID]
+    if u2d2_ports:
+        # Prefer adapters that identify as ROBOTIS/FTDI over anything else sharing the VID:PID
+        u2d2_ports.sort(key=lambda p: not any(name in (p.manufacturer or '').upper() for name in ('ROBOTIS', 'FTDI')))
+        if len(u2d2_ports) > 1:
+            logging.warning(f"Multiple U2D2 adapters found: {[p.device for p in u2d2_ports]}. Using the first one: {u2d2_ports[0].device}")
+        else:
+            logging.info(f"Auto-detected U2D2 on serial port: {u2d2_ports[0].device}")
+        return u2d2_ports[0].device
+
+    logging.warning(f"No U2D2 (VID:PID {U2D2_VID:04x}:{U2D2_PID:04x}) found, falling back to device path patterns.")
     # Linux: /dev/ttyUSB*, /dev/ttyACM*
     # macOS: /dev/tty.usbserial*, /dev/tty.usbmodem*
     candidates = glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*')
@@ -129,51 +235,156 @@ if DEVICENAME == 'auto' or not DEVICENAME:
 COMM_SUCCESS                = 0
 COMM_TX_FAIL                = -1001
 
-# --- Global lock for synchronizing Dynamixel communication ---
-dxl_lock = threading.Lock()
+# --- Single-writer I/O queue: only the dxl-io thread talks to the port ---
+_io_queue = queue.Queue() # items are (callable, Future)
+
+def _io_worker():
+    """Run submitted Dynamixel calls one at a time, in FIFO order, on the dxl-io thread."""
+    while True:
+        fn, future = _io_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+def _submit(fn):
+    """Queue `fn` for the dxl-io thread and return a Future for its result."""
+    future = Future()
+    _io_queue.put((fn, future))
+    return future
+
+_io_thread = threading.Thread(target=_io_worker, name="dxl-io", daemon=True)
+_io_thread.start()
+
+# --- Background telemetry: latest present velocities, refreshed by the monitor thread ---
+stop_event = threading.Event()
+_latest_velocities = {}
+_latest_velocities_lock = threading.Lock()
+_monitor_thread = None
+
+# --- Last torque state written to each servo (servo_id -> bool); absent means unknown ---
+_torque_state = {}
 
 # --- Initialize PortHandler and PacketHandler ---
 portHandler = PortHandler(DEVICENAME)
 packetHandler = PacketHandler(PROTOCOL_VERSION)
 
+# --- Sync Read of Present Velocity for all servos in one packet (Protocol 2.0) ---
+groupSyncReadVelocity = GroupSyncRead(portHandler, packetHandler, ADDR_PRESENT_VELOCITY, 4)
+for _sid in SERVO_IDS:
+    if not groupSyncReadVelocity.addParam(_sid):
+        print(f"Warning: Could not add Servo {_sid} to the present velocity Sync Read.")
+
+# --- Sync Writes to several servos in one packet (no status packets) ---
+groupSyncWriteVelocity = GroupSyncWrite(portHandler, packetHandler, ADDR_GOAL_VELOCITY, 4)
+groupSyncWriteTorque = GroupSyncWrite(portHandler, packetHandler, ADDR_TORQUE_ENABLE, 1)
+groupSyncWriteMode = GroupSyncWrite(portHandler, packetHandler, ADDR_OPERATING_MODE, 1)
+groupSyncWriteReturnDelay = GroupSyncWrite(portHandler, packetHandler, ADDR_RETURN_DELAY_TIME, 1)
+
+# --- Sync Read replies are awaited with one select() on the port's fd (POSIX only) ---
+_reply_selector = None
+
+def _register_reply_selector():
+    """Watch the port's fd so reads block in the kernel instead of the SDK spinning on readPort.
+    Call after setBaudRate, which closes and reopens the Serial."""
+    global _reply_selector
+    if os.name == 'nt': # select() only handles sockets on Windows
+        return
+    _close_reply_selector() # A reopened port has a new fd
+    _reply_selector = selectors.DefaultSelector()
+    _reply_selector.register(portHandler.ser.fileno(), selectors.EVENT_READ)
+
+def _close_reply_selector():
+    global _reply_selector
+    if _reply_selector is not None:
+        _reply_selector.close()
+        _reply_selector = None
+
 # --- Helper Functions ---
-def check_comm_result(servo_id, dxl_comm_result, dxl_error, operation_name="Operation"):
-    """Checks Dynamixel communication result and prints error if any."""
+def set_port_low_latency(device_name):
+    """Put the opened serial port into low-latency mode (Linux only). Failures are logged, not fatal."""
+    if not sys.platform.startswith('linux'):
+        return
+    # FTDI latency timer (U2D2 is an FTDI device)
+    tty_name = os.path.basename(os.path.realpath(device_name))
+    latency_path = f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer"
+    try:
+        with open(latency_path, 'w') as f:
+            f.write(str(USB_LATENCY_TIMER_MS))
+        logging.info(f"Set USB latency timer for {device_name} to {USB_LATENCY_TIMER_MS}ms")
+    except OSError as e:
+        logging.warning(f"Could not set USB latency timer ({latency_path}): {e}")
+    # ASYNC_LOW_LATENCY flag via TIOCSSERIAL (pyserial wraps the ioctl)
+    try:
+        portHandler.ser.set_low_latency_mode(True)
+    except (AttributeError, OSError, ValueError) as e:
+        logging.warning(f"Could not enable ASYNC_LOW_LATENCY on {device_name}: {e}")
+
+_comm_result_strings = {} # dxl_comm_result -> getTxRxResult text
+_packet_error_strings = {} # dxl_error -> getRxPacketError text
+
+def _report_error(servo_id, dxl_comm_result, dxl_error, operation_name, out=None):
+    """Print a failed communication result to `out` (stdout when None), so a socket command's reply
+    carries it. Message text is looked up once per code and cached."""
     if dxl_comm_result != COMM_SUCCESS:
-        print(f"Servo {servo_id}: {operation_name} failed. {packetHandler.getTxRxResult(dxl_comm_result)}")
-        return False
-    elif dxl_error != 0:
-        print(f"Servo {servo_id}: {operation_name} error. {packetHandler.getRxPacketError(dxl_error)}")
-        return False
-    return True
+        text = _comm_result_strings.get(dxl_comm_result)
+        if text is None:
+            text = _comm_result_strings[dxl_comm_result] = packetHandler.getTxRxResult(dxl_comm_result)
+        print(f"Servo {servo_id}: {operation_name} failed. {text}", file=out)
+    else:
+        text = _packet_error_strings.get(dxl_error)
+        if text is None:
+            text = _packet_error_strings[dxl_error] = packetHandler.getRxPacketError(dxl_error)
+        print(f"Servo {servo_id}: {operation_name} error. {text}", file=out)
+
+def check_comm_result(servo_id, dxl_comm_result, dxl_error, operation_name="Operation", out=None):
+    """Checks Dynamixel communication result and prints error if any."""
+    if dxl_comm_result | dxl_error == 0: # COMM_SUCCESS is 0, so one test covers both
+        return True
+    _report_error(servo_id, dxl_comm_result, dxl_error, operation_name, out=out)
+    return False
 
-def set_torque_status(servo_id, enable):
+def set_torque_status(servo_id, enable, out=None):
     """Enable or disable torque for a specific servo."""
     value = TORQUE_ENABLE if enable else TORQUE_DISABLE
     action_str = "Enabling" if enable else "Disabling"
-    with dxl_lock:
-        dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, value)
-    if check_comm_result(servo_id, dxl_comm_result, dxl_error, f"{action_str} Torque"):
+    dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, value)).result()
+    if check_comm_result(servo_id, dxl_comm_result, dxl_error, f"{action_str} Torque", out=out):
+        _torque_state[servo_id] = enable
         status = "enabled" if enable else "disabled"
         # print(f"Servo {servo_id}: Torque {status}.") # Can be too verbose for some commands
         return True
     else:
-        print(f"Servo {servo_id}: Failed to set torque to {action_str.lower()[:-3]}.")
+        print(f"Servo {servo_id}: Failed to set torque to {action_str.lower()[:-3]}.", file=out)
         return False
 
+def get_operating_mode_dxl(servo_id):
+    """Read the current operating mode of a specific servo. Returns None on failure."""
+    current_mode, dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.read1ByteTxRx(portHandler, servo_id, ADDR_OPERATING_MODE)).result()
+    if check_comm_result(servo_id, dxl_comm_result, dxl_error, "Read Operating Mode"):
+        return current_mode
+    return None
+
 def set_operating_mode_dxl(servo_id, mode):
-    """Set the operating mode for a specific servo."""
+    """Set the operating mode for a specific servo. No-op if the servo is already in that mode."""
     mode_name_map = {MODE_VELOCITY_CONTROL: "Velocity Control"}
     mode_name = mode_name_map.get(mode, f"Unknown Mode ({mode})")
 
+    if get_operating_mode_dxl(servo_id) == mode:
+        print(f"Servo {servo_id}: Already in {mode_name} mode.")
+        return True
+
     # print(f"Servo {servo_id}: Attempting to set operating mode to {mode_name}...")
     # Torque must be disabled before changing operating mode for many servos
     print(f"Servo {servo_id}: Ensuring torque is OFF before mode change...")
-    set_torque_status(servo_id, False) # Attempt to disable torque first
-    time.sleep(0.05) # Small delay recommended by some manuals
+    set_torque_status(servo_id, False) # Attempt to disable torque first; its status packet means it's applied
 
-    with dxl_lock:
-        dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_OPERATING_MODE, mode)
+    dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_OPERATING_MODE, mode)).result()
     
     if check_comm_result(servo_id, dxl_comm_result, dxl_error, f"Set Operating Mode to {mode_name}"):
         print(f"Servo {servo_id}: Operating mode set to {mode_name}.")
@@ -182,92 +393,477 @@ def set_operating_mode_dxl(servo_id, mode):
         print(f"Servo {servo_id}: Failed to set operating mode.")
         return False
 
-def set_goal_velocity_dxl(servo_id, dxl_velocity_value):
+def clamp_velocity(v):
+    """Clamp a velocity to +/-MAX_VELOCITY_UNIT and truncate it to an int."""
+    m = MAX_VELOCITY_UNIT
+    return m if v > m else (-m if v < -m else int(v))
+
+def set_goal_velocity_dxl(servo_id, dxl_velocity_value, out=None):
     """Set the goal velocity for a specific servo (expects Dynamixel units)."""
-    clamped_velocity = max(-MAX_VELOCITY_UNIT, min(MAX_VELOCITY_UNIT, int(dxl_velocity_value)))
+    clamped_velocity = clamp_velocity(dxl_velocity_value)
     
-    with dxl_lock:
-        dxl_comm_result, dxl_error = packetHandler.write4ByteTxRx(portHandler, servo_id, ADDR_GOAL_VELOCITY, clamped_velocity)
+    dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.write4ByteTxRx(portHandler, servo_id, ADDR_GOAL_VELOCITY, clamped_velocity)).result()
     
-    if not check_comm_result(servo_id, dxl_comm_result, dxl_error, f"Set Goal Velocity to {clamped_velocity}"):
+    if not check_comm_result(servo_id, dxl_comm_result, dxl_error, f"Set Goal Velocity to {clamped_velocity}", out=out):
         # print(f"Servo {servo_id}: Failed to set goal velocity.") # Can be verbose
         return False
     return True
 
-def get_present_velocity_dxl(servo_id):
+_UINT32 = struct.Struct('<I')
+_INT32 = struct.Struct('<i')
+_SIGNED_PACKERS = {1: struct.Struct('<B').pack, 2: struct.Struct('<h').pack, 4: _INT32.pack} # by data length; 1-byte registers are unsigned (0-255)
+
+def to_signed32(value):
+    """Convert a raw 4-byte register value to a signed 32-bit integer (2's complement)."""
+    return _INT32.unpack(_UINT32.pack(value & 0xFFFFFFFF))[0]
+
+def sync_write_dxl(group_sync_write, values, data_length, operation_name, out=None):
+    """Write one value per servo with a single Sync Write packet (servos send no status packets).
+    `values` maps servo_id -> integer value; negative values are packed as 2's complement."""
+    if not values:
+        return True
+    def _write():
+        for sid, value in values.items():
+            group_sync_write.addParam(sid, _SIGNED_PACKERS[data_length](int(value)))
+        result = group_sync_write.txPacket()
+        group_sync_write.clearParam()
+        return result
+    dxl_comm_result = _submit(_write).result()
+    if dxl_comm_result != COMM_SUCCESS:
+        print(f"Sync Write {operation_name} failed. {packetHandler.getTxRxResult(dxl_comm_result)}", file=out)
+        return False
+    return True
+
+def set_torque_status_all(servo_ids, enable, out=None):
+    """Enable or disable torque on several servos with one Sync Write."""
+    value = TORQUE_ENABLE if enable else TORQUE_DISABLE
+    if not sync_write_dxl(groupSyncWriteTorque, {sid: value for sid in servo_ids}, 1,
+                          "Enable Torque" if enable else "Disable Torque", out=out):
+        for sid in servo_ids:
+            _torque_state.pop(sid, None) # Unknown after a failed write
+        return False
+    for sid in servo_ids:
+        _torque_state[sid] = enable
+    return True
+
+def set_operating_mode_all_dxl(servo_ids, mode):
+    """Set the operating mode on several servos with one Sync Write. Torque must already be off."""
+    return sync_write_dxl(groupSyncWriteMode, {sid: mode for sid in servo_ids}, 1, "Operating Mode")
+
+def verify_operating_mode_all_dxl(servo_ids, mode):
+    """Read the operating mode back after a Sync Write (which gets no status packet) and write it
+    once more to any servo that hasn't taken it. Returns True when every servo reports `mode`."""
+    missed = [sid for sid in servo_ids if get_operating_mode_dxl(sid) != mode]
+    if missed:
+        print(f"Servos {missed}: Operating mode not applied, writing it again.")
+        set_operating_mode_all_dxl(missed, mode)
+        missed = [sid for sid in missed if get_operating_mode_dxl(sid) != mode]
+    return not missed
+
+def get_return_delay_time_dxl(servo_id):
+    """Read the Return Delay Time of a specific servo. Returns None on failure."""
+    delay_value, dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.read1ByteTxRx(portHandler, servo_id, ADDR_RETURN_DELAY_TIME)).result()
+    if check_comm_result(servo_id, dxl_comm_result, dxl_error, "Read Return Delay Time"):
+        return delay_value
+    return None
+
+def set_return_delay_time_all_dxl(servo_ids, delay_value):
+    """Set the Return Delay Time (units of 2us) on several servos with one Sync Write. EEPROM area: torque must be off."""
+    return sync_write_dxl(groupSyncWriteReturnDelay, {sid: delay_value for sid in servo_ids}, 1, "Return Delay Time")
+
+def set_goal_velocities_dxl(velocities, out=None):
+    """Set goal velocities for several servos with a single Sync Write.
+    `velocities` maps servo_id -> Dynamixel units; values are clamped like set_goal_velocity_dxl."""
+    clamped = {sid: clamp_velocity(vel) for sid, vel in velocities.items()}
+    return sync_write_dxl(groupSyncWriteVelocity, clamped, 4, "Goal Velocity", out=out)
+
+def get_present_velocity_dxl(servo_id, out=None):
     """Read the present velocity of a specific servo (returns Dynamixel units)."""
-    with dxl_lock:
-        present_velocity_dxl, dxl_comm_result, dxl_error = packetHandler.read4ByteTxRx(
-            portHandler, servo_id, ADDR_PRESENT_VELOCITY)
-    if check_comm_result(servo_id, dxl_comm_result, dxl_error, "Read Present Velocity"):
-        # Convert 2's complement if value is large (negative) for 4-byte signed value
-        if present_velocity_dxl > (2**31 -1) : # Max positive for 32-bit signed
-             present_velocity_dxl -= 2**32
-        return present_velocity_dxl
+    present_velocity_dxl, dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.read4ByteTxRx(portHandler, servo_id, ADDR_PRESENT_VELOCITY)).result()
+    if check_comm_result(servo_id, dxl_comm_result, dxl_error, "Read Present Velocity", out=out):
+        return to_signed32(present_velocity_dxl)
     return None
 
+def get_all_present_velocities_dxl(report_errors=True, out=None):
+    """Read the present velocity of all configured servos with a single Sync Read.
+    Returns a dict of servo_id -> Dynamixel units, with None for servos that did not respond."""
+    velocities = {}
+    def _read():
+        # Same as txRxPacket, but sleeps in select() until the first reply byte arrives
+        result = groupSyncReadVelocity.txPacket()
+        if result == COMM_SUCCESS:
+            if _reply_selector is not None:
+                _reply_selector.select(STATUS_REPLY_WAIT_S)
+            result = groupSyncReadVelocity.rxPacket()
+        for sid in SERVO_IDS:
+            if groupSyncReadVelocity.isAvailable(sid, ADDR_PRESENT_VELOCITY, 4):
+                velocities[sid] = to_signed32(groupSyncReadVelocity.getData(sid, ADDR_PRESENT_VELOCITY, 4))
+            else:
+                velocities[sid] = None
+        return result
+    dxl_comm_result = _submit(_read).result()
+    if report_errors and dxl_comm_result != COMM_SUCCESS:
+        print(f"Sync Read Present Velocity failed. {packetHandler.getTxRxResult(dxl_comm_result)}", file=out)
+    return velocities
+
+def prune_missing_servos():
+    """Broadcast-ping the bus once and drop configured servos that did not answer from SERVO_IDS,
+    so init does not wait out a timeout on every write to a missing servo."""
+    dxl_data_list, dxl_comm_result = _submit(lambda: packetHandler.broadcastPing(portHandler)).result()
+    if dxl_comm_result != COMM_SUCCESS:
+        print(f"Broadcast ping failed, keeping configured servos {SERVO_IDS}. {packetHandler.getTxRxResult(dxl_comm_result)}")
+        return
+    print(f"Broadcast ping found servos: {sorted(dxl_data_list)}")
+    missing = [sid for sid in SERVO_IDS if sid not in dxl_data_list]
+    if missing:
+        print(f"Warning: Configured servos {missing} did not respond and will be skipped.")
+        for sid in missing:
+            groupSyncReadVelocity.removeParam(sid)
+        SERVO_IDS[:] = [sid for sid in SERVO_IDS if sid in dxl_data_list]
+    unconfigured = sorted(set(dxl_data_list) - set(SERVO_IDS) - set(missing))
+    if unconfigured:
+        print(f"Note: Servos {unconfigured} responded but are not in SERVO_IDS.")
+
+# --- Telemetry Monitor ---
+def _monitor_loop():
+    """Refresh the cached present velocities with one Sync Read per tick until stop_event is set."""
+    interval = 1.0 / TELEMETRY_HZ
+    while not stop_event.is_set():
+        try:
+            velocities = get_all_present_velocities_dxl(report_errors=False)
+            with _latest_velocities_lock:
+                _latest_velocities.update(velocities)
+        except Exception as e:
+            print(f"[Monitor] Exception while reading telemetry: {e}")
+        stop_event.wait(interval)
+
+def start_monitor():
+    """Start the background telemetry thread (no-op if no servos are configured)."""
+    global _monitor_thread
+    if not SERVO_IDS or (_monitor_thread is not None and _monitor_thread.is_alive()):
+        return
+    stop_event.clear()
+    _monitor_thread = threading.Thread(target=_monitor_loop, name="dxl-monitor", daemon=True)
+    _monitor_thread.start()
+
+def stop_monitor():
+    """Stop the background telemetry thread and wait for its current read to finish."""
+    stop_event.set()
+    if _monitor_thread is not None:
+        _monitor_thread.join(timeout=1.0)
+
+def get_cached_velocities():
+    """Return a copy of the latest telemetry (empty until the monitor has completed a read)."""
+    with _latest_velocities_lock:
+        return dict(_latest_velocities)
+
 # --- RPM Conversion Functions ---
+# Reciprocal computed once so conversions multiply instead of divide
+if RPM_PER_UNIT_VELOCITY == 0:
+    print("Error: RPM_PER_UNIT_VELOCITY is zero, cannot convert RPM. All RPM targets will map to 0.")
+    _INV_RPM_PER_UNIT_VELOCITY = 0.0
+else:
+    _INV_RPM_PER_UNIT_VELOCITY = 1.0 / RPM_PER_UNIT_VELOCITY
+
 def rpm_to_dxl_velocity(rpm_value):
-    """Converts RPM to Dynamixel velocity units."""
-    if RPM_PER_UNIT_VELOCITY == 0:
-        print("Error: RPM_PER_UNIT_VELOCITY is zero, cannot convert RPM.")
-        return 0
-    return int(round(float(rpm_value) / RPM_PER_UNIT_VELOCITY))
+    """Converts RPM to Dynamixel velocity units (rounded half away from zero)."""
+    return int(rpm_value * _INV_RPM_PER_UNIT_VELOCITY + (0.5 if rpm_value >= 0 else -0.5))
 
 def dxl_velocity_to_rpm(dxl_velocity_value):
-    """Converts Dynamixel velocity units to RPM."""
-    return round(float(dxl_velocity_value) * RPM_PER_UNIT_VELOCITY, 2)
+    """Converts Dynamixel velocity units to RPM. Round only when displaying."""
+    return dxl_velocity_value * RPM_PER_UNIT_VELOCITY
 
 # --- Main CLI Application ---
-def main_cli():
+def _command_lines(wake_r):
+    """Yield command lines typed on stdin. Stops at EOF or when a byte arrives on the wake_r self-pipe."""
+    if os.name == 'nt': # select() only handles sockets on Windows, so fall back to input()
+        while True:
+            try:
+                yield input("> ")
+            except EOFError:
+                print("\nEOF received, exiting.")
+                return
+    stdin_fd = sys.stdin.fileno()
+    sel = selectors.DefaultSelector()
+    sel.register(stdin_fd, selectors.EVENT_READ)
+    sel.register(wake_r, selectors.EVENT_READ)
+    pending = b""
+    try:
+        while True:
+            print("> ", end="", flush=True)
+            while b"\n" not in pending:
+                events = sel.select()
+                if any(key.fileobj == wake_r for key, _ in events):
+                    os.read(wake_r, 512)
+                    print("\nShutdown requested, exiting.")
+                    return
+                chunk = os.read(stdin_fd, 4096)
+                if not chunk: # Handle piped input or Ctrl+D
+                    if pending:
+                        yield pending.decode(errors="replace")
+                    print("\nEOF received, exiting.")
+                    return
+                pending += chunk
+            line, pending = pending.split(b"\n", 1)
+            yield line.decode(errors="replace")
+    finally:
+        sel.close()
+
+def _open_and_init(log_prefix=""):
+    """Open the port, set the baud rate and initialize all servos to DEFAULT_START_RPM in velocity mode.
+    Returns False if the port could not be opened or configured."""
     # --- Open Port ---
-    if portHandler.openPort():
-        print(f"Succeeded to open the port: {DEVICENAME}")
+    if _submit(portHandler.openPort).result():
+        print(f"{log_prefix}Succeeded to open the port: {DEVICENAME}")
     else:
-        print(f"Failed to open the port: {DEVICENAME}")
+        print(f"{log_prefix}Failed to open the port: {DEVICENAME}")
         print("Check DEVICENAME in config.yaml and ensure U2D2 is connected.")
         print("On Linux, you might need permissions (e.g., add user to 'dialout' group).")
-        return
+        return False
 
     # --- Set Port Baudrate ---
-    if portHandler.setBaudRate(BAUDRATE):
-        print(f"Succeeded to change the baudrate to {BAUDRATE}")
+    if _submit(lambda: portHandler.setBaudRate(BAUDRATE)).result():
+        print(f"{log_prefix}Succeeded to change the baudrate to {BAUDRATE}")
+        # setBaudRate reopens the Serial, so low latency and the reply selector go on the new one
+        _submit(lambda: set_port_low_latency(DEVICENAME)).result()
+        _submit(_register_reply_selector).result()
     else:
-        print(f"Failed to change the baudrate to {BAUDRATE}")
-        portHandler.closePort()
-        return
+        print(f"{log_prefix}Failed to change the baudrate to {BAUDRATE}")
+        _submit(portHandler.closePort).result()
+        return False
+
+    prune_missing_servos()
 
     # --- Initial Servo Setup ---
     if not SERVO_IDS:
-        print("Warning: No SERVO_IDS defined in config.yaml. Nothing to control.")
+        print(f"{log_prefix}Warning: No SERVO_IDS defined in config.yaml. Nothing to control.")
+        return True
+
+    print(f"\n{log_prefix}Initializing {len(SERVO_IDS)} servos to ~{DEFAULT_START_RPM} RPM...")
+    initial_dxl_vel_unit = rpm_to_dxl_velocity(DEFAULT_START_RPM)
+
+    # Torque must be off before the operating mode and the EEPROM Return Delay Time can change.
+    # Each step goes to all servos in one Sync Write. No settle delays: a servo handles packets in
+    # order, so each step is applied before it answers the next read or acts on the next write.
+    if not set_torque_status_all(SERVO_IDS, False):
+        print("Warning: Failed to disable torque before mode change, proceeding anyway.")
+    # Skip the mode write when every servo is already in velocity mode
+    if any(get_operating_mode_dxl(sid) != MODE_VELOCITY_CONTROL for sid in SERVO_IDS):
+        if not (set_operating_mode_all_dxl(SERVO_IDS, MODE_VELOCITY_CONTROL)
+                and verify_operating_mode_all_dxl(SERVO_IDS, MODE_VELOCITY_CONTROL)):
+            print("CRITICAL - Failed to set velocity control mode.")
+    # Return Delay Time is EEPROM, so only the servos not already at 0 get the write (unreadable ones included)
+    delayed = [sid for sid in SERVO_IDS if get_return_delay_time_dxl(sid) != 0]
+    if delayed and not set_return_delay_time_all_dxl(delayed, 0):
+        print("Warning: Failed to set return delay time. Continuing.")
+    if not set_torque_status_all(SERVO_IDS, True):
+        print("CRITICAL - Failed to enable torque.")
+
+    initial_velocities = {}
+    for sid in SERVO_IDS:
+        current_target_dxl_vel = initial_dxl_vel_unit
+        if sid == 2: # Servo 2 goes the opposite way
+            current_target_dxl_vel = -initial_dxl_vel_unit
+        rpm_val_for_log = dxl_velocity_to_rpm(current_target_dxl_vel)
+        print(f"Servo {sid}: Setting initial speed to {rpm_val_for_log:.2f} RPM (DXL Unit: {current_target_dxl_vel}).")
+        initial_velocities[sid] = current_target_dxl_vel
+
+    # Start all servos together with one Sync Write
+    if set_goal_velocities_dxl(initial_velocities):
+        print(f"Initial velocity set successfully for servos {list(initial_velocities)}.")
     else:
-        print(f"\nInitializing {len(SERVO_IDS)} servos to ~{DEFAULT_START_RPM} RPM...")
-        initial_dxl_vel_unit = rpm_to_dxl_velocity(DEFAULT_START_RPM)
+        print("Failed to set initial velocities.")
+    return True
 
-        for sid in SERVO_IDS:
-            print(f"\n--- Initializing Servo ID: {sid} ---")
-            if not set_operating_mode_dxl(sid, MODE_VELOCITY_CONTROL):
-                print(f"Servo {sid}: CRITICAL - Failed to set velocity control mode. Skipping for this servo.")
-                continue
-            
-            if not set_torque_status(sid, True):
-                print(f"Servo {sid}: CRITICAL - Failed to enable torque. Skipping for this servo.")
-                continue
-            
-            time.sleep(0.05) # Small delay after enabling torque
-
-            current_target_dxl_vel = initial_dxl_vel_unit
-            if sid == 2: # Servo 2 goes the opposite way
-                current_target_dxl_vel = -initial_dxl_vel_unit
-            
-            rpm_val_for_log = dxl_velocity_to_rpm(current_target_dxl_vel)
-            print(f"Servo {sid}: Setting initial speed to {rpm_val_for_log} RPM (DXL Unit: {current_target_dxl_vel}).")
-            if not set_goal_velocity_dxl(sid, current_target_dxl_vel):
-                print(f"Servo {sid}: Failed to set initial velocity.")
-            else:
-                print(f"Servo {sid}: Initial velocity set successfully.")
+def _cleanup(log_prefix=""):
+    """Stop the monitor, stop all servos, disable their torque and close the port."""
+    print(f"\n{log_prefix}Cleaning up: stopping servos and closing port...")
+    stop_monitor()
+    if portHandler.is_open and SERVO_IDS: # Only try if port was open and servos were configured
+        print(f"  Stopping servos {SERVO_IDS} and disabling torque...")
+        try:
+            set_goal_velocities_dxl({sid: 0 for sid in SERVO_IDS})
+            set_torque_status_all(SERVO_IDS, False)
+        except Exception as e:
+            print(f"  Exception during cleanup: {e}")
+    if portHandler.is_open:
+        _submit(_close_reply_selector).result()
+        _submit(portHandler.closePort).result()
+        print("Port closed.")
+    print(f"{log_prefix}Application terminated.")
+
+# --- CLI command handlers: each takes the argument list after the command word and the stream to reply on ---
+def _cmd_set(args, out):
+    if len(args) != 2:
+        print("Usage: set <servo_id> <rpm_value>", file=out)
+        return
+    try:
+        servo_id = int(args[0])
+        rpm = float(args[1])
+    except ValueError:
+        print("Invalid input. Usage: set <servo_id> <rpm_value>", file=out)
+        return
+    if servo_id not in SERVO_IDS:
+        print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}", file=out)
+        return
+    dxl_vel = rpm_to_dxl_velocity(rpm)
+    print(f"Setting Servo {servo_id} to {rpm} RPM (DXL Unit: {dxl_vel})", file=out)
+    if not set_torque_status(servo_id, True, out=out): # Ensure torque is on
+        print(f"Servo {servo_id}: Warning - Could not ensure torque is on. Velocity command may not work.", file=out)
+    set_goal_velocity_dxl(servo_id, dxl_vel, out=out)
+
+def _cmd_get(args, out):
+    if len(args) != 1:
+        print("Usage: get <servo_id>", file=out)
+        return
+    try:
+        servo_id = int(args[0])
+    except ValueError:
+        print("Invalid input. Usage: get <servo_id>", file=out)
+        return
+    if servo_id not in SERVO_IDS:
+        print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}", file=out)
+        return
+    cached_velocities = get_cached_velocities()
+    if servo_id in cached_velocities:
+        dxl_vel = cached_velocities[servo_id]
+    else:
+        dxl_vel = get_present_velocity_dxl(servo_id, out=out)
+    if dxl_vel is not None:
+        rpm = dxl_velocity_to_rpm(dxl_vel)
+        print(f"Servo {servo_id}: Present Velocity = {rpm:.2f} RPM (DXL Unit: {dxl_vel})", file=out)
+    else:
+        print(f"Servo {servo_id}: Failed to read present velocity.", file=out)
+
+def _cmd_off(args, out):
+    if len(args) != 1:
+        print("Usage: off <servo_id>", file=out)
+        return
+    try:
+        servo_id = int(args[0])
+    except ValueError:
+        print("Invalid input. Usage: off <servo_id>", file=out)
+        return
+    if servo_id not in SERVO_IDS:
+        print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}", file=out)
+        return
+    print(f"Stopping Servo {servo_id} (setting RPM to 0).", file=out)
+    set_goal_velocity_dxl(servo_id, 0, out=out)
+
+_TORQUE_STATES = {"on": True, "off": False}
+
+def _cmd_torque(args, out):
+    if len(args) != 2:
+        print("Usage: torque <servo_id> <on|off>", file=out)
+        return
+    try:
+        servo_id = int(args[0])
+    except ValueError:
+        print("Invalid servo_id. Usage: torque <servo_id> <on|off>", file=out)
+        return
+    state = args[1]
+    if servo_id not in SERVO_IDS:
+        print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}", file=out)
+        return
+    enable = _TORQUE_STATES.get(state)
+    if enable is None:
+        print("Invalid state. Use 'on' or 'off'.", file=out)
+    elif set_torque_status(servo_id, enable, out=out):
+        print(f"Servo {servo_id}: Torque {'enabled' if enable else 'disabled'}.", file=out)
+
+def _cmd_spin(args, out):
+    if len(args) != 1:
+        print("Usage: spin <rpm_value>", file=out)
+        return
+    try:
+        rpm_target = float(args[0])
+    except ValueError:
+        print("Invalid RPM. Usage: spin <rpm_value>", file=out)
+        return
+    target_dxl_vel = rpm_to_dxl_velocity(rpm_target)
+    print(f"Setting all servos to target {rpm_target} RPM (Servo 2 opposite if applicable).", file=out)
+    spin_velocities = {}
+    for sid_loop in SERVO_IDS:
+        vel_to_set = target_dxl_vel
+        if sid_loop == 2: # Servo 2 opposite
+            vel_to_set = -target_dxl_vel
+
+        rpm_val_for_log = dxl_velocity_to_rpm(vel_to_set)
+        print(f"  Servo {sid_loop}: target {rpm_val_for_log:.2f} RPM (DXL: {vel_to_set})", file=out)
+        if not _torque_state.get(sid_loop) and not set_torque_status(sid_loop, True, out=out):
+            print(f"  Servo {sid_loop}: Warning - Could not ensure torque is on.", file=out)
+        spin_velocities[sid_loop] = vel_to_set
+    set_goal_velocities_dxl(spin_velocities, out=out)
+
+def _cmd_stopall(args, out):
+    print("Stopping all servos and disabling torque...", file=out)
+    set_goal_velocities_dxl({sid_loop: 0 for sid_loop in SERVO_IDS}, out=out)
+    for sid_loop in SERVO_IDS:
+        print(f"  Disabling torque on Servo {sid_loop}...", file=out)
+        set_torque_status(sid_loop, False, out=out)
+    print("All servos should be stopped and torque disabled.", file=out)
+
+def _cmd_statusall(args, out):
+    print("Current status of all configured servos:", file=out)
+    if not SERVO_IDS: print("  No servos configured.", file=out)
+    present_velocities = get_cached_velocities()
+    if SERVO_IDS and not present_velocities:
+        present_velocities = get_all_present_velocities_dxl(out=out)
+    for sid_loop in SERVO_IDS:
+        dxl_vel = present_velocities[sid_loop]
+        if dxl_vel is not None:
+            rpm = dxl_velocity_to_rpm(dxl_vel)
+            print(f"  Servo {sid_loop}: {rpm:.2f} RPM (DXL Unit: {dxl_vel})", file=out)
+        else:
+            print(f"  Servo {sid_loop}: Failed to read status.", file=out)
+
+def _cmd_ping(args, out):
+    if len(args) != 1:
+        print("Usage: ping <servo_id>", file=out)
+        return
+    try:
+        servo_id_to_ping = int(args[0])
+    except ValueError:
+        print("Invalid servo_id. Usage: ping <servo_id>", file=out)
+        return
+    # Ping goes through the I/O queue like every other SDK call
+    dxl_model_number, dxl_comm_result, dxl_error = _submit(
+        lambda: packetHandler.ping(portHandler, servo_id_to_ping)).result()
+    if dxl_comm_result != COMM_SUCCESS:
+        print(f"Ping Servo {servo_id_to_ping}: Failed. Result: {packetHandler.getTxRxResult(dxl_comm_result)}", file=out)
+    elif dxl_error != 0:
+        print(f"Ping Servo {servo_id_to_ping}: Error. Result: {packetHandler.getRxPacketError(dxl_error)}", file=out)
+    else:
+        print(f"Ping Servo {servo_id_to_ping}: Success. Model Number: {dxl_model_number}", file=out)
+
+_HANDLERS = {
+    "set": _cmd_set,
+    "get": _cmd_get,
+    "off": _cmd_off,
+    "torque": _cmd_torque,
+    "spin": _cmd_spin,
+    "stopall": _cmd_stopall,
+    "statusall": _cmd_statusall,
+    "ping": _cmd_ping,
+}
+
+def _dispatch(command_input, out):
+    """Run one split, lower-cased command line through _HANDLERS, writing its replies to `out`."""
+    handler = _HANDLERS.get(command_input[0])
+    if handler:
+        handler(command_input[1:], out)
+    else:
+        print(f"Unknown command: {command_input[0]}", file=out)
+
+def main_cli():
+    if not _open_and_init():
+        return
 
     print("\n--- Servo Initialization Complete ---")
+    start_monitor()
     print("\nDynamixel CLI Controller")
     print("Commands:")
     print("  set <id> <rpm>            - Set target RPM (e.g., set 1 50)")
@@ -280,13 +876,22 @@ def main_cli():
     print("  ping <id>                 - Ping a servo to check communication")
     print("  exit                      - Close port and exit")
 
+    # SIGINT/SIGTERM write a byte to a self-pipe so the input loop wakes up and exits cleanly
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    def _request_shutdown(signum, frame):
+        try:
+            os.write(wake_w, b"\0")
+        except OSError:
+            pass
+    previous_handlers = {}
+    if os.name != 'nt':
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            previous_handlers[signum] = signal.signal(signum, _request_shutdown)
+
     try:
-        while True:
-            try:
-                command_input = input("> ").strip().lower().split()
-            except EOFError: # Handle piped input or Ctrl+D
-                print("\nEOF received, exiting.")
-                break
+        for line in _command_lines(wake_r):
+            command_input = line.strip().lower().split()
             if not command_input:
                 continue
 
@@ -294,222 +899,99 @@ def main_cli():
 
             if cmd == "exit":
                 break
-            
-            elif cmd == "set":
-                if len(command_input) == 3:
-                    try:
-                        servo_id = int(command_input[1])
-                        rpm = float(command_input[2])
-                        if servo_id not in SERVO_IDS:
-                            print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}")
-                            continue
-                        dxl_vel = rpm_to_dxl_velocity(rpm)
-                        print(f"Setting Servo {servo_id} to {rpm} RPM (DXL Unit: {dxl_vel})")
-                        if not set_torque_status(servo_id, True): # Ensure torque is on
-                             print(f"Servo {servo_id}: Warning - Could not ensure torque is on. Velocity command may not work.")
-                        set_goal_velocity_dxl(servo_id, dxl_vel)
-                    except ValueError:
-                        print("Invalid input. Usage: set <servo_id> <rpm_value>")
-                else:
-                    print("Usage: set <servo_id> <rpm_value>")
-
-            elif cmd == "get":
-                if len(command_input) == 2:
-                    try:
-                        servo_id = int(command_input[1])
-                        if servo_id not in SERVO_IDS:
-                            print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}")
-                            continue
-                        dxl_vel = get_present_velocity_dxl(servo_id)
-                        if dxl_vel is not None:
-                            rpm = dxl_velocity_to_rpm(dxl_vel)
-                            print(f"Servo {servo_id}: Present Velocity = {rpm} RPM (DXL Unit: {dxl_vel})")
-                        else:
-                            print(f"Servo {servo_id}: Failed to read present velocity.")
-                    except ValueError:
-                        print("Invalid input. Usage: get <servo_id>")
-                else:
-                    print("Usage: get <servo_id>")
-            
-            elif cmd == "off":
-                if len(command_input) == 2:
-                    try:
-                        servo_id = int(command_input[1])
-                        if servo_id not in SERVO_IDS:
-                            print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}")
-                            continue
-                        print(f"Stopping Servo {servo_id} (setting RPM to 0).")
-                        set_goal_velocity_dxl(servo_id, 0)
-                    except ValueError:
-                        print("Invalid input. Usage: off <servo_id>")
-                else:
-                    print("Usage: off <servo_id>")
-
-            elif cmd == "torque":
-                if len(command_input) == 3:
-                    try:
-                        servo_id = int(command_input[1])
-                        state = command_input[2]
-                        if servo_id not in SERVO_IDS:
-                            print(f"Error: Servo ID {servo_id} not in configured SERVO_IDS: {SERVO_IDS}")
-                            continue
-                        if state == "on":
-                            if set_torque_status(servo_id, True):
-                                print(f"Servo {servo_id}: Torque enabled.")
-                        elif state == "off":
-                            if set_torque_status(servo_id, False):
-                                print(f"Servo {servo_id}: Torque disabled.")
-                        else:
-                            print("Invalid state. Use 'on' or 'off'.")
-                    except ValueError:
-                        print("Invalid servo_id. Usage: torque <servo_id> <on|off>")
-                else:
-                    print("Usage: torque <servo_id> <on|off>")
-            
-            elif cmd == "spin":
-                if len(command_input) == 2:
-                    try:
-                        rpm_target = float(command_input[1])
-                        target_dxl_vel = rpm_to_dxl_velocity(rpm_target)
-                        print(f"Setting all servos to target {rpm_target} RPM (Servo 2 opposite if applicable).")
-                        for sid_loop in SERVO_IDS:
-                            vel_to_set = target_dxl_vel
-                            if sid_loop == 2: # Servo 2 opposite
-                                vel_to_set = -target_dxl_vel
-                            
-                            rpm_val_for_log = dxl_velocity_to_rpm(vel_to_set)
-                            print(f"  Servo {sid_loop}: target {rpm_val_for_log} RPM (DXL: {vel_to_set})")
-                            if not set_torque_status(sid_loop, True):
-                                print(f"  Servo {sid_loop}: Warning - Could not ensure torque is on.")
-                            set_goal_velocity_dxl(sid_loop, vel_to_set)
-                    except ValueError:
-                        print("Invalid RPM. Usage: spin <rpm_value>")
-                else:
-                    print("Usage: spin <rpm_value>")
-
-            elif cmd == "stopall":
-                print("Stopping all servos and disabling torque...")
-                for sid_loop in SERVO_IDS:
-                    print(f"  Stopping Servo {sid_loop}...")
-                    set_goal_velocity_dxl(sid_loop, 0)
-                    time.sleep(0.02) 
-                    set_torque_status(sid_loop, False)
-                print("All servos should be stopped and torque disabled.")
-
-            elif cmd == "statusall":
-                print("Current status of all configured servos:")
-                if not SERVO_IDS: print("  No servos configured.")
-                for sid_loop in SERVO_IDS:
-                    dxl_vel = get_present_velocity_dxl(sid_loop)
-                    if dxl_vel is not None:
-                        rpm = dxl_velocity_to_rpm(dxl_vel)
-                        print(f"  Servo {sid_loop}: {rpm} RPM (DXL Unit: {dxl_vel})")
-                    else:
-                        print(f"  Servo {sid_loop}: Failed to read status.")
-            
-            elif cmd == "ping":
-                if len(command_input) == 2:
-                    try:
-                        servo_id_to_ping = int(command_input[1])
-                        # No lock needed for ping as it's a direct SDK call not writing data
-                        dxl_model_number, dxl_comm_result, dxl_error = packetHandler.ping(portHandler, servo_id_to_ping)
-                        if dxl_comm_result != COMM_SUCCESS:
-                            print(f"Ping Servo {servo_id_to_ping}: Failed. Result: {packetHandler.getTxRxResult(dxl_comm_result)}")
-                        elif dxl_error != 0:
-                            print(f"Ping Servo {servo_id_to_ping}: Error. Result: {packetHandler.getRxPacketError(dxl_error)}")
-                        else:
-                            print(f"Ping Servo {servo_id_to_ping}: Success. Model Number: {dxl_model_number}")
-                    except ValueError:
-                        print("Invalid servo_id. Usage: ping <servo_id>")
-                else:
-                    print("Usage: ping <servo_id>")
-            else:
-                print(f"Unknown command: {cmd}")
+            _dispatch(command_input, sys.stdout)
 
     except KeyboardInterrupt:
         print("\nExiting due to KeyboardInterrupt...")
     finally:
-        print("\nCleaning up: stopping servos and closing port...")
-        if portHandler.is_open and SERVO_IDS: # Only try if port was open and servos were configured
-            for sid in SERVO_IDS:
-                print(f"  Stopping servo {sid} and disabling torque...")
-                try:
-                    set_goal_velocity_dxl(sid, 0)
-                    time.sleep(0.05) 
-                    set_torque_status(sid, False)
-                except Exception as e:
-                    print(f"  Exception during cleanup for servo {sid}: {e}")
-        
-        if portHandler.is_open:
-            portHandler.closePort()
-            print("Port closed.")
-        print("Application terminated.")
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        os.close(wake_r)
+        os.close(wake_w)
+        _cleanup()
+
+# --- Service command socket: server side ---
+def service_is_running():
+    """True if another --service instance is accepting connections on SERVICE_SOCKET."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(SERVICE_SOCKET)
+        except OSError:
+            return False
+    return True
+
+def _open_service_socket():
+    """Bind the command socket, replacing a stale one left by an earlier run. None where AF_UNIX is
+    unavailable or the socket path can't be taken over."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        os.unlink(SERVICE_SOCKET) # Stale: service_is_running() already found nobody listening
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[Service Mode] Could not remove stale command socket {SERVICE_SOCKET} ({e}), running without it")
+        return None
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(SERVICE_SOCKET)
+        server.listen()
+    except OSError as e:
+        print(f"[Service Mode] Could not open command socket {SERVICE_SOCKET} ({e}), running without it")
+        server.close()
+        return None
+    return server
+
+def _serve_commands(server):
+    """Answer one command line per connection, sending back the handler's replies."""
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            try:
+                command_input = conn.makefile('r').readline().strip().lower().split()
+                # Handlers write to this buffer, not sys.stdout, so output from other threads stays in the log
+                reply = io.StringIO()
+                if not command_input:
+                    print("Empty command.", file=reply)
+                elif command_input[0] == "exit":
+                    print("'exit' only applies to the interactive CLI; stop the service instead.", file=reply)
+                else:
+                    _dispatch(command_input, reply)
+                conn.sendall(reply.getvalue().encode())
+            except Exception as e:
+                print(f"[Service Mode] Exception while handling a socket command: {e}")
 
 def run_service_mode():
     """Run the script in headless service mode: initialize servos, keep running, and clean up on SIGTERM/SIGINT."""
+    server = None
     def cleanup_and_exit(signum=None, frame=None):
-        print("\n[Service Mode] Cleaning up: stopping servos and closing port...")
-        if portHandler.is_open and SERVO_IDS:
-            for sid in SERVO_IDS:
-                print(f"  Stopping servo {sid} and disabling torque...")
-                try:
-                    set_goal_velocity_dxl(sid, 0)
-                    time.sleep(0.05)
-                    set_torque_status(sid, False)
-                except Exception as e:
-                    print(f"  Exception during cleanup for servo {sid}: {e}")
-        if portHandler.is_open:
-            portHandler.closePort()
-            print("Port closed.")
-        print("[Service Mode] Application terminated.")
+        if server is not None:
+            server.close()
+            with contextlib.suppress(OSError):
+                os.unlink(SERVICE_SOCKET)
+        _cleanup("[Service Mode] ")
         sys.exit(0)
 
+    # A live instance owns the port and the socket; don't take either from it
+    if service_is_running():
+        print(f"[Service Mode] Another service is already listening on {SERVICE_SOCKET}. Exiting.")
+        sys.exit(1)
+
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, cleanup_and_exit)
     signal.signal(signal.SIGINT, cleanup_and_exit)
 
-    # --- Open Port ---
-    if portHandler.openPort():
-        print(f"[Service Mode] Succeeded to open the port: {DEVICENAME}")
-    else:
-        print(f"[Service Mode] Failed to open the port: {DEVICENAME}")
-        print("Check DEVICENAME in config.yaml and ensure U2D2 is connected.")
-        return
-
-    # --- Set Port Baudrate ---
-    if portHandler.setBaudRate(BAUDRATE):
-        print(f"[Service Mode] Succeeded to change the baudrate to {BAUDRATE}")
-    else:
-        print(f"[Service Mode] Failed to change the baudrate to {BAUDRATE}")
-        portHandler.closePort()
+    if not _open_and_init("[Service Mode] "):
         return
-
-    # --- Initial Servo Setup ---
-    if not SERVO_IDS:
-        print("[Service Mode] Warning: No SERVO_IDS defined in config.yaml. Nothing to control.")
-    else:
-        print(f"\n[Service Mode] Initializing {len(SERVO_IDS)} servos to ~{DEFAULT_START_RPM} RPM...")
-        initial_dxl_vel_unit = rpm_to_dxl_velocity(DEFAULT_START_RPM)
-        for sid in SERVO_IDS:
-            print(f"\n--- Initializing Servo ID: {sid} ---")
-            if not set_operating_mode_dxl(sid, MODE_VELOCITY_CONTROL):
-                print(f"Servo {sid}: CRITICAL - Failed to set velocity control mode. Skipping for this servo.")
-                continue
-            if not set_torque_status(sid, True):
-                print(f"Servo {sid}: CRITICAL - Failed to enable torque. Skipping for this servo.")
-                continue
-            time.sleep(0.05)
-            current_target_dxl_vel = initial_dxl_vel_unit
-            if sid == 2:
-                current_target_dxl_vel = -initial_dxl_vel_unit
-            rpm_val_for_log = dxl_velocity_to_rpm(current_target_dxl_vel)
-            print(f"Servo {sid}: Setting initial speed to {rpm_val_for_log} RPM (DXL Unit: {current_target_dxl_vel}).")
-            if not set_goal_velocity_dxl(sid, current_target_dxl_vel):
-                print(f"Servo {sid}: Failed to set initial velocity.")
-            else:
-                print(f"Servo {sid}: Initial velocity set successfully.")
     print("\n[Service Mode] Servo Initialization Complete. Running as a background service. Waiting for SIGTERM/SIGINT...")
+    start_monitor()
     try:
+        server = _open_service_socket()
+        if server is not None:
+            print(f"[Service Mode] Accepting commands on {SERVICE_SOCKET}")
+            _serve_commands(server)
         while True:
             time.sleep(1)
     except Exception as e:
@@ -517,10 +999,6 @@ def run_service_mode():
         cleanup_and_exit()
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Dynamixel CLI and Service")
-    parser.add_argument("--service", action="store_true", help="Run in headless service mode (for systemd)")
-    args = parser.parse_args()
-
     if DEVICENAME.startswith("/dev/ttyACM") or DEVICENAME.lower().startswith("com"):
         print(f"Reminder: DEVICENAME is '{DEVICENAME}'. On Raspberry Pi, it's often '/dev/ttyUSB0' or similar.")
         print("Please ensure this is correct in your 'config.yaml'.")
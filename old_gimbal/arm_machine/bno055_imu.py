@@ -3,26 +3,47 @@ import board
 import busio
 import adafruit_bno055
 import os
+import struct
+
+BNO055_ADDRESS = 0x28
+I2C_FREQUENCY = 400_000  # Hz; BNO055 supports fast mode
+EULER_REGISTER = b'\x1a'  # EUL_HEADING_LSB; heading, roll, pitch follow as 3 little-endian int16
+EULER_STRUCT = struct.Struct('<3h')
+EULER_LSB_PER_DEGREE = 16.0
 
 class BNO055_IMU:
+    _unpack_euler = EULER_STRUCT.unpack_from  # Bound once; unpacks straight from the reused buffer
+
     def __init__(self):
         # Check if we're on a Jetson
         if os.uname().machine.startswith('aarch64'):
             # Jetson AGX Orin specific I2C setup
             # Using bus 1 pins (board.SCL_1, board.SDA_1) which correspond to physical pins 3 and 5.
             # NOTE: i2cdetect found the device on bus 7. If this fails, Blinka might be mapping these pins incorrectly.
-            self.i2c = busio.I2C(board.SCL_1, board.SDA_1)
+            self.i2c = busio.I2C(board.SCL_1, board.SDA_1, frequency=I2C_FREQUENCY)
         else:
             # Default Raspberry Pi setup
-            self.i2c = busio.I2C(board.SCL, board.SDA)
+            self.i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
             
         try:
             # Initialize the BNO055 sensor
-            self.sensor = adafruit_bno055.BNO055_I2C(self.i2c)
+            self.sensor = adafruit_bno055.BNO055_I2C(self.i2c, address=BNO055_ADDRESS)
             print("BNO055 initialized successfully")
         except Exception as e:
             print(f"Error initializing BNO055: {e}")
             raise
+        self._i2c_device = self.sensor.i2c_device
+        self._euler_buf = bytearray(6)
+
+    def read_euler_fast(self):
+        """Read Euler angles with a single 6-byte I2C transaction.
+        Returns:
+            tuple: (heading, roll, pitch) in degrees, in the sensor's register order
+        """
+        with self._i2c_device as device:  # Locks the bus for the one write-then-read
+            device.write_then_readinto(EULER_REGISTER, self._euler_buf)
+        heading, roll, pitch = self._unpack_euler(self._euler_buf)
+        return heading / EULER_LSB_PER_DEGREE, roll / EULER_LSB_PER_DEGREE, pitch / EULER_LSB_PER_DEGREE
 
     def read_euler(self):
         """Read Euler angles from the sensor.
@@ -30,7 +51,11 @@ class BNO055_IMU:
             tuple: (yaw, pitch, roll) in degrees
         """
         try:
-            euler = self.sensor.euler
+            try:
+                euler = self.read_euler_fast()
+            except Exception:
+                # Fall back to the driver's register access
+                euler = self.sensor.euler
             if euler is not None:
                 # BNO055 returns (yaw, roll, pitch) but we want (yaw, pitch, roll)
                 yaw, roll, pitch = euler
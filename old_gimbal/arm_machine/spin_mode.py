@@ -2,8 +2,9 @@ import sys
 import os
 import time
 import signal
-import yaml
+import json
 import logging
+import struct
 
 try:
     from dynamixel_sdk import *
@@ -12,14 +13,45 @@ except ImportError:
     sys.exit(1)
 
 # --- Logging Setup ---
-logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+# SPIN_MODE_LOG_LEVEL=WARNING quiets the service for unattended runs
+logging.basicConfig(level=os.environ.get('SPIN_MODE_LOG_LEVEL', 'INFO').upper(), format='[%(levelname)s] %(message)s')
 logger = logging.getLogger("spin_mode")
 
 # --- Load Configuration ---
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), '../config.yaml')
-try:
+CONFIG_JSON_FILE = os.path.splitext(CONFIG_FILE)[0] + '.json' # Parsed copy of the YAML (shared with the GUI), keyed on its mtime and size
+
+def load_config():
+    """Load dynamixel_settings from config.json when it was written for config.yaml's current mtime and size.
+    Otherwise parse the YAML (importing PyYAML only then) and refresh the JSON copy."""
+    st = os.stat(CONFIG_FILE)
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(CONFIG_JSON_FILE, 'r') as f:
+            cached = json.load(f)
+        if cached['source'] == source:
+            return cached['data']['dynamixel_settings']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass # Missing, stale or unreadable JSON copy: fall back to the YAML
+    import yaml
     with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)['dynamixel_settings']
+        data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)) # libyaml when available
+    # Written to a temp file and renamed over the copy, so a failed dump never leaves it truncated
+    tmp_file = f"{CONFIG_JSON_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump({'source': source, 'data': data}, f)
+        os.replace(tmp_file, CONFIG_JSON_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write %s: %s", CONFIG_JSON_FILE, e)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    return data['dynamixel_settings']
+
+try:
+    config = load_config()
     logger.info(f"Loaded configuration from {CONFIG_FILE}")
 except Exception as e:
     logger.error(f"Failed to load config: {e}")
@@ -56,10 +88,10 @@ logger.info(f"Set baudrate: {BAUDRATE}")
 # --- Helper Functions ---
 def clamp_velocity(velocity):
     if velocity > MAX_VELOCITY_UNIT:
-        logger.warning(f"Velocity {velocity} exceeds MAX_VELOCITY_UNIT {MAX_VELOCITY_UNIT}, clamping.")
+        logger.warning("Velocity %d exceeds MAX_VELOCITY_UNIT %d, clamping.", velocity, MAX_VELOCITY_UNIT)
         return MAX_VELOCITY_UNIT
     elif velocity < -MAX_VELOCITY_UNIT:
-        logger.warning(f"Velocity {velocity} below -MAX_VELOCITY_UNIT {-MAX_VELOCITY_UNIT}, clamping.")
+        logger.warning("Velocity %d below -MAX_VELOCITY_UNIT %d, clamping.", velocity, -MAX_VELOCITY_UNIT)
         return -MAX_VELOCITY_UNIT
     return velocity
 
@@ -72,29 +104,40 @@ def check_comm_result(dxl_comm_result, dxl_error, context=""):
         return False
     return True
 
-def set_operating_mode(servo_id, mode):
-    dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, TORQUE_DISABLE)
-    check_comm_result(dxl_comm_result, dxl_error, f"Servo {servo_id} disable torque")
-    time.sleep(0.05)
-    dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_OPERATING_MODE, mode)
-    if check_comm_result(dxl_comm_result, dxl_error, f"Servo {servo_id} set mode {mode}"):
-        logger.info(f"Servo {servo_id} set to velocity control mode.")
+# Register payloads by data length, packed in C rather than through int.to_bytes and list()
+_SIGNED_PACKERS = {1: struct.Struct('<B').pack, 2: struct.Struct('<h').pack, 4: struct.Struct('<i').pack} # 1-byte registers are unsigned (0-255)
+
+def sync_write(address, length, values, context=""):
+    """Write one control-table address on every servo in `values` ({id: value}) with a single
+    GroupSyncWrite packet. Sync writes get no status packets, so only the TX result is checked."""
+    group = GroupSyncWrite(portHandler, packetHandler, address, length)
+    pack = _SIGNED_PACKERS[length]
+    for servo_id, value in values.items():
+        if not group.addParam(servo_id, pack(int(value))):
+            logger.error(f"{context} Failed to add servo {servo_id} to sync write")
+            return False
+    dxl_comm_result = group.txPacket()
+    return check_comm_result(dxl_comm_result, 0, context)
+
+def set_operating_mode(servo_ids, mode):
+    # The operating mode can only be changed with torque off
+    sync_write(ADDR_TORQUE_ENABLE, 1, {sid: TORQUE_DISABLE for sid in servo_ids}, "Disable torque")
+    if sync_write(ADDR_OPERATING_MODE, 1, {sid: mode for sid in servo_ids}, f"Set mode {mode}"):
+        logger.info(f"Servos {list(servo_ids)} set to velocity control mode.")
         return True
     return False
 
-def set_torque(servo_id, enable):
+def set_torque(servo_ids, enable):
     value = TORQUE_ENABLE if enable else TORQUE_DISABLE
-    dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, value)
-    if check_comm_result(dxl_comm_result, dxl_error, f"Servo {servo_id} set torque {enable}"):
-        logger.info(f"Servo {servo_id} torque {'enabled' if enable else 'disabled'}.")
+    if sync_write(ADDR_TORQUE_ENABLE, 1, {sid: value for sid in servo_ids}, f"Set torque {enable}"):
+        logger.info(f"Servos {list(servo_ids)} torque {'enabled' if enable else 'disabled'}.")
         return True
     return False
 
-def set_goal_velocity(servo_id, velocity):
-    velocity = clamp_velocity(velocity)
-    dxl_comm_result, dxl_error = packetHandler.write4ByteTxRx(portHandler, servo_id, ADDR_GOAL_VELOCITY, velocity)
-    if check_comm_result(dxl_comm_result, dxl_error, f"Servo {servo_id} set velocity {velocity}"):
-        logger.debug(f"Servo {servo_id} velocity set to {velocity}.")
+def set_goal_velocity(velocities):
+    velocities = {sid: clamp_velocity(vel) for sid, vel in velocities.items()}
+    if sync_write(ADDR_GOAL_VELOCITY, 4, velocities, "Set velocities"):
+        logger.debug("Servo velocities set to %s.", velocities)
         return True
     return False
 
@@ -121,16 +164,12 @@ signal.signal(signal.SIGTERM, shutdown_handler)
 
 try:
     # Set all servos to velocity mode and enable torque
-    for sid in SERVO_IDS:
-        set_operating_mode(sid, MODE_VELOCITY_CONTROL)
-        time.sleep(0.05)
-        set_torque(sid, True)
-        time.sleep(0.05)
+    set_operating_mode(SERVO_IDS, MODE_VELOCITY_CONTROL)
+    set_torque(SERVO_IDS, True)
 
     # Set velocities
-    for sid, vel in spin_velocities.items():
-        set_goal_velocity(sid, vel)
-        logger.info(f"Servo {sid} spinning at velocity {vel}")
+    set_goal_velocity(spin_velocities)
+    logger.info("Servos spinning at velocities %s", spin_velocities)
 
     logger.info("Spin mode active. Press Ctrl+C to stop.")
     while running:
@@ -138,8 +177,7 @@ try:
 
 finally:
     logger.info("Stopping all servos and disabling torque...")
-    for sid in SERVO_IDS:
-        set_goal_velocity(sid, 0)
-        set_torque(sid, False)
+    set_goal_velocity({sid: 0 for sid in SERVO_IDS})
+    set_torque(SERVO_IDS, False)
     portHandler.closePort()
     logger.info("Shutdown complete.") 
\ No newline at end of file
@@ -1,22 +1,32 @@
 import serial
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import re
+import matplotlib.style as mplstyle
+from matplotlib.figure import Figure
+from matplotlib.animation import FFMpegWriter, PillowWriter
 from mpl_toolkits.mplot3d import Axes3D
 import tkinter as tk
 from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
+import selectors
+import queue
+from concurrent.futures import Future
+import struct
 import time
 import numpy as np
 import serial.tools.list_ports
-from PIL import Image, ImageTk, ImageDraw
 import math
-import colorsys
 import yaml
+try:
+    from yaml import CSafeLoader as _YamlLoader # libyaml C extension
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 import os
 import sys
 import platform
+from imu_common import (
+    DARK_BG, DARKER_BG, HIGHLIGHT, TEXT_COLOR, ACCENT_COLOR, SUCCESS_COLOR, DANGER_COLOR,
+    parse_euler, decimate_history, AngleUnwrapper, KalmanFilter3D,
+)
 
 # Conditional import for Dynamixel SDK based on OS
 if os.name == 'nt':
@@ -47,12 +57,30 @@ except ImportError:
 REDRAW_INTERVAL = 10  # ms between redraws
 DATA_HISTORY_LENGTH = 200  # Reduce history length to improve performance
 QUIVER_SCALE = 30  # Scale of the direction arrow
+PLOT_MAX_POINTS = 64  # Most history samples drawn per trace; more are not resolvable on screen
+IMU_BATCH_SIZE = 8  # Samples per IMU double-buffer batch
+IMU_BATCH_TIMEOUT = 0.05  # Seconds before a partially filled batch is handed off
+SERIAL_BULK_READ_THRESHOLD = 40  # Pending bytes above which the whole serial buffer is read at once
+SERIAL_MAX_LINE_LENGTH = 1024  # Drop a partial serial line that grows past this
+IMU_POLL_INTERVAL = 0.01  # Seconds between I2C reads (and serial reads where select() is unavailable)
+IMU_IDLE_WAIT = 0.1  # Longest a select() wait on the IMU port lasts, so stop_event is still noticed
+PLOT_RANGE_TOLERANCE = 0.05  # Relative change in the auto-resize range needed before the axes are rescaled
+VELOCITY_WRITE_INTERVAL_MS = 50  # Slider velocity writes are coalesced to at most one sync write per interval
+
+# Real-time settings (Linux only, need CAP_SYS_NICE / write access to sysfs)
+REALTIME_PRIORITY = 10  # SCHED_FIFO priority for the IMU reader/filter threads
+USB_LATENCY_TIMER_MS = 1  # FTDI latency timer for the IMU serial port
+GIL_SWITCH_INTERVAL = 0.001  # s; shorter GIL handoff between the Tk thread and the IMU reader/filter threads
+
+# Recording settings
+RECORD_FPS = 30  # Frames per second written to the recording
+RECORD_BITRATE = 2400  # kbps for the FFmpeg/libx264 encoder
 
 # Load Dynamixel Configuration
 CONFIG_FILE = 'config.yaml'
 try:
     with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)['dynamixel_settings']
+        config = yaml.load(f, Loader=_YamlLoader)['dynamixel_settings']
     print(f"Loaded configuration from {CONFIG_FILE}")
 except FileNotFoundError:
     print(f"Error: Configuration file '{CONFIG_FILE}' not found.")
@@ -81,19 +109,37 @@ except Exception as e:
     print(f"Error processing config values: {e}")
     sys.exit(1)
 
-# Constants
-DARK_BG = "#2E2E2E"
-DARKER_BG = "#252525"
-HIGHLIGHT = "#3498db"
-TEXT_COLOR = "#FFFFFF"
-ACCENT_COLOR = "#F39C12"
-SLIDER_COLOR = "#3498db"
-SUCCESS_COLOR = "#2ecc71"
-DANGER_COLOR = "#e74c3c"
-
-# Global flags and locks
+# Global flags
 stop_event = threading.Event()
-dxl_lock = threading.Lock()
+
+# Single-writer I/O queue: only the dxl-io thread talks to the Dynamixel port
+_io_queue = queue.SimpleQueue()  # items are (callable, Future), run in FIFO order
+
+def _io_worker():
+    """Run submitted Dynamixel calls one at a time, in FIFO order, on the dxl-io thread."""
+    while True:
+        fn, future = _io_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+def _submit(fn):
+    """Queue `fn` for the dxl-io thread and return a Future for its result."""
+    future = Future()
+    _io_queue.put((fn, future))
+    return future
+
+def _run_io(fn):
+    """Run `fn` on the dxl-io thread and return its result; called from a job, it runs inline."""
+    if threading.current_thread() is _io_thread:
+        return fn()
+    return _submit(fn).result()
+
+_io_thread = threading.Thread(target=_io_worker, name="dxl-io", daemon=True)
+_io_thread.start()
 
 # Initialize Dynamixel communication
 portHandler = PortHandler(DXL_DEVICENAME)
@@ -112,101 +158,138 @@ if IS_ARM_MACHINE:
         print("Please install required packages: pip install adafruit-circuitpython-bno055")
         sys.exit(1)
 
-# Helper class for IMU angle unwrapping
-class AngleUnwrapper:
-    def __init__(self):
-        self.previous_angle = None
-        self.offset = 0
-        
-    def unwrap(self, angle):
-        if self.previous_angle is None:
-            self.previous_angle = angle
-            return angle
-        
-        diff = angle - self.previous_angle
-        if diff > 180:
-            self.offset -= 360
-        elif diff < -180:
-            self.offset += 360
-            
-        self.previous_angle = angle
-        return angle + self.offset
-    
-    def reset(self):
-        self.previous_angle = None
-        self.offset = 0
-
-# Kalman Filter for IMU
-class KalmanFilter3D:
-    def __init__(self, process_noise=0.1, measurement_noise=1.0):
-        self.state = np.zeros(6)
-        self.covariance = np.eye(6) * 1000
-        self.Q = np.eye(6) * process_noise
-        self.R = np.eye(3) * measurement_noise
-        self.F = np.eye(6)
-        self.F[0:3, 3:6] = np.eye(3)
-        self.H = np.zeros((3, 6))
-        self.H[0:3, 0:3] = np.eye(3)
-        self.dt = 0.01
-        
-    def predict(self):
-        self.state = self.F @ self.state
-        self.covariance = self.F @ self.covariance @ self.F.T + self.Q
-        
-    def update(self, measurement):
-        K = self.covariance @ self.H.T @ np.linalg.inv(self.H @ self.covariance @ self.H.T + self.R)
-        innovation = measurement - self.H @ self.state
-        self.state = self.state + K @ innovation
-        self.covariance = (np.eye(6) - K @ self.H) @ self.covariance
-        return self.state[0:3]
+# Real-time helpers
+def set_realtime_priority(priority=REALTIME_PRIORITY):
+    """Run the calling thread under SCHED_FIFO if the OS and permissions allow it."""
+    if not hasattr(os, 'sched_setscheduler'):
+        return False
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        return True
+    except OSError as e:
+        print(f"Could not set real-time priority ({e}), continuing with default scheduling")
+        return False
+
+def set_usb_latency_timer(port, latency_ms=USB_LATENCY_TIMER_MS):
+    """Lower the USB-serial latency timer for a port (FTDI adapters on Linux)."""
+    tty = os.path.basename(os.path.realpath(port))
+    latency_path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+    if not os.path.exists(latency_path):
+        return False
+    try:
+        with open(latency_path, 'w') as f:
+            f.write(str(latency_ms))
+        print(f"Set USB latency timer for {port} to {latency_ms} ms")
+        return True
+    except OSError as e:
+        print(f"Could not set USB latency timer for {port}: {e}")
+        return False
 
 # Dynamixel helper functions
 def check_comm_result(dxl_comm_result, dxl_error):
+    """Return True if a Dynamixel transaction succeeded. Does no formatting or I/O."""
+    return dxl_comm_result == COMM_SUCCESS and dxl_error == 0
+
+def report_comm_error(dxl_comm_result, dxl_error):
+    """Print the SDK description of a failed transaction. Kept out of dxl-io jobs so printing never delays the bus."""
     if dxl_comm_result != COMM_SUCCESS:
-        print(f"%s" % packetHandler.getTxRxResult(dxl_comm_result))
-        return False
+        print(packetHandler.getTxRxResult(dxl_comm_result))
     elif dxl_error != 0:
-        print(f"%s" % packetHandler.getRxPacketError(dxl_error))
-        return False
-    return True
+        print(packetHandler.getRxPacketError(dxl_error))
 
 def set_torque(servo_id, enable):
     value = TORQUE_ENABLE if enable else TORQUE_DISABLE
-    with dxl_lock:
-        dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(
-            portHandler, servo_id, ADDR_TORQUE_ENABLE, value)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            status = "enabled" if enable else "disabled"
-            print(f"Torque for Servo ID {servo_id} {status}.")
-            return True
-        print(f"Failed to set torque for Servo ID {servo_id}.")
-        return False
+    dxl_comm_result, dxl_error = _run_io(lambda: packetHandler.write1ByteTxRx(
+        portHandler, servo_id, ADDR_TORQUE_ENABLE, value))
+    if check_comm_result(dxl_comm_result, dxl_error):
+        status = "enabled" if enable else "disabled"
+        print(f"Torque for Servo ID {servo_id} {status}.")
+        return True
+    report_comm_error(dxl_comm_result, dxl_error)
+    print(f"Failed to set torque for Servo ID {servo_id}.")
+    return False
+
+# Register payloads by data length, packed in C rather than byte by byte in the SDK
+_SIGNED_PACKERS = {1: struct.Struct('<B').pack, 2: struct.Struct('<h').pack, 4: struct.Struct('<i').pack} # 1-byte registers are unsigned (0-255)
 
-def set_operating_mode(servo_id, mode):
-    with dxl_lock:
-        dxl_comm_result_torque, dxl_error_torque = packetHandler.write1ByteTxRx(
-            portHandler, servo_id, ADDR_TORQUE_ENABLE, TORQUE_DISABLE)
-        if not check_comm_result(dxl_comm_result_torque, dxl_error_torque):
-            print(f"Warning: Failed to disable torque for Servo ID {servo_id}")
-        
-        time.sleep(0.05)
-        
-        dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(
-            portHandler, servo_id, ADDR_OPERATING_MODE, mode)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            mode_name = "Velocity Control" if mode == MODE_VELOCITY_CONTROL else "Position Control"
-            print(f"Operating mode for Servo ID {servo_id} set to {mode_name}.")
-            return True
-        print(f"Failed to set operating mode for Servo ID {servo_id}.")
+def sync_write(address, length, values, context="", wait=True):
+    """Write one control-table address on every servo in `values` ({id: value}) with a single
+    GroupSyncWrite packet. Sync writes get no status packets, so only the TX result is checked.
+    With wait=False the packet is queued and True returned at once; failures are still reported."""
+    group = GroupSyncWrite(portHandler, packetHandler, address, length)
+    pack = _SIGNED_PACKERS[length]
+    for servo_id, value in values.items():
+        if not group.addParam(servo_id, pack(int(value))):
+            print(f"{context}: failed to add Servo ID {servo_id} to sync write.")
+            return False
+    future = _submit(group.txPacket)
+    if not wait:
+        future.add_done_callback(lambda f: _report_sync_write(f, context))
+        return True
+    return _report_sync_write(future, context)
+
+def _report_sync_write(future, context):
+    dxl_comm_result = future.result()
+    if check_comm_result(dxl_comm_result, 0):
+        return True
+    report_comm_error(dxl_comm_result, 0)
+    print(f"{context}: sync write failed.")
+    return False
+
+def set_all_servos(mode, enable):
+    """Put every servo in `mode`, then turn torque on or leave it off, with one sync write per step.
+    A servo handles packets in order, so its torque is off before the mode write arrives."""
+    sync_write(ADDR_TORQUE_ENABLE, 1, dict.fromkeys(SERVO_IDS, TORQUE_DISABLE), "Disable torque")
+    if not sync_write(ADDR_OPERATING_MODE, 1, dict.fromkeys(SERVO_IDS, mode), "Set operating mode"):
         return False
+    mode_name = "Velocity Control" if mode == MODE_VELOCITY_CONTROL else "Position Control"
+    print(f"Operating mode for servos {SERVO_IDS} set to {mode_name}.")
+    if enable:
+        if not sync_write(ADDR_TORQUE_ENABLE, 1, dict.fromkeys(SERVO_IDS, TORQUE_ENABLE), "Enable torque"):
+            return False
+        print(f"Torque for servos {SERVO_IDS} enabled.")
+    return True
+
+# Blitting helper for the 3D plot
+class BlitManager:
+    """Redraw a fixed set of animated artists over a cached background instead of the whole figure.
+    Modeled on the matplotlib blitting tutorial; the background is recaptured after every full draw."""
+    def __init__(self, canvas, animated_artists=()):
+        self.canvas = canvas
+        self._bg = None
+        self._artists = []
+        for artist in animated_artists:
+            self.add_artist(artist)
+        self.cid = canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """Recapture the background after a full draw (first show, resize, limit change) and redraw the artists."""
+        if self.canvas.is_saving():
+            return # savefig draw: the copied background would come from the file's figure, not the screen
+        self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def add_artist(self, artist):
+        artist.set_animated(True)
+        self._artists.append(artist)
 
-def set_goal_velocity(servo_id, velocity):
-    print(f"Setting Servo ID {servo_id} Goal Velocity to {velocity}")
-    with dxl_lock:
-        dxl_comm_result, dxl_error = packetHandler.write4ByteTxRx(
-            portHandler, servo_id, ADDR_GOAL_VELOCITY, velocity)
-        if not check_comm_result(dxl_comm_result, dxl_error):
-            print(f"Failed to set goal velocity for Servo ID {servo_id}.")
+    def _draw_animated(self):
+        figure = self.canvas.figure
+        for artist in self._artists:
+            if hasattr(artist, 'do_3d_projection'):  # 3D collections are projected by the axes, not in draw()
+                artist.do_3d_projection()
+            figure.draw_artist(artist)
+
+    def update(self):
+        """Restore the background, draw the animated artists and blit. Falls back to a full draw
+        until a background has been captured."""
+        if self._bg is None:
+            self.canvas.draw()  # on_draw captures the background
+        else:
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
 
 # Main application class
 class CombinedIMUDynamixelApp:
@@ -226,20 +309,45 @@ class CombinedIMUDynamixelApp:
         # Setup modern styles
         self.setup_styles()
         
-        # Initialize IMU data
-        self.x_data, self.y_data, self.z_data = [], [], []
-        self.x_filtered, self.y_filtered, self.z_filtered = [], [], []
+        # Initialize IMU data: ring buffer of the last DATA_HISTORY_LENGTH samples.
+        # Rows: raw yaw, pitch, roll, then filtered yaw, pitch, roll. Written by the filter thread, read by Tk.
+        self.history = np.zeros((6, DATA_HISTORY_LENGTH), dtype=np.float32)
+        self.history_write_idx = 0  # Column the next sample goes into
+        self.history_count = 0  # Number of valid columns
+        self.history_lock = threading.Lock()
+        self.ring_positions = np.arange(DATA_HISTORY_LENGTH)
+        self.batch_scratch = np.empty((IMU_BATCH_SIZE, 6), dtype=np.float32)  # Filter thread's staging rows
+        self.plot_buffer = np.empty((6, DATA_HISTORY_LENGTH), dtype=np.float32)  # History unrolled oldest-first
         self.kalman_filter = KalmanFilter3D()
         self.yaw_unwrapper = AngleUnwrapper()
-        self.euler_regex = re.compile(r"Euler:\s*([\d\.-]+),\s*([\d\.-]+),\s*([\d\.-]+)")
+        self.serial_remainder = b""  # Partial line left over from the last serial read
+        self.latest_filtered = None  # Newest filtered (yaw, pitch, roll) not yet shown, set by the filter thread
+        
+        # Double-buffered IMU batches: the reader fills one while the filter processes the other
+        self.imu_buffers = [np.empty((IMU_BATCH_SIZE, 3), dtype=np.float32) for _ in range(2)]
+        self.imu_buffer_counts = [0, 0]
+        self.imu_buffer_ready = [threading.Event(), threading.Event()]
+        self.imu_buffer_free = [threading.Event(), threading.Event()]
+        for event in self.imu_buffer_free:
+            event.set()
+        
+        # Slider velocities waiting for the next coalesced sync write
+        self.pending_velocities = {}
+        self.velocity_flush_scheduled = False
         
         # Initialize IMU based on platform
         self.initialize_imu()
         
         # Initialize plot update flags
         self.redraw_needed = False
-        self.last_redraw_time = 0
+        self.full_redraw_needed = False  # Axes changed: full draw, which recaptures the blit background
         self.auto_resize = True
+        self.plot_range = None  # Axis half-range last applied by update_plot_limits
+        
+        # Initialize recording state (writer is only touched under record_lock)
+        self.record_lock = threading.Lock()
+        self.record_writer = None
+        self.last_record_time = 0
         self.continuous_yaw = True
         
         # Initialize Dynamixel data
@@ -251,6 +359,8 @@ class CombinedIMUDynamixelApp:
         self.yaw_var = tk.DoubleVar(value=0.0)
         self.pitch_var = tk.DoubleVar(value=0.0)
         self.roll_var = tk.DoubleVar(value=0.0)
+        self.angle_texts = [None, None, None]  # Last yaw/pitch/roll strings pushed to Tk
+        self.angle_bar_values = [None, None, None]  # Last whole-degree progress bar values pushed to Tk
         
         # Add control variables
         self.auto_resize_var = tk.BooleanVar(value=True)
@@ -276,6 +386,7 @@ class CombinedIMUDynamixelApp:
 
     def initialize_imu(self):
         """Initialize IMU based on platform."""
+        self.imu_selector = None  # Wakes the reader thread when serial data arrives; None means sleep-polling
         if IS_ARM_MACHINE:
             try:
                 self.imu = BNO055_IMU()
@@ -292,9 +403,24 @@ class CombinedIMUDynamixelApp:
             try:
                 self.imu_serial = serial.Serial(self.imu_port, 115200, timeout=1)
                 print(f"Connected to IMU on {self.imu_port}")
+                set_usb_latency_timer(self.imu_port)
             except serial.SerialException as e:
                 print(f"Error connecting to IMU: {e}")
                 sys.exit(1)
+            try:
+                selector = selectors.DefaultSelector()
+                selector.register(self.imu_serial.fileno(), selectors.EVENT_READ)
+                self.imu_selector = selector
+            except (AttributeError, OSError, ValueError):
+                # No selectable file descriptor (e.g. Windows COM ports): keep sleep-polling
+                pass
+
+    def wait_for_imu_data(self, timeout):
+        """Block until the IMU port has data or `timeout` seconds pass (a fixed short sleep without a selector)."""
+        if self.imu_selector is None:
+            time.sleep(IMU_POLL_INTERVAL)
+        else:
+            self.imu_selector.select(max(timeout, 0))
 
     def find_imu_port(self):
         """Find Arduino/IMU port automatically."""
@@ -318,152 +444,299 @@ class CombinedIMUDynamixelApp:
         
         return [x, y, z]
 
-    def schedule_redraw(self):
+    def schedule_redraw(self, full=False):
         """Mark plot for redrawing."""
         self.redraw_needed = True
+        if full:
+            self.full_redraw_needed = True
+
+    def ingest_batch(self, k):
+        """Append the first k rows of batch_scratch to the history ring."""
+        with self.history_lock:
+            columns = (self.history_write_idx + self.ring_positions[:k]) % DATA_HISTORY_LENGTH
+            self.history[:, columns] = self.batch_scratch[:k].T
+            self.history_write_idx = (self.history_write_idx + k) % DATA_HISTORY_LENGTH
+            self.history_count = min(self.history_count + k, DATA_HISTORY_LENGTH)
 
-    def update_plot_limits(self):
-        """Update plot limits based on data."""
-        if not self.auto_resize or not self.x_filtered:
+    def unroll_history(self):
+        """Copy the ring into plot_buffer in chronological order and return the valid (6, n) view."""
+        with self.history_lock:
+            n = self.history_count
+            out = self.plot_buffer[:, :n]
+            np.take(self.history, self.history_write_idx - n + self.ring_positions[:n],
+                axis=1, out=out, mode='wrap')
+        return out
+
+    def update_plot_limits(self, filtered=None):
+        """Update plot limits based on data. `filtered` is the unrolled filtered history, if already at hand."""
+        if not self.auto_resize or not self.history_count:
             return
         
-        x_min, x_max = min(self.x_filtered), max(self.x_filtered)
-        y_min, y_max = min(self.y_filtered), max(self.y_filtered)
-        z_min, z_max = min(self.z_filtered), max(self.z_filtered)
+        if filtered is None:
+            filtered = self.unroll_history()[3:6]
+        if filtered.shape[1] == 0:
+            return
         
-        x_range = max(abs(x_min), abs(x_max)) * 1.1
-        y_range = max(abs(y_min), abs(y_max)) * 1.1
-        z_range = max(abs(z_min), abs(z_max)) * 1.1
+        # One reduction over all three axes; same range for every axis to keep the aspect ratio
+        max_range = max(float(np.abs(filtered).max()) * 1.1, 20)
         
-        max_range = max(x_range, y_range, z_range, 20)
+        # set_*lim forces a full redraw, so skip changes too small to notice
+        if self.plot_range and abs(max_range - self.plot_range) < PLOT_RANGE_TOLERANCE * self.plot_range:
+            return
+        self.plot_range = max_range
         
         self.ax.set_xlim(-max_range, max_range)
         self.ax.set_ylim(-max_range, max_range)
         self.ax.set_zlim(-max_range, max_range)
         
-        self.schedule_redraw()
+        self.schedule_redraw(full=True)
 
     def update_angle_display(self, yaw, pitch, roll):
         """Update the angle display with current values."""
-        # Update variables
-        self.yaw_var.set(f"{yaw:.1f}°")
-        self.pitch_var.set(f"{pitch:.1f}°")
-        self.roll_var.set(f"{roll:.1f}°")
-        
-        # Update progress bars (adjust for visualization)
-        self.yaw_progress['value'] = (yaw + 90) % 180
-        self.pitch_progress['value'] = (pitch + 90) % 180
-        self.roll_progress['value'] = (roll + 90) % 180
+        # Update variables and progress bars, skipping the Tk round trip when nothing visible changed
+        texts = self.angle_texts
+        bar_values = self.angle_bar_values
+        for i, (var, bar, angle) in enumerate((
+                (self.yaw_var, self.yaw_progress, yaw),
+                (self.pitch_var, self.pitch_progress, pitch),
+                (self.roll_var, self.roll_progress, roll))):
+            text = f"{angle:.1f}°"
+            if text != texts[i]:
+                texts[i] = text
+                var.set(text)
+            
+            # Progress bars (adjust for visualization) span 180 degrees, so whole degrees are enough
+            bar_value = int((angle + 90) % 180)
+            if bar_value != bar_values[i]:
+                bar_values[i] = bar_value
+                bar['value'] = bar_value
+
+    def read_imu_samples(self):
+        """Read every raw (yaw, pitch, roll) sample currently available from the IMU."""
+        if IS_ARM_MACHINE:
+            euler = self.imu.read_euler()
+            return [euler] if euler else []
+        
+        waiting = self.imu_serial.in_waiting
+        if waiting == 0:
+            return []
+        if waiting < SERIAL_BULK_READ_THRESHOLD:
+            data = self.imu_serial.readline()
+        else:
+            # Backlog: drain everything pending in one read instead of one line per tick
+            data = self.imu_serial.read(waiting)
+        
+        lines = (self.serial_remainder + data).split(b"\n")
+        # Keep any trailing partial line for the next read
+        self.serial_remainder = lines.pop()
+        if len(self.serial_remainder) > SERIAL_MAX_LINE_LENGTH:
+            self.serial_remainder = b""
+        
+        samples = []
+        for line in lines:
+            angles = parse_euler(line.strip())
+            if angles:
+                samples.append(angles)
+        return samples
 
     def update_imu(self):
-        """Read and process IMU data."""
+        """Reader stage: fill one IMU batch buffer while the other is being processed."""
+        set_realtime_priority()
+        write_idx = 0
+        count = 0
+        pending = []
+        batch_start = time.time()
         while not stop_event.is_set():
+            if count == 0:
+                # Wait until the processing thread has released this buffer
+                if not self.imu_buffer_free[write_idx].wait(0.1):
+                    continue
+                batch_start = time.time()
+
             try:
-                if IS_ARM_MACHINE:
-                    euler = self.imu.read_euler()
-                    if euler:
-                        yaw, pitch, roll = euler
-                        
-                        if self.continuous_yaw:
-                            yaw = self.yaw_unwrapper.unwrap(yaw)
-                        
-                        measurement = np.array([yaw, pitch, roll])
-                        self.kalman_filter.predict()
-                        filtered = self.kalman_filter.update(measurement)
-                        
-                        self.x_data.append(yaw)
-                        self.y_data.append(pitch)
-                        self.z_data.append(roll)
-                        
-                        self.x_filtered.append(filtered[0])
-                        self.y_filtered.append(filtered[1])
-                        self.z_filtered.append(filtered[2])
-                        
-                        # Update angle display
-                        self.root.after(0, self.update_angle_display,
-                            filtered[0], filtered[1], filtered[2])
-                else:
-                    if self.imu_serial.in_waiting > 0:
-                        line = self.imu_serial.readline().decode('utf-8', errors='replace').strip()
-                        match = self.euler_regex.match(line)
-                        
-                        if match:
-                            yaw = float(match.group(1))
-                            pitch = float(match.group(2))
-                            roll = float(match.group(3))
-                            
-                            if self.continuous_yaw:
-                                yaw = self.yaw_unwrapper.unwrap(yaw)
-                            
-                            measurement = np.array([yaw, pitch, roll])
-                            self.kalman_filter.predict()
-                            filtered = self.kalman_filter.update(measurement)
-                            
-                            self.x_data.append(yaw)
-                            self.y_data.append(pitch)
-                            self.z_data.append(roll)
-                            
-                            self.x_filtered.append(filtered[0])
-                            self.y_filtered.append(filtered[1])
-                            self.z_filtered.append(filtered[2])
-                            
-                            # Update angle display
-                            self.root.after(0, self.update_angle_display,
-                                filtered[0], filtered[1], filtered[2])
-                
-                # Manage data history length
-                if len(self.x_data) > DATA_HISTORY_LENGTH:
-                    self.x_data = self.x_data[-DATA_HISTORY_LENGTH:]
-                    self.y_data = self.y_data[-DATA_HISTORY_LENGTH:]
-                    self.z_data = self.z_data[-DATA_HISTORY_LENGTH:]
-                    self.x_filtered = self.x_filtered[-DATA_HISTORY_LENGTH:]
-                    self.y_filtered = self.y_filtered[-DATA_HISTORY_LENGTH:]
-                    self.z_filtered = self.z_filtered[-DATA_HISTORY_LENGTH:]
-                
-                self.schedule_redraw()
-                
+                if not pending:
+                    pending = self.read_imu_samples()
+                # Copy as many pending samples as fit in the current buffer
+                n = min(len(pending), IMU_BATCH_SIZE - count)
+                if n:
+                    self.imu_buffers[write_idx][count:count + n] = pending[:n]
+                    del pending[:n]
+                    count += n
             except Exception as e:
                 print(f"Error reading IMU data: {e}")
+                pending = []
                 if not IS_ARM_MACHINE and self.imu_serial.in_waiting > 100:
                     self.imu_serial.reset_input_buffer()
-            
-            time.sleep(0.01)  # Small delay to prevent busy waiting
+                    self.serial_remainder = b""
 
-    def update_plot(self):
-        """Update the plot visualization."""
+            # Hand the buffer over when full, or when a partial batch has waited too long
+            if count and (count == IMU_BATCH_SIZE or time.time() - batch_start > IMU_BATCH_TIMEOUT):
+                self.imu_buffer_counts[write_idx] = count
+                self.imu_buffer_free[write_idx].clear()
+                self.imu_buffer_ready[write_idx].set()
+                write_idx ^= 1
+                count = 0
+
+            if not pending:
+                # Sleep until the next sample arrives, but not past a partial batch's hand-off deadline
+                timeout = IMU_BATCH_TIMEOUT - (time.time() - batch_start) if count else IMU_IDLE_WAIT
+                self.wait_for_imu_data(timeout)
+
+    def process_imu(self):
+        """Filter stage: run the Kalman filter over each completed IMU batch."""
+        set_realtime_priority()
+        read_idx = 0
         while not stop_event.is_set():
-            current_time = time.time() * 1000
+            if not self.imu_buffer_ready[read_idx].wait(0.1):
+                continue
+            self.imu_buffer_ready[read_idx].clear()
+
+            filtered = None
+            k = 0
+            try:
+                batch = self.imu_buffers[read_idx][:self.imu_buffer_counts[read_idx]]
+                for yaw, pitch, roll in batch:
+                    yaw = float(yaw)
+                    if self.continuous_yaw:
+                        yaw = self.yaw_unwrapper.unwrap(yaw)
+
+                    measurement = np.array([yaw, pitch, roll])
+                    self.kalman_filter.predict()
+                    filtered = self.kalman_filter.update(measurement)
+
+                    # Stage raw and filtered data; the batch goes into the history ring in one copy
+                    self.batch_scratch[k, 0:3] = yaw, pitch, roll
+                    self.batch_scratch[k, 3:6] = filtered
+                    k += 1
+            except Exception as e:
+                print(f"Error processing IMU data: {e}")
+            finally:
+                # Give the buffer back to the reader and move on to the other one
+                self.imu_buffer_free[read_idx].set()
+                read_idx ^= 1
+
+            if k:
+                self.ingest_batch(k)
+
+            if filtered is not None:
+                # Hand the latest sample of the batch to the Tk thread; update_plot shows it on its next tick
+                self.latest_filtered = (float(filtered[0]), float(filtered[1]), float(filtered[2]))
+                self.schedule_redraw()
+
+    def update_plot(self):
+        """Update the plot visualization. Runs on the Tk thread, since blitting touches the Tk canvas."""
+        if stop_event.is_set():
+            return
+        
+        # Update angle display with the newest sample from the filter thread
+        latest = self.latest_filtered
+        if latest is not None:
+            self.latest_filtered = None
+            self.update_angle_display(*latest)
+        
+        if self.redraw_needed and self.history_count > 0:
+            # Unroll the history ring into the reused plot buffer and plot views of it
+            history = self.unroll_history()
+            xs, ys, zs, xf, yf, zf = decimate_history(history, PLOT_MAX_POINTS)
+            
+            # Update lines
+            self.line.set_data(xs, ys)
+            self.line.set_3d_properties(zs)
+            self.filtered_line.set_data(xf, yf)
+            self.filtered_line.set_3d_properties(zf)
+            
+            # Update current position dot
+            self.dot.set_data(xf[-1:], yf[-1:])
+            self.dot.set_3d_properties(zf[-1:])
+            
+            # Update direction arrow in the preallocated segment buffer
+            seg = self.quiver_segment
+            seg[0, 0] = xf[-1]
+            seg[0, 1] = yf[-1]
+            seg[0, 2] = zf[-1]
+            yaw_for_vector = xf[-1] % 360 if self.continuous_yaw else xf[-1]
+            direction = self.euler_to_vector(yaw_for_vector, yf[-1], zf[-1])
+            seg[1, 0] = seg[0, 0] + direction[0] * QUIVER_SCALE
+            seg[1, 1] = seg[0, 1] + direction[1] * QUIVER_SCALE
+            seg[1, 2] = seg[0, 2] + direction[2] * QUIVER_SCALE
+            self.quiver.set_segments([seg])
+            
+            # Update plot limits if needed
+            if self.history_count % 10 == 0:
+                self.update_plot_limits(history[3:6])
+            
+            # Perform the redraw: a full draw only when the axes changed, otherwise just the artists
+            if self.full_redraw_needed:
+                self.figure_canvas.draw()
+                self.full_redraw_needed = False
+            else:
+                self.blit_manager.update()
             
-            if self.redraw_needed and (current_time - self.last_redraw_time) > REDRAW_INTERVAL:
-                if len(self.x_data) > 0:
-                    # Update lines
-                    self.line.set_data(self.x_data, self.y_data)
-                    self.line.set_3d_properties(self.z_data)
-                    self.filtered_line.set_data(self.x_filtered, self.y_filtered)
-                    self.filtered_line.set_3d_properties(self.z_filtered)
-                    
-                    # Update current position dot
-                    self.dot.set_data([self.x_filtered[-1]], [self.y_filtered[-1]])
-                    self.dot.set_3d_properties([self.z_filtered[-1]])
-                    
-                    # Update direction arrow
-                    pos = np.array([[self.x_filtered[-1], self.y_filtered[-1], self.z_filtered[-1]]])
-                    yaw_for_vector = self.x_filtered[-1] % 360 if self.continuous_yaw else self.x_filtered[-1]
-                    direction = self.euler_to_vector(yaw_for_vector, self.y_filtered[-1], self.z_filtered[-1])
-                    direction = np.array([[direction[0], direction[1], direction[2]]])
-                    self.quiver.set_segments([np.concatenate((pos, pos + direction * QUIVER_SCALE))])
-                    
-                    # Update plot limits if needed
-                    if len(self.x_data) % 10 == 0:
-                        self.update_plot_limits()
-                    
-                    # Perform the redraw
-                    self.figure_canvas.draw()
-                    
-                self.redraw_needed = False
-                self.last_redraw_time = current_time
+            # Grab the freshly drawn frame if recording
+            self.record_frame()
             
-            time.sleep(0.01)  # Small delay to prevent busy waiting
+            self.redraw_needed = False
+        
+        self.root.after(REDRAW_INTERVAL, self.update_plot)
+
+    def start_recording(self):
+        """Start encoding the 3D plot to MP4 (or GIF if FFmpeg is not installed)."""
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        if FFMpegWriter.isAvailable():
+            writer = FFMpegWriter(fps=RECORD_FPS, codec='libx264', bitrate=RECORD_BITRATE)
+            filename = f"imu_recording_{timestamp}.mp4"
+        else:
+            print("FFmpeg not found, falling back to GIF recording")
+            writer = PillowWriter(fps=RECORD_FPS)
+            filename = f"imu_recording_{timestamp}.gif"
+        
+        try:
+            writer.setup(self.fig, filename)
+        except Exception as e:
+            print(f"Error starting recording: {e}")
+            return False
+        
+        with self.record_lock:
+            self.record_writer = writer
+            self.last_record_time = 0
+        print(f"Recording to {filename}")
+        return True
+
+    def stop_recording(self):
+        """Stop recording and finalize the output file."""
+        with self.record_lock:
+            writer = self.record_writer
+            self.record_writer = None
+        if writer is None:
+            return
+        try:
+            writer.finish()
+            print("Recording saved")
+        except Exception as e:
+            print(f"Error finishing recording: {e}")
+
+    def toggle_recording(self):
+        """Toggle recording of the 3D plot."""
+        if self.record_writer is None:
+            if self.start_recording():
+                self.record_button.configure(text="Stop Recording")
+        else:
+            self.stop_recording()
+            self.record_button.configure(text="Start Recording")
+
+    def record_frame(self):
+        """Write the current figure to the recording, throttled to RECORD_FPS."""
+        with self.record_lock:
+            if self.record_writer is None:
+                return
+            current_time = time.time()
+            if current_time - self.last_record_time < 1.0 / RECORD_FPS:
+                return
+            try:
+                self.record_writer.grab_frame()
+                self.last_record_time = current_time
+            except Exception as e:
+                print(f"Error recording frame: {e}")
 
     def setup_styles(self):
         """Configure ttk styles for a modern dark theme."""
@@ -579,8 +852,8 @@ class CombinedIMUDynamixelApp:
         self.setup_angle_displays()
         
         # Create matplotlib figure
-        plt.style.use('dark_background')
-        self.fig = plt.figure(figsize=(8, 6), facecolor=DARK_BG)
+        mplstyle.use('dark_background')
+        self.fig = Figure(figsize=(8, 6), facecolor=DARK_BG)
         self.ax = self.fig.add_subplot(111, projection='3d')
         self.ax.set_facecolor(DARKER_BG)
         
@@ -592,6 +865,8 @@ class CombinedIMUDynamixelApp:
         self.quiver = self.ax.quiver([0], [0], [0], [0], [0], [1],
                                     color=DANGER_COLOR, length=QUIVER_SCALE,
                                     normalize=True, arrow_length_ratio=0.2)
+        # Reused (start, end) segment for the direction arrow, mutated in place on redraw
+        self.quiver_segment = np.zeros((2, 3), dtype=np.float64)
         
         # Set initial plot properties
         self.ax.set_xlim(-180, 180)
@@ -609,6 +884,10 @@ class CombinedIMUDynamixelApp:
         self.figure_canvas = FigureCanvasTkAgg(self.fig, master=self.canvas_frame)
         self.canvas_widget = self.figure_canvas.get_tk_widget()
         self.canvas_widget.grid(column=0, row=0, sticky=(tk.N, tk.W, tk.E, tk.S))
+        
+        # Dynamic artists are blitted over a cached background
+        self.blit_manager = BlitManager(self.figure_canvas,
+            (self.line, self.filtered_line, self.dot, self.quiver))
 
     def setup_angle_displays(self):
         """Setup the angle display widgets."""
@@ -699,10 +978,10 @@ class CombinedIMUDynamixelApp:
             frame.pack(fill=tk.X, padx=5, pady=5)
             self.create_servo_controls(frame, servo_id)
             self.continuous_movement_active[servo_id] = False
-            
-            # Initialize servo
-            if set_operating_mode(servo_id, MODE_VELOCITY_CONTROL):
-                set_torque(servo_id, True)
+        
+        # Initialize servos
+        if SERVO_IDS:
+            set_all_servos(MODE_VELOCITY_CONTROL, enable=True)
 
     def setup_imu_controls(self, parent):
         """Setup the IMU control section."""
@@ -736,6 +1015,11 @@ class CombinedIMUDynamixelApp:
         # Zero IMU button
         ttk.Button(control_frame, text="Zero IMU",
             command=self.zero_imu).pack(fill=tk.X, pady=5)
+        
+        # Record button
+        self.record_button = ttk.Button(control_frame, text="Start Recording",
+            command=self.toggle_recording)
+        self.record_button.pack(fill=tk.X, pady=5)
 
     def toggle_auto_resize(self):
         """Toggle auto-resize plot feature."""
@@ -751,12 +1035,9 @@ class CombinedIMUDynamixelApp:
 
     def reset_plot(self):
         """Reset the plot and clear data."""
-        self.x_data.clear()
-        self.y_data.clear()
-        self.z_data.clear()
-        self.x_filtered.clear()
-        self.y_filtered.clear()
-        self.z_filtered.clear()
+        with self.history_lock:
+            self.history_write_idx = 0
+            self.history_count = 0
         self.yaw_unwrapper.reset()
         self.update_plot_limits()
         self.schedule_redraw()
@@ -806,6 +1087,8 @@ class CombinedIMUDynamixelApp:
         
         widgets['velocity_scale'].configure(
             command=lambda val, sid=servo_id: self.update_velocity(sid, float(val)))
+        # Send the final value as soon as the drag ends instead of waiting for the next flush
+        widgets['velocity_scale'].bind('<ButtonRelease-1>', lambda event: self.flush_velocities())
         
         self.servo_widgets[servo_id] = widgets
 
@@ -816,21 +1099,38 @@ class CombinedIMUDynamixelApp:
         velocity = int(velocity)
         self.servo_widgets[servo_id]['velocity_value'].configure(
             text=f"Velocity: {velocity}")
-        set_goal_velocity(servo_id, velocity)
+        self.pending_velocities[servo_id] = velocity
+        if not self.velocity_flush_scheduled:
+            self.velocity_flush_scheduled = True
+            self.root.after(VELOCITY_WRITE_INTERVAL_MS, self.flush_velocities)
+
+    def flush_velocities(self):
+        """Write the latest slider velocity of every servo moved since the last flush in one packet."""
+        pending, self.pending_velocities = self.pending_velocities, {}
+        self.velocity_flush_scheduled = False
+        if pending: # Fire-and-forget: the Tk thread never waits on the bus for a slider move
+            sync_write(ADDR_GOAL_VELOCITY, 4, pending, "Set goal velocity", wait=False)
 
     def start_update_threads(self):
         # Start IMU update thread
         self.imu_thread = threading.Thread(target=self.update_imu, daemon=True)
         self.imu_thread.start()
         
-        # Start plot update thread
-        self.plot_thread = threading.Thread(target=self.update_plot, daemon=True)
-        self.plot_thread.start()
+        # Start IMU filter thread
+        self.filter_thread = threading.Thread(target=self.process_imu, daemon=True)
+        self.filter_thread.start()
+        
+        # Start plot updates on the Tk event loop
+        self.root.after(REDRAW_INTERVAL, self.update_plot)
 
     def on_closing(self):
         """Clean up when the application is closing."""
         stop_event.set()
         self.update_status_active = False
+        self.pending_velocities.clear()  # Drop slider writes that haven't gone out yet
+        
+        # Finalize any recording in progress
+        self.stop_recording()
         
         # Close IMU connection
         if IS_ARM_MACHINE:
@@ -840,30 +1140,35 @@ class CombinedIMUDynamixelApp:
             if hasattr(self, 'imu_serial') and self.imu_serial.is_open:
                 self.imu_serial.close()
         
-        # Cleanup Dynamixel
-        for servo_id in SERVO_IDS:
-            set_goal_velocity(servo_id, 0)
-            set_torque(servo_id, False)
+        # Cleanup Dynamixel: one packet stops every servo, one more releases them
+        sync_write(ADDR_GOAL_VELOCITY, 4, {sid: 0 for sid in SERVO_IDS}, "Stop servos")
+        sync_write(ADDR_TORQUE_ENABLE, 1, {sid: TORQUE_DISABLE for sid in SERVO_IDS}, "Disable torque")
         
         if portHandler.is_open:
-            portHandler.closePort()
+            _run_io(portHandler.closePort)  # Queued behind the stop packets above
         
         self.root.destroy()
 
 if __name__ == "__main__":
+    # On a free-threaded build (python3.13t, PYTHON_GIL=0) the reader, filter and Tk threads
+    # run in parallel and there is no GIL handoff to tune
+    if getattr(sys, '_is_gil_enabled', lambda: True)():
+        sys.setswitchinterval(GIL_SWITCH_INTERVAL)
+    else:
+        print("Running without the GIL")
+    
     # Initialize Dynamixel port
-    if not portHandler.openPort():
+    if not _run_io(portHandler.openPort):
         print(f"Failed to open the Dynamixel port: {DXL_DEVICENAME}")
         sys.exit(1)
     
-    if not portHandler.setBaudRate(BAUDRATE):
+    if not _run_io(lambda: portHandler.setBaudRate(BAUDRATE)):
         print(f"Failed to set the Dynamixel baudrate to {BAUDRATE}")
         sys.exit(1)
     
     # Initialize servos
-    for servo_id in SERVO_IDS:
-        set_torque(servo_id, False)
-        set_operating_mode(servo_id, MODE_POSITION_CONTROL)
+    if SERVO_IDS:
+        set_all_servos(MODE_POSITION_CONTROL, enable=False)
     
     # Start application
     root = tk.Tk()
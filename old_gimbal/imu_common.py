@@ -0,0 +1,111 @@
+"""Shared IMU pieces for the gimbal visualizers: theme colours, Euler line parsing,
+yaw unwrapping and the orientation Kalman filter."""
+import re
+import numpy as np
+
+# Custom theme and style constants
+DARK_BG = "#2E2E2E"
+DARKER_BG = "#252525"
+HIGHLIGHT = "#3498db"
+TEXT_COLOR = "#FFFFFF"
+ACCENT_COLOR = "#F39C12"
+SLIDER_COLOR = "#3498db"
+SUCCESS_COLOR = "#2ecc71"
+DANGER_COLOR = "#e74c3c"
+
+# Regular expression to parse serial data of the form: "Euler: 45.0, -30.0, 10.0"
+euler_regex = re.compile(rb"Euler:\s*([\d\.-]+),\s*([\d\.-]+),\s*([\d\.-]+)")
+
+def parse_euler(line_raw):
+    """Parse a raw b"Euler: yaw, pitch, roll" line into three floats, or return None.
+    Works on bytes (float() accepts ASCII bytes and surrounding whitespace), so no decode is needed.
+    Splits on commas directly and only falls back to euler_regex for lines that do not split cleanly."""
+    if not line_raw.startswith(b"Euler:"):
+        return None
+    try:
+        parts = line_raw[6:].split(b",", 2)
+        return float(parts[0]), float(parts[1]), float(parts[2])
+    except (ValueError, IndexError):
+        match = euler_regex.match(line_raw)
+        if match:
+            return float(match.group(1)), float(match.group(2)), float(match.group(3))
+        return None
+
+# Helper class for IMU angle unwrapping
+class AngleUnwrapper:
+    def __init__(self):
+        self.previous_angle = None  # Last unwrapped angle
+        
+    def unwrap(self, angle):
+        if self.previous_angle is None:
+            self.previous_angle = angle
+            return angle
+        
+        # Shortest signed step in [-180, 180), added to the running unwrapped angle
+        delta = ((angle - self.previous_angle + 180.0) % 360.0) - 180.0
+        self.previous_angle += delta
+        return self.previous_angle
+    
+    def reset(self):
+        self.previous_angle = None
+
+def decimate_history(history, max_points):
+    """Return a strided view of a (rows, n) history with at most max_points columns, always keeping the newest.
+    No data is copied, so the caller's buffer can still be used at full resolution."""
+    n = history.shape[1]
+    step = -(-n // max_points) if n > max_points else 1
+    return history[:, (n - 1) % step::step]
+
+# Kalman Filter for IMU
+class KalmanFilter3D:
+    def __init__(self, process_noise=0.1, measurement_noise=1.0):
+        # float32 state; IMU noise is far above float32 precision
+        dtype = np.float32
+        self.state = np.zeros(6, dtype=dtype)
+        self.covariance = np.eye(6, dtype=dtype) * 1000
+        self.Q = np.eye(6, dtype=dtype) * process_noise
+        self.R = np.eye(3, dtype=dtype) * measurement_noise
+        self.F = np.eye(6, dtype=dtype)
+        self.F[0:3, 3:6] = np.eye(3, dtype=dtype)
+        self.H = np.zeros((3, 6), dtype=dtype)
+        self.H[0:3, 0:3] = np.eye(3, dtype=dtype)
+        self.dt = 0.01
+        
+        # Pre-allocated scratch so predict/update don't allocate per sample
+        self._I = np.eye(6, dtype=dtype)
+        self._Fx = np.empty(6, dtype=dtype)
+        self._FP = np.empty((6, 6), dtype=dtype)
+        self._HP = np.empty((3, 6), dtype=dtype)
+        self._PHt = np.empty((6, 3), dtype=dtype)
+        self._S = np.empty((3, 3), dtype=dtype)
+        self._K = np.empty((6, 3), dtype=dtype)
+        self._KH = np.empty((6, 6), dtype=dtype)
+        self._Hx = np.empty(3, dtype=dtype)
+        self._innovation = np.empty(3, dtype=dtype)
+        self._Ky = np.empty(6, dtype=dtype)
+        
+    def predict(self):
+        np.matmul(self.F, self.state, out=self._Fx)
+        self.state[:] = self._Fx
+        np.matmul(self.F, self.covariance, out=self._FP)
+        np.matmul(self._FP, self.F.T, out=self.covariance)
+        self.covariance += self.Q
+        
+    def update(self, measurement):
+        np.matmul(self.H, self.covariance, out=self._HP)
+        np.matmul(self._HP, self.H.T, out=self._S)
+        self._S += self.R
+        np.matmul(self.covariance, self.H.T, out=self._PHt)
+        # K = PHt S^-1 via a solve (K^T = S^-T PHt^T) instead of forming the inverse
+        self._K[:] = np.linalg.solve(self._S.T, self._PHt.T).T
+        
+        np.matmul(self.H, self.state, out=self._Hx)
+        np.subtract(measurement, self._Hx, out=self._innovation)
+        np.matmul(self._K, self._innovation, out=self._Ky)
+        self.state += self._Ky
+        
+        np.matmul(self._K, self.H, out=self._KH)
+        np.subtract(self._I, self._KH, out=self._KH)
+        np.matmul(self._KH, self.covariance, out=self._FP)
+        self.covariance[:] = self._FP
+        return self.state[0:3].copy()
@@ -3,10 +3,20 @@ from tkinter import ttk
 import sys
 import os
 import yaml # Import YAML library
+try:
+    from yaml import CSafeLoader as _YamlLoader # libyaml C extension
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 import time # Import time library explicitly
-import random # For random movement
+import logging # Per-write messages, off unless DYNAMIXEL_LOG_LEVEL=DEBUG
+import gc # Freeze startup objects out of the collector
+import struct # Little-endian register payloads
+import json # Parsed config copy
+import numpy as np # For batched random movement draws
 import threading # For random movement thread
 import queue # For thread-safe communication (if needed later)
+from typing import NamedTuple
+from concurrent.futures import Future
 
 # Conditional import for Dynamixel SDK based on OS
 if os.name == 'nt':
@@ -34,11 +44,50 @@ except ImportError:
     print("Please install the library: pip install dynamixel-sdk")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+class RandomMoveConfig(NamedTuple):
+    """Immutable random-movement settings, handed to the random movement thread as one object."""
+    min_speed_percent: float
+    max_speed_percent: float
+    min_duration_s: float
+    max_duration_s: float
+    max_velocity_unit: int
+
 # --- Load Configuration from YAML ---
 CONFIG_FILE = 'config.yaml'
-try:
+CONFIG_JSON_FILE = os.path.splitext(CONFIG_FILE)[0] + '.json' # Parsed copy of the YAML (shared with spin_mode), keyed on its mtime and size
+
+def load_config():
+    """Return the parsed config.yaml, from the JSON copy when it was written for the YAML's current
+    mtime and size. JSON rather than pickle: loading the copy can never run code, whoever wrote it."""
+    st = os.stat(CONFIG_FILE)
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(CONFIG_JSON_FILE, 'r') as f:
+            cached = json.load(f)
+        if cached['source'] == source:
+            return cached['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass # Missing, stale or unreadable JSON copy: fall back to parsing the YAML
     with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)['dynamixel_settings']
+        data = yaml.load(f, Loader=_YamlLoader)
+    # Written to a temp file and renamed over the copy, so a failed dump never leaves it truncated
+    tmp_file = f"{CONFIG_JSON_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump({'source': source, 'data': data}, f)
+        os.replace(tmp_file, CONFIG_JSON_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Could not write {CONFIG_JSON_FILE}: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    return data
+
+try:
+    config = load_config()['dynamixel_settings']
     print(f"Loaded configuration from {CONFIG_FILE}")
 except FileNotFoundError:
     print(f"Error: Configuration file '{CONFIG_FILE}' not found.")
@@ -67,6 +116,7 @@ try:
     ADDR_OPERATING_MODE     = int(config['ADDR_OPERATING_MODE'])
     ADDR_TORQUE_ENABLE      = int(config['ADDR_TORQUE_ENABLE'])
     ADDR_PROFILE_VELOCITY   = int(config.get('ADDR_PROFILE_VELOCITY', 112)) # Default if missing
+    ADDR_RETURN_DELAY_TIME  = int(config.get('ADDR_RETURN_DELAY_TIME', 9)) # Default for X-series
     ADDR_GOAL_VELOCITY      = int(config['ADDR_GOAL_VELOCITY'])
     ADDR_GOAL_POSITION      = int(config['ADDR_GOAL_POSITION'])
     ADDR_PRESENT_POSITION   = int(config['ADDR_PRESENT_POSITION'])
@@ -84,10 +134,13 @@ try:
 
     # Random Movement Config
     ENABLE_RANDOM_MOVEMENT    = bool(config.get('ENABLE_RANDOM_MOVEMENT', False))
-    RANDOM_MIN_SPEED_PERCENT  = float(config.get('RANDOM_MIN_SPEED_PERCENT', 10))
-    RANDOM_MAX_SPEED_PERCENT  = float(config.get('RANDOM_MAX_SPEED_PERCENT', 70))
-    RANDOM_MIN_DURATION_S     = float(config.get('RANDOM_MIN_DURATION_S', 1.0))
-    RANDOM_MAX_DURATION_S     = float(config.get('RANDOM_MAX_DURATION_S', 4.0))
+    RANDOM_MOVE = RandomMoveConfig(
+        min_speed_percent = float(config.get('RANDOM_MIN_SPEED_PERCENT', 10)),
+        max_speed_percent = float(config.get('RANDOM_MAX_SPEED_PERCENT', 70)),
+        min_duration_s    = float(config.get('RANDOM_MIN_DURATION_S', 1.0)),
+        max_duration_s    = float(config.get('RANDOM_MAX_DURATION_S', 4.0)),
+        max_velocity_unit = MAX_VELOCITY_UNIT,
+    )
 
 except KeyError as e:
     print(f"Error: Missing required key '{e}' in configuration file '{CONFIG_FILE}'.")
@@ -103,12 +156,59 @@ except Exception as e:
 # (These might not need to be in config, but could be)
 COMM_SUCCESS                = 0                 # Communication Success result value
 COMM_TX_FAIL                = -1001             # Communication Tx Failed
+VELOCITY_WRITE_INTERVAL_MS  = 20                # Slider velocity writes are coalesced to at most one per interval
+STATUS_POLL_INTERVAL_MS     = 50                # Tk-side poll period for present velocity and load
+TEMPERATURE_POLL_INTERVAL_S = 2.0               # Present temperature is read this often instead
+RANDOM_SAMPLE_BLOCK         = 32                # Random-move sweeps drawn per NumPy call
+USB_LATENCY_TIMER_MS        = 1                 # FTDI latency timer; the Linux default of 16 ms bounds every round trip
+REALTIME_PRIORITY           = 20                # SCHED_FIFO priority for the dxl-io and random movement threads
+TORQUE_OFF_TIMEOUT_S        = 0.05              # Longest wait for a servo to report torque off before a mode write
+LOAD_PERCENT_PER_UNIT       = 100.0 / 2048      # Present Load register units to the label's percentage
 
 # --- Global flag to signal threads to stop ---
 stop_event = threading.Event()
 
-# --- Global lock for synchronizing Dynamixel communication ---
-dxl_lock = threading.Lock()
+# --- Real-time scheduling for the threads that drive the bus ---
+def set_realtime_priority(priority=REALTIME_PRIORITY):
+    """Run the calling thread under SCHED_FIFO if the OS and permissions allow it."""
+    if not hasattr(os, 'sched_setscheduler'):
+        return False
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        return True
+    except OSError as e:
+        print(f"Could not set real-time priority ({e}), continuing with default scheduling")
+        return False
+
+# --- Single-writer I/O queue: only the dxl-io thread talks to the port ---
+_io_queue = queue.SimpleQueue() # items are (callable, Future), run in FIFO order
+
+def _io_worker():
+    """Run submitted Dynamixel calls one at a time, in FIFO order, on the dxl-io thread."""
+    set_realtime_priority()
+    while True:
+        fn, future = _io_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+def _submit(fn):
+    """Queue `fn` for the dxl-io thread and return a Future for its result."""
+    future = Future()
+    _io_queue.put((fn, future))
+    return future
+
+_io_thread = threading.Thread(target=_io_worker, name="dxl-io", daemon=True)
+_io_thread.start()
+
+def _run_io(fn):
+    """Run `fn` on the dxl-io thread and return its result; called from a job, it runs inline."""
+    if threading.current_thread() is _io_thread:
+        return fn()
+    return _submit(fn).result()
 
 # --- Initialize PortHandler and PacketHandler ---
 portHandler = PortHandler(DEVICENAME)
@@ -132,107 +232,339 @@ else:
     getch()
     sys.exit(1)
 
+# --- Lower the U2D2's USB latency timer (Linux FTDI adapters) ---
+def set_usb_latency_timer(port, latency_ms=USB_LATENCY_TIMER_MS):
+    """Lower the USB-serial latency timer for a port. Missing sysfs entries or permissions are not fatal."""
+    tty = os.path.basename(os.path.realpath(port))
+    latency_path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+    if not os.path.exists(latency_path):
+        return False
+    try:
+        with open(latency_path, 'w') as f:
+            f.write(str(latency_ms))
+        print(f"Set USB latency timer for {port} to {latency_ms} ms")
+        return True
+    except OSError as e:
+        print(f"Could not set USB latency timer for {port}: {e}")
+        return False
+
+set_usb_latency_timer(DEVICENAME)
+
+# --- ASYNC_LOW_LATENCY on the tty as well (pyserial issues the TIOCSSERIAL ioctl) ---
+try:
+    portHandler.ser.set_low_latency_mode(True)
+except (AttributeError, OSError, ValueError) as e: # Not Linux, or the driver refuses it
+    print(f"Could not enable ASYNC_LOW_LATENCY on {DEVICENAME}: {e}")
+
 # --- Helper Functions ---
 def check_comm_result(dxl_comm_result, dxl_error):
     """Checks Dynamixel communication result and prints error if any."""
-    if dxl_comm_result != COMM_SUCCESS:
-        print(f"%s" % packetHandler.getTxRxResult(dxl_comm_result))
-        return False
-    elif dxl_error != 0:
-        print(f"%s" % packetHandler.getRxPacketError(dxl_error))
-        return False
-    return True
+    if dxl_comm_result == COMM_SUCCESS and dxl_error == 0:
+        return True
+    _print_comm_error(dxl_comm_result, dxl_error)
+    return False
 
-def set_torque(servo_id, enable):
-    """Enable or disable torque for a specific servo."""
+def _print_comm_error(dxl_comm_result, dxl_error):
+    """Slow path of check_comm_result: print the SDK description of the failure."""
+    if dxl_comm_result != COMM_SUCCESS:
+        print(packetHandler.getTxRxResult(dxl_comm_result))
+    else:
+        print(packetHandler.getRxPacketError(dxl_error))
+
+# --- Last mode/torque written to each servo, as parallel arrays in SERVO_IDS order ---
+# STATE_UNKNOWN never matches a requested state, so the next call always writes
+STATE_UNKNOWN = -1
+SERVO_INDEX = {sid: i for i, sid in enumerate(SERVO_IDS)}
+servo_ids = np.array(SERVO_IDS, dtype=np.uint8)
+servo_mode = np.full(len(SERVO_IDS), STATE_UNKNOWN, dtype=np.int16)
+servo_torque = np.full(len(SERVO_IDS), STATE_UNKNOWN, dtype=np.int8) # 1 on, 0 off
+
+def set_torque(servo_id, enable, force=False):
+    """Enable or disable torque for a specific servo. Skipped if already in that state, unless forced."""
+    i = SERVO_INDEX[servo_id]
+    if not force and servo_torque[i] == enable:
+        return True
     value = TORQUE_ENABLE if enable else TORQUE_DISABLE
-    result = False
-    with dxl_lock: # Acquire lock
-        dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, value)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            status = "enabled" if enable else "disabled"
-            print(f"Torque for Servo ID {servo_id} {status}.")
-            result = True
-        else:
-            print(f"Failed to set torque for Servo ID {servo_id}.")
-            result = False
-    # Release lock automatically via 'with' statement
-    return result
+    dxl_comm_result, dxl_error = _run_io(
+        lambda: packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, value))
+    if check_comm_result(dxl_comm_result, dxl_error):
+        servo_torque[i] = enable
+        status = "enabled" if enable else "disabled"
+        print(f"Torque for Servo ID {servo_id} {status}.")
+        return True
+    servo_torque[i] = STATE_UNKNOWN
+    print(f"Failed to set torque for Servo ID {servo_id}.")
+    return False
+
+def _wait_torque_off(servo_id, timeout=TORQUE_OFF_TIMEOUT_S):
+    """Read back Torque Enable until the servo reports it off, for at most `timeout` seconds.
+    Call on the dxl-io thread."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        value, dxl_comm_result, dxl_error = packetHandler.read1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE)
+        if dxl_comm_result == COMM_SUCCESS and value == TORQUE_DISABLE:
+            return True
+    return False
 
 def set_operating_mode(servo_id, mode):
-    """Set the operating mode for a specific servo."""
+    """Set the operating mode for a specific servo. Skipped if the servo is already in that mode."""
+    i = SERVO_INDEX[servo_id]
+    if servo_mode[i] == mode:
+        return True
     # Important: Torque must be disabled before changing operating mode
-    # We acquire the lock *before* potentially calling set_torque
-    result = False
-    with dxl_lock: # Acquire lock
-        # Try to disable torque first (within the lock)
-        dxl_comm_result_torque, dxl_error_torque = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, TORQUE_DISABLE)
-        if not check_comm_result(dxl_comm_result_torque, dxl_error_torque):
-             print(f"Warning: Failed to disable torque for Servo ID {servo_id} before changing mode, but proceeding.")
-             # Proceed anyway, maybe torque was already off
-
-        time.sleep(0.05) # Small delay - MUST be within the lock if it affects timing critical to comms
-
-        dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_OPERATING_MODE, mode)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            mode_name = "Velocity Control" if mode == MODE_VELOCITY_CONTROL else "Position Control"
-            print(f"Operating mode for Servo ID {servo_id} set to {mode_name}.")
-            result = True
-            # Do NOT re-enable torque here automatically. Let the caller handle it.
+    torque_known_off = servo_torque[i] == 0
+    def _write():
+        # Both writes run as one job, so no other command can slip in between them
+        if torque_known_off: # Nothing to switch off, so no settle delay either
+            torque_result = (COMM_SUCCESS, 0)
         else:
-            print(f"Failed to set operating mode for Servo ID {servo_id}.")
-            result = False
-    # Release lock automatically
-    return result
+            torque_result = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_TORQUE_ENABLE, TORQUE_DISABLE)
+            _wait_torque_off(servo_id) # Part of the job, so the mode write follows as soon as torque is off
+        mode_result = packetHandler.write1ByteTxRx(portHandler, servo_id, ADDR_OPERATING_MODE, mode)
+        last_goal_velocity.pop(servo_id, None) # Not trusted across a mode change
+        return torque_result, mode_result
+
+    (dxl_comm_result_torque, dxl_error_torque), (dxl_comm_result, dxl_error) = _run_io(_write)
+    if check_comm_result(dxl_comm_result_torque, dxl_error_torque):
+        servo_torque[i] = False
+    else:
+         servo_torque[i] = STATE_UNKNOWN
+         print(f"Warning: Failed to disable torque for Servo ID {servo_id} before changing mode, but proceeding.")
+         # Proceed anyway, maybe torque was already off
+
+    if check_comm_result(dxl_comm_result, dxl_error):
+        servo_mode[i] = mode
+        mode_name = "Velocity Control" if mode == MODE_VELOCITY_CONTROL else "Position Control"
+        print(f"Operating mode for Servo ID {servo_id} set to {mode_name}.")
+        # Do NOT re-enable torque here automatically. Let the caller handle it.
+        return True
+    servo_mode[i] = STATE_UNKNOWN
+    print(f"Failed to set operating mode for Servo ID {servo_id}.")
+    return False
+
+def prepare_servos(indices, mode):
+    """Put the servos at `indices` (into SERVO_IDS) in `mode` with torque on, as a single dxl-io job.
+    Writes the servo state arrays already show as done are skipped; returns the indices that succeeded."""
+    def _prepare():
+        prepared = []
+        for i in indices:
+            servo_id = SERVO_IDS[i]
+            if not set_operating_mode(servo_id, mode):
+                print(f"Failed to set operating mode {mode} for Servo ID {servo_id}. Skipping.")
+            elif not set_torque(servo_id, True):
+                print(f"Failed to enable torque for Servo ID {servo_id}. Skipping.")
+            else:
+                prepared.append(i)
+        return prepared
+    return _run_io(_prepare)
+
+# --- Register payloads, packed in C rather than byte by byte in the SDK ---
+_pack_uint32 = struct.Struct('<I').pack
+_pack_int32 = struct.Struct('<i').pack
+_SIGNED_PACKERS = {1: struct.Struct('<B').pack, 2: struct.Struct('<h').pack, 4: _pack_int32} # by data length; 1-byte registers are unsigned (0-255)
 
 def set_goal_position(servo_id, position):
     """Set the goal position for a specific servo (requires Position Control mode)."""
-    print(f"Setting Servo ID {servo_id} Goal Position to {position}")
-    with dxl_lock: # Acquire lock
-        dxl_comm_result, dxl_error = packetHandler.write4ByteTxRx(portHandler, servo_id, ADDR_GOAL_POSITION, position)
-        if not check_comm_result(dxl_comm_result, dxl_error):
-            print(f"Failed to set goal position for Servo ID {servo_id}.")
-    # Release lock automatically
-
-def set_goal_velocity(servo_id, velocity):
-    """Set the goal velocity for a specific servo (requires Velocity Control mode)."""
-    print(f"Setting Servo ID {servo_id} Goal Velocity to {velocity}")
-    # Ensure velocity is within valid range if necessary (e.g., for XL-430, 0-1023 often mapped)
-    # The SDK handles the conversion to the appropriate byte format (4 bytes for XL-430 Goal Velocity)
-    with dxl_lock: # Acquire lock
-        dxl_comm_result, dxl_error = packetHandler.write4ByteTxRx(portHandler, servo_id, ADDR_GOAL_VELOCITY, velocity)
-        if not check_comm_result(dxl_comm_result, dxl_error):
-            print(f"Failed to set goal velocity for Servo ID {servo_id}.")
-    # Release lock automatically
-
-def read_present_velocity(servo_id):
-    """Read the present velocity of a specific servo."""
-    with dxl_lock:
-        present_velocity, dxl_comm_result, dxl_error = packetHandler.read4ByteTxRx(
-            portHandler, servo_id, ADDR_PRESENT_VELOCITY)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            return present_velocity
-        return None
-
-def read_present_temperature(servo_id):
-    """Read the present temperature of a specific servo."""
-    with dxl_lock:
-        present_temp, dxl_comm_result, dxl_error = packetHandler.read1ByteTxRx(
-            portHandler, servo_id, ADDR_PRESENT_TEMPERATURE)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            return present_temp
-        return None
-
-def read_present_load(servo_id):
-    """Read the present load of a specific servo."""
-    with dxl_lock:
-        present_load, dxl_comm_result, dxl_error = packetHandler.read2ByteTxRx(
-            portHandler, servo_id, ADDR_PRESENT_LOAD)
-        if check_comm_result(dxl_comm_result, dxl_error):
-            return present_load
-        return None
+    logger.debug("Setting Servo ID %d Goal Position to %d", servo_id, position)
+    dxl_comm_result, dxl_error = _run_io(
+        lambda: packetHandler.writeTxRx(portHandler, servo_id, ADDR_GOAL_POSITION, 4, _pack_uint32(position)))
+    if not check_comm_result(dxl_comm_result, dxl_error):
+        print(f"Failed to set goal position for Servo ID {servo_id}.")
+
+# --- Protocol 2.0 one-servo Sync Write packets for 4-byte registers, built once per (servo, address) ---
+# Sync Write is a broadcast instruction, so no status packet comes back (a unicast Write would still
+# get one at Status Return Level 2, and it could land in the next read's buffer). Header, length,
+# instruction, address, data length and servo id never change; only the data bytes and CRC do,
+# and the CRC of that fixed prefix is cached so each write only runs the CRC over 4 bytes.
+SYNC_WRITE4_DATA_OFFSET = 13   # FF FF FD 00, FE, length (2), instruction, address (2), data length (2), id
+SYNC_WRITE4_CRC_OFFSET  = 17
+_pack_into_int32        = struct.Struct('<i').pack_into
+_pack_into_uint16       = struct.Struct('<H').pack_into
+_sync_write4_templates  = {}   # (servo_id, address) -> (packet bytearray, prefix CRC)
+
+def _build_crc_table():
+    """Protocol 2.0 CRC-16 (polynomial 0x8005) lookup table. The SDK rebuilds it on every updateCRC call."""
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+CRC_TABLE = _build_crc_table()
+
+def _update_crc(crc, data):
+    table = CRC_TABLE
+    for byte in data:
+        crc = ((crc << 8) ^ table[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
+    return crc
+
+def _sync_write4_template(servo_id, address):
+    template = _sync_write4_templates.get((servo_id, address))
+    if template is None:
+        packet = bytearray(b'\xff\xff\xfd\x00')
+        # length: instruction + address + data length + id + 4 data + CRC
+        packet += struct.pack('<BHBHHB', BROADCAST_ID, 12, INST_SYNC_WRITE, address, 4, servo_id)
+        packet += bytes(6) # data and CRC, patched on every write
+        template = _sync_write4_templates[(servo_id, address)] = (
+            packet, _update_crc(0, packet[:SYNC_WRITE4_DATA_OFFSET]))
+    return template
+
+def fast_sync_write4(servo_id, address, value):
+    """dxl-io job: Sync Write a signed 4-byte register on one servo from a cached packet template.
+    Falls back to the SDK for Protocol 1.0 and for the rare payload that needs byte stuffing."""
+    if PROTOCOL_VERSION != 2.0:
+        return packetHandler.syncWriteTxOnly(portHandler, address, 4, bytes([servo_id]) + _pack_int32(value), 5)
+    packet, prefix_crc = _sync_write4_template(servo_id, address)
+    _pack_into_int32(packet, SYNC_WRITE4_DATA_OFFSET, value)
+    if b'\xff\xff\xfd' in packet[5:SYNC_WRITE4_CRC_OFFSET]:
+        return packetHandler.syncWriteTxOnly(portHandler, address, 4, bytes([servo_id]) + _pack_int32(value), 5)
+    _pack_into_uint16(packet, SYNC_WRITE4_CRC_OFFSET,
+                      _update_crc(prefix_crc, packet[SYNC_WRITE4_DATA_OFFSET:SYNC_WRITE4_CRC_OFFSET]))
+    portHandler.clearPort()
+    if portHandler.writePort(packet) != len(packet):
+        return COMM_TX_FAIL
+    return COMM_SUCCESS
+
+# Last goal velocity sent to each servo; only read and updated on the dxl-io thread, so it follows
+# the order writes reach the bus whichever thread queued them. A missing entry means unknown.
+last_goal_velocity = {}
+
+def _record_goal_velocities(dxl_comm_result, values):
+    if dxl_comm_result == COMM_SUCCESS:
+        last_goal_velocity.update(values)
+    else:
+        for servo_id in values:
+            last_goal_velocity.pop(servo_id, None)
+
+# --- Sync Writes: one instruction packet for every servo, and no status packets to wait for ---
+velocity_sync_writer = GroupSyncWrite(portHandler, packetHandler, ADDR_GOAL_VELOCITY, 4)
+torque_sync_writer = GroupSyncWrite(portHandler, packetHandler, ADDR_TORQUE_ENABLE, 1)
+mode_sync_writer = GroupSyncWrite(portHandler, packetHandler, ADDR_OPERATING_MODE, 1)
+return_delay_sync_writer = GroupSyncWrite(portHandler, packetHandler, ADDR_RETURN_DELAY_TIME, 1)
+
+def sync_write(group, values):
+    """Write {servo_id: value} to every listed servo with a single GroupSyncWrite packet."""
+    if not values:
+        return True
+    pack = _SIGNED_PACKERS[group.data_length]
+    def _write():
+        group.clearParam()
+        for servo_id, value in values.items():
+            group.addParam(servo_id, pack(int(value)))
+        return group.txPacket()
+
+    return check_comm_result(_run_io(_write), 0)
+
+def write_goal_velocities(values, force=False):
+    """Sync write {servo_id: velocity}, leaving out servos whose last goal velocity already matches.
+    Sync Writes are broadcast, so no status packet comes back to be mistaken for a later read's reply;
+    a single changed servo is sent from its cached packet template. force=True sends every value
+    regardless (for stops that must reach the servos)."""
+    def _write():
+        changed = values if force else {
+            servo_id: velocity for servo_id, velocity in values.items() if last_goal_velocity.get(servo_id) != velocity}
+        if not changed:
+            return COMM_SUCCESS
+        if len(changed) == 1:
+            (servo_id, velocity), = changed.items()
+            result = fast_sync_write4(servo_id, ADDR_GOAL_VELOCITY, int(velocity))
+            _record_goal_velocities(result, changed)
+            return result
+        velocity_sync_writer.clearParam()
+        for servo_id, velocity in changed.items():
+            velocity_sync_writer.addParam(servo_id, _pack_int32(int(velocity)))
+        result = velocity_sync_writer.txPacket()
+        _record_goal_velocities(result, changed)
+        return result
+
+    return not values or check_comm_result(_run_io(_write), 0)
+
+def set_all_servos(mode, enable):
+    """Put every servo in `mode`, then turn torque on or leave it off: two or three Sync Writes
+    whatever the servo count. A servo handles packets in order, so torque is off before the mode write."""
+    _run_io(last_goal_velocity.clear) # Not trusted across a mode change
+    torque_off = sync_write(torque_sync_writer, dict.fromkeys(SERVO_IDS, TORQUE_DISABLE))
+    servo_torque[:] = 0 if torque_off else STATE_UNKNOWN
+    if not torque_off:
+        print("Warning: Failed to disable torque before changing mode, but proceeding.")
+
+    if not sync_write(mode_sync_writer, dict.fromkeys(SERVO_IDS, mode)):
+        servo_mode[:] = STATE_UNKNOWN
+        print(f"Failed to set operating mode {mode} for servos {SERVO_IDS}.")
+        return False
+    servo_mode[:] = mode
+    mode_name = "Velocity Control" if mode == MODE_VELOCITY_CONTROL else "Position Control"
+    print(f"Operating mode for servos {SERVO_IDS} set to {mode_name}.")
+
+    if enable:
+        if not sync_write(torque_sync_writer, dict.fromkeys(SERVO_IDS, TORQUE_ENABLE)):
+            servo_torque[:] = STATE_UNKNOWN
+            print(f"Failed to enable torque for servos {SERVO_IDS}.")
+            return False
+        servo_torque[:] = 1
+        print(f"Torque for servos {SERVO_IDS} enabled.")
+    return True
+
+# --- Status Sync Reads: each request returns its fields for every servo (Protocol 2.0) ---
+# Velocity and load change quickly and sit side by side in the control table, so they are read
+# together on every poll; temperature changes over seconds and gets its own, much rarer read.
+# Velocity and load are two's-complement registers; temperature is unsigned
+MOTION_FIELDS = ((ADDR_PRESENT_VELOCITY, 4, True), (ADDR_PRESENT_LOAD, 2, True))
+TEMPERATURE_FIELDS = ((ADDR_PRESENT_TEMPERATURE, 1, False),)
+
+def make_status_reader(fields):
+    """Build a GroupSyncRead spanning `fields` ((address, size, signed), ...) for every servo.
+    Returns (reader, start, length, decode); decode holds (address, size, sign bit, wrap) per field,
+    so decoding a reply is one compare and subtract per value."""
+    start = min(addr for addr, _, _ in fields)
+    length = max(addr + size for addr, size, _ in fields) - start
+    decode = tuple((addr, size, 1 << (8 * size - 1) if signed else None, 1 << (8 * size))
+                   for addr, size, signed in fields)
+    reader = GroupSyncRead(portHandler, packetHandler, start, length)
+    for servo_id in SERVO_IDS:
+        reader.addParam(servo_id)
+    return reader, start, length, decode
+
+motion_status_reader = make_status_reader(MOTION_FIELDS)
+temperature_status_reader = make_status_reader(TEMPERATURE_FIELDS)
+
+def _read_status(status_reader):
+    """dxl-io job: one Sync Read. Returns ({servo_id: values in field order}, comm result)."""
+    reader, start, length, decode = status_reader
+    status = {}
+    dxl_comm_result = reader.txRxPacket()
+    if dxl_comm_result != COMM_SUCCESS:
+        return status, dxl_comm_result # No servo's data is fresh
+    get_data = reader.getData
+    for servo_id in SERVO_IDS:
+        # One availability check covers every field, since they share the read span
+        if reader.isAvailable(servo_id, start, length):
+            values = []
+            for addr, size, sign_bit, wrap in decode:
+                value = get_data(servo_id, addr, size)
+                values.append(value - wrap if sign_bit is not None and value & sign_bit else value)
+            status[servo_id] = tuple(values)
+    return status, dxl_comm_result
+
+def _poll_status(read_temperature):
+    """dxl-io job for one GUI status poll: velocity and load always, temperature only when asked.
+    Returns ({servo_id: (velocity, load)}, {servo_id: (temperature,)} or None, comm result)."""
+    motion, dxl_comm_result = _read_status(motion_status_reader)
+    temperatures = None
+    if read_temperature:
+        temperatures, temperature_result = _read_status(temperature_status_reader)
+        if dxl_comm_result == COMM_SUCCESS:
+            dxl_comm_result = temperature_result
+    return motion, temperatures, dxl_comm_result
 
 # --- Tkinter GUI Setup ---
+def set_if_changed(var, text):
+    """Set a StringVar only when the text differs, so an unchanged label isn't redrawn."""
+    if var.get() != text:
+        var.set(text)
+
 class DynamixelControlApp:
     def __init__(self, root):
         self.root = root
@@ -242,6 +574,12 @@ class DynamixelControlApp:
         self.continuous_movement_active = {} # Track continuous movement state for each servo
         self.random_movement_enabled = tk.BooleanVar(value=ENABLE_RANDOM_MOVEMENT)
         self.update_status_active = True # Flag for status updates
+        self.pending_velocities = {} # Latest slider velocity per servo, waiting to be written
+        self.velocity_flush_scheduled = False
+        self.status_future = None # Status read in flight on the dxl-io thread
+        self.next_temperature_poll = 0.0 # time.monotonic() at which temperature is read again
+        self.shown_temperatures = {} # Last temperature put in each servo's label
+        self.shown_motion = {} # Last (velocity, load) put in each servo's labels
 
         # Create global controls frame
         global_frame = ttk.LabelFrame(root, text="Global Controls", padding="10")
@@ -261,13 +599,12 @@ class DynamixelControlApp:
             self.create_servo_controls(frame, servo_id)
             self.continuous_movement_active[servo_id] = False
 
-            # Initialize servo to velocity control mode
-            if set_operating_mode(servo_id, MODE_VELOCITY_CONTROL):
-                set_torque(servo_id, True)
+        # Initialize every servo to velocity control mode with torque on
+        if SERVO_IDS:
+            set_all_servos(MODE_VELOCITY_CONTROL, enable=True)
 
-        # Start status update thread
-        self.status_thread = threading.Thread(target=self.update_status_loop, daemon=True)
-        self.status_thread.start()
+        # Start status polling on the Tk event loop
+        self.poll_status()
 
         root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -304,18 +641,24 @@ class DynamixelControlApp:
         # Update velocity when slider changes
         widgets['velocity_scale'].configure(command=lambda val, 
             sid=servo_id: self.update_velocity(sid, float(val)))
+        # Send the final value as soon as the drag ends instead of waiting for the next flush
+        widgets['velocity_scale'].bind('<ButtonRelease-1>', lambda event: self.flush_velocities())
 
         # --- Status Display ---
         status_frame = ttk.LabelFrame(parent_frame, text="Status", padding="5")
         status_frame.pack(fill=tk.X, pady=5)
         
-        widgets['current_velocity'] = ttk.Label(status_frame, text="Current Velocity: --")
+        # Labels show StringVars, which show_status only sets when the text actually changes
+        widgets['current_velocity_var'] = tk.StringVar(value="Current Velocity: --")
+        widgets['current_velocity'] = ttk.Label(status_frame, textvariable=widgets['current_velocity_var'])
         widgets['current_velocity'].pack(fill=tk.X, pady=2)
         
-        widgets['current_temp'] = ttk.Label(status_frame, text="Temperature: --°C")
+        widgets['current_temp_var'] = tk.StringVar(value="Temperature: --°C")
+        widgets['current_temp'] = ttk.Label(status_frame, textvariable=widgets['current_temp_var'])
         widgets['current_temp'].pack(fill=tk.X, pady=2)
         
-        widgets['current_load'] = ttk.Label(status_frame, text="Load: --%")
+        widgets['current_load_var'] = tk.StringVar(value="Load: --%")
+        widgets['current_load'] = ttk.Label(status_frame, textvariable=widgets['current_load_var'])
         widgets['current_load'].pack(fill=tk.X, pady=2)
 
         self.servo_widgets[servo_id] = widgets
@@ -330,7 +673,7 @@ class DynamixelControlApp:
     def toggle_torque(self, servo_id, enable):
         """Callback for torque buttons."""
         print(f"Button: Toggle Torque for Servo {servo_id} to {enable}")
-        set_torque(servo_id, enable)
+        set_torque(servo_id, enable, force=True) # An explicit click always writes
         # Optionally update GUI based on success/failure
 
     def go_to_pos(self, servo_id):
@@ -341,32 +684,24 @@ class DynamixelControlApp:
             position = int(widgets['pos_entry'].get())
             # TODO: Get position range from config or servo?
             if 0 <= position <= 4095: # Validate position range (currently hardcoded for XM/XL-430)
-                 # Ensure torque is on and mode is Position Control
-                 # Use MODE_POSITION_CONTROL from config
-                if set_operating_mode(servo_id, MODE_POSITION_CONTROL):
-                    time.sleep(0.1) # Short delay after mode change
-                    # Use TORQUE_ENABLE from config
-                    if set_torque(servo_id, True): # Use True instead of TORQUE_ENABLE for clarity
-                         time.sleep(0.1) # Short delay after torque enable
-                         # Set speed first (Profile Velocity in Position Mode)
-                         speed = self.get_speed_value(servo_id) # Use slider speed
-                         # Use ADDR_PROFILE_VELOCITY from config
-                         print(f"Setting Servo ID {servo_id} Profile Velocity to {speed}")
-                         # Acquire lock for this direct packetHandler call
-                         comm_success = False
-                         with dxl_lock:
-                             dxl_comm_result, dxl_error = packetHandler.write4ByteTxRx(portHandler, servo_id, ADDR_PROFILE_VELOCITY, speed)
-                             comm_success = check_comm_result(dxl_comm_result, dxl_error)
-                         # Release lock automatically
-
-                         if comm_success:
-                             set_goal_position(servo_id, position) # This function handles its own lock
-                         else:
-                              print(f"Failed to set profile velocity for Servo ID {servo_id}")
+                # Ensure mode is Position Control and torque is on (skipped if already so)
+                # Use MODE_POSITION_CONTROL from config
+                if prepare_servos([SERVO_INDEX[servo_id]], MODE_POSITION_CONTROL):
+                    # Set speed first (Profile Velocity in Position Mode)
+                    speed = self.get_speed_value(servo_id) # Use slider speed
+                    # Use ADDR_PROFILE_VELOCITY from config
+                    logger.debug("Setting Servo ID %d Profile Velocity to %d", servo_id, speed)
+                    # Direct packetHandler calls also go through the dxl-io thread
+                    dxl_comm_result, dxl_error = _run_io(lambda: packetHandler.writeTxRx(
+                        portHandler, servo_id, ADDR_PROFILE_VELOCITY, 4, _pack_uint32(speed)))
+                    comm_success = check_comm_result(dxl_comm_result, dxl_error)
+
+                    if comm_success:
+                        set_goal_position(servo_id, position) # Also queued on the dxl-io thread
                     else:
-                        print(f"Failed to enable torque for Servo ID {servo_id} before setting position.")
+                         print(f"Failed to set profile velocity for Servo ID {servo_id}")
                 else:
-                    print(f"Failed to set position control mode for Servo ID {servo_id}.")
+                    print(f"Failed to prepare Servo ID {servo_id} for position control.")
             else:
                 print(f"Error: Position value {position} out of range (0-4095).")
         except ValueError:
@@ -400,32 +735,28 @@ class DynamixelControlApp:
         # Update movement state
         self.continuous_movement_active[servo_id] = True
         
-        # Configure servo for movement
-        if set_operating_mode(servo_id, MODE_VELOCITY_CONTROL):
-            time.sleep(0.1)
-            if set_torque(servo_id, True):
-                time.sleep(0.1)
-                speed_value = self.get_speed_value(servo_id)
-                velocity = speed_value if direction == 'cw' else -speed_value
-                velocity = max(-MAX_VELOCITY_UNIT, min(MAX_VELOCITY_UNIT, velocity))
-                
-                # Update velocity whenever the slider changes
-                def update_velocity(event=None):
-                    if self.continuous_movement_active[servo_id]:
-                        new_speed = self.get_speed_value(servo_id)
-                        new_velocity = new_speed if direction == 'cw' else -new_speed
-                        new_velocity = max(-MAX_VELOCITY_UNIT, min(MAX_VELOCITY_UNIT, new_velocity))
-                        set_goal_velocity(servo_id, new_velocity)
-                
-                # Bind slider to velocity updates
-                self.servo_widgets[servo_id]['speed_scale'].configure(command=update_velocity)
-                
-                # Set initial velocity
-                set_goal_velocity(servo_id, velocity)
-            else:
-                print(f"Failed to enable torque for Servo ID {servo_id} before continuous move.")
+        # Configure servo for movement; nothing is written if it is already in velocity mode with torque on
+        if prepare_servos([SERVO_INDEX[servo_id]], MODE_VELOCITY_CONTROL):
+            speed_value = self.get_speed_value(servo_id)
+            velocity = speed_value if direction == 'cw' else -speed_value
+            velocity = max(-MAX_VELOCITY_UNIT, min(MAX_VELOCITY_UNIT, velocity))
+            
+            # Update velocity whenever the slider changes
+            def update_velocity(event=None):
+                if self.continuous_movement_active[servo_id]:
+                    new_speed = self.get_speed_value(servo_id)
+                    new_velocity = new_speed if direction == 'cw' else -new_speed
+                    new_velocity = max(-MAX_VELOCITY_UNIT, min(MAX_VELOCITY_UNIT, new_velocity))
+                    self.queue_velocity(servo_id, new_velocity) # Coalesced like the velocity slider
+            
+            # Bind slider to velocity updates
+            self.servo_widgets[servo_id]['speed_scale'].configure(command=update_velocity)
+            
+            # Set initial velocity right away, along with any pending slider writes
+            self.pending_velocities[servo_id] = velocity
+            self.flush_velocities()
         else:
-            print(f"Failed to set velocity control mode for Servo ID {servo_id}.")
+            print(f"Failed to prepare Servo ID {servo_id} for continuous move.")
 
     def stop_move(self, servo_id):
         """Stop continuous movement."""
@@ -433,134 +764,213 @@ class DynamixelControlApp:
         self.continuous_movement_active[servo_id] = False
         # Unbind slider updates
         self.servo_widgets[servo_id]['speed_scale'].configure(command=None)
-        set_goal_velocity(servo_id, 0)
+        self.pending_velocities[servo_id] = 0
+        self.flush_velocities() # Stop at once, together with any slider writes still pending
 
     def update_velocity(self, servo_id, velocity):
-        """Update the velocity of a servo."""
+        """Update the velocity of a servo (the write is coalesced, see flush_velocities)."""
         velocity = int(velocity)  # Convert to integer
         self.servo_widgets[servo_id]['velocity_value'].configure(
             text=f"Velocity: {velocity}")
-        set_goal_velocity(servo_id, velocity)
-
-    def update_status_loop(self):
-        """Continuously update status information for all servos."""
-        while self.update_status_active:
-            for servo_id in SERVO_IDS:
-                widgets = self.servo_widgets[servo_id]
-                
-                velocity = read_present_velocity(servo_id)
-                if velocity is not None:
-                    widgets['current_velocity'].configure(
-                        text=f"Current Velocity: {velocity}")
-                
-                temp = read_present_temperature(servo_id)
-                if temp is not None:
-                    widgets['current_temp'].configure(
-                        text=f"Temperature: {temp}°C")
-                
-                load = read_present_load(servo_id)
-                if load is not None:
-                    # Convert load to percentage (assuming 2048 is 100%)
-                    load_percent = (load / 2048) * 100
-                    widgets['current_load'].configure(
-                        text=f"Load: {load_percent:.1f}%")
+        self.queue_velocity(servo_id, velocity)
+
+    def queue_velocity(self, servo_id, velocity):
+        """Keep only the newest velocity per servo; a single flush per interval writes them all."""
+        self.pending_velocities[servo_id] = velocity
+        if not self.velocity_flush_scheduled:
+            self.velocity_flush_scheduled = True
+            self.root.after(VELOCITY_WRITE_INTERVAL_MS, self.flush_velocities)
+
+    def flush_velocities(self):
+        """Write the latest pending velocity of every servo changed since the last flush, in one sync write."""
+        pending, self.pending_velocities = self.pending_velocities, {}
+        self.velocity_flush_scheduled = False
+        if pending and not write_goal_velocities(pending):
+            print(f"Failed to sync write goal velocities {pending}.")
+
+    def poll_status(self):
+        """Apply the status read that finished since the last tick and start the next one.
+        The Sync Read runs on the dxl-io thread; widgets are only touched here, on the Tk thread."""
+        if not self.update_status_active:
+            return
+        future = self.status_future
+        if future is not None and future.done():
+            self.status_future = None
+            try:
+                motion, temperatures, dxl_comm_result = future.result()
+            except Exception as e:
+                print(f"Error reading servo status: {e}")
+            else:
+                check_comm_result(dxl_comm_result, 0)
+                self.show_status(motion, temperatures)
+        if self.status_future is None: # Never more than one read outstanding
+            now = time.monotonic()
+            read_temperature = now >= self.next_temperature_poll
+            if read_temperature:
+                self.next_temperature_poll = now + TEMPERATURE_POLL_INTERVAL_S
+            self.status_future = _submit(lambda: _poll_status(read_temperature))
+        self.root.after(STATUS_POLL_INTERVAL_MS, self.poll_status)
+
+    def show_status(self, motion, temperatures=None):
+        """Show {servo_id: (velocity, load)} and, when read this poll, {servo_id: (temperature,)}
+        in each servo's status labels. A label is only rewritten when its text changes."""
+        for servo_id, (temp,) in (temperatures or {}).items():
+            if self.shown_temperatures.get(servo_id) != temp:
+                self.shown_temperatures[servo_id] = temp
+                self.servo_widgets[servo_id]['current_temp_var'].set(f"Temperature: {temp}°C")
+
+        for servo_id, reading in motion.items():
+            if self.shown_motion.get(servo_id) == reading:
+                continue # Same raw registers as the last poll: nothing to format
+            self.shown_motion[servo_id] = reading
+            velocity, load = reading
+            widgets = self.servo_widgets[servo_id]
             
-            time.sleep(0.1)  # Update every 100ms
+            set_if_changed(widgets['current_velocity_var'], f"Current Velocity: {velocity}")
+            
+            # Convert load to percentage (assuming 2048 is 100%)
+            set_if_changed(widgets['current_load_var'], f"Load: {load * LOAD_PERCENT_PER_UNIT:.1f}%")
 
     def on_closing(self):
         """Clean up when the application is closing."""
         self.update_status_active = False  # Stop status updates
+        self.pending_velocities.clear()  # Drop slider writes that haven't gone out yet
         stop_event.set()  # Signal all threads to stop
-        
-        # Disable torque and close port
-        for servo_id in SERVO_IDS:
-            set_goal_velocity(servo_id, 0)  # Stop all movement
-            set_torque(servo_id, False)  # Disable torque
-        
+        if getattr(self, 'random_thread', None) is not None:
+            self.random_thread.join(timeout=1.0)  # Let it finish its own shutdown writes first
+
+        # Stop every servo, then disable every servo's torque: two packets whatever the servo count
+        write_goal_velocities({servo_id: 0 for servo_id in SERVO_IDS}, force=True)
+        torque_off = sync_write(torque_sync_writer, {servo_id: TORQUE_DISABLE for servo_id in SERVO_IDS})
+        servo_torque[:] = 0 if torque_off else STATE_UNKNOWN
+
+        # Closed on the dxl-io thread so it can't cut off a job still in the queue
         if portHandler.is_open:
-            portHandler.closePort()
-        
+            _run_io(portHandler.closePort)
+
         self.root.destroy()
 
 # --- Random Movement Thread Function ---
-def random_move_thread_func():
+def random_sweeps(rng, settings, servo_count):
+    """Yield (goal_velocities, duration) for each random-move sweep, drawing RANDOM_SAMPLE_BLOCK sweeps at a time.
+    goal_velocities is an int32 array in SERVO_IDS order."""
+    velocity_scale = settings.max_velocity_unit / 100.0
+    while True:
+        speeds = rng.uniform(settings.min_speed_percent, settings.max_speed_percent,
+                             size=(RANDOM_SAMPLE_BLOCK, servo_count)) * velocity_scale
+        speeds *= rng.choice((-1, 1), size=speeds.shape)
+        velocities = np.clip(speeds.astype(np.int32), -settings.max_velocity_unit, settings.max_velocity_unit)
+        durations = rng.uniform(settings.min_duration_s, settings.max_duration_s, size=RANDOM_SAMPLE_BLOCK)
+        yield from zip(velocities, durations.tolist())
+
+def random_move_thread_func(settings=RANDOM_MOVE):
     """Function executed by the random movement thread."""
     print("Random movement thread started.")
+    set_realtime_priority()
     # Initial setup for all servos - no longer needed here as main loop handles it
     # initial_setup_done = {sid: False for sid in SERVO_IDS}
 
-    while not stop_event.is_set():
-        for servo_id in SERVO_IDS:
-            if stop_event.is_set(): break # Check stop flag frequently
-
+    sweeps = random_sweeps(np.random.default_rng(), settings, len(SERVO_IDS))
+
+    # Module globals the loop reads every sweep, bound once as fast locals
+    is_stopped, wait = stop_event.is_set, stop_event.wait
+    velocity_mode = MODE_VELOCITY_CONTROL
+    modes, torques, id_array = servo_mode, servo_torque, servo_ids
+    prepare = prepare_servos
+    write_velocities = write_goal_velocities
+    flatnonzero, monotonic = np.flatnonzero, time.monotonic
+    log_debug = logger.debug
+
+    # Velocity mode and torque for every servo once, before the first sweep; after that the
+    # state cache only sends them again to servos the GUI has switched or released meanwhile
+    try:
+        prepare(np.arange(id_array.size), velocity_mode)
+    except Exception as e:
+        print(f"[RandomMove] Error preparing servos {id_array.tolist()}: {e}")
+
+    while not is_stopped():
+        # --- Every servo's random velocity and the hold time for this sweep, pre-drawn in blocks ---
+        goal_velocities, duration = next(sweeps)
+
+        # Servos already in velocity mode with torque on; only the rest need bus writes
+        ready = (modes == velocity_mode) & (torques == 1)
+        pending = flatnonzero(~ready)
+        if pending.size:
+            # --- Set Mode and Enable Torque Safely ---
+            # Every pending servo in one dxl-io job, so the queue is crossed once per sweep, not per write
             try:
-                # --- Set Mode and Enable Torque Safely ---
-                # Functions handle locking internally now
-                if not set_operating_mode(servo_id, MODE_VELOCITY_CONTROL):
-                    print(f"[RandomMove] Failed to set Velocity Mode for {servo_id}. Skipping.")
-                    stop_event.wait(0.1) # Avoid busy-looping on failure
-                    continue
-                # No need for sleep here, lock release/acquire provides separation
-
-                if not set_torque(servo_id, True):
-                    print(f"[RandomMove] Failed to enable torque for {servo_id}. Skipping.")
-                    stop_event.wait(0.1)
-                    continue
-                # No need for sleep here
-
-                # --- Generate and Set Velocity ---
-                speed_percent = random.uniform(RANDOM_MIN_SPEED_PERCENT, RANDOM_MAX_SPEED_PERCENT)
-                velocity = int((speed_percent / 100.0) * MAX_VELOCITY_UNIT)
-                direction = random.choice([-1, 1])
-                goal_velocity = max(-MAX_VELOCITY_UNIT, min(MAX_VELOCITY_UNIT, velocity * direction))
-
-                print(f"[RandomMove] Setting Servo {servo_id} velocity to {goal_velocity}")
-                set_goal_velocity(servo_id, goal_velocity) # Handles locking internally
-
+                prepared = prepare(pending, velocity_mode)
+                ready[prepared] = True
+                if len(prepared) < pending.size:
+                    wait(0.1) # Avoid busy-looping on failure
             except Exception as e:
-                print(f"[RandomMove] Error controlling servo {servo_id}: {e}")
+                print(f"[RandomMove] Error preparing servos {id_array[pending].tolist()}: {e}")
                 # Avoid flooding logs, maybe wait longer after an error
-                stop_event.wait(0.5)
+                wait(0.5)
 
-            if stop_event.is_set(): break # Check again after potentially long operation
+        if is_stopped(): break # Check after preparing this sweep's servos
 
-        if stop_event.is_set(): break # Check after finishing loop for one servo_id set
+        # --- Set every ready servo's velocity with one sync write ---
+        ready_velocities = dict(zip(id_array[ready].tolist(), goal_velocities[ready].tolist()))
+        log_debug("[RandomMove] Sweep velocities %s, holding for %.2f seconds", ready_velocities, duration)
+        deadline = monotonic() + duration # Hold is timed from the write, not from the draw
+        try:
+            if not write_velocities(ready_velocities):
+                print("[RandomMove] Failed to sync write goal velocities.")
+        except Exception as e:
+            print(f"[RandomMove] Error setting velocities: {e}")
+            wait(0.5)
 
-        # --- Wait for Random Duration ---
-        duration = random.uniform(RANDOM_MIN_DURATION_S, RANDOM_MAX_DURATION_S)
-        print(f"[RandomMove] Waiting for {duration:.2f} seconds...")
-        # Use event wait for duration, allowing quicker exit if stop_event is set
-        stop_event.wait(duration)
+        # --- Wait until the monotonic deadline ---
+        # One event wait for whatever is left, re-armed only if it returns early,
+        # so a stop still exits at once and time spent writing counts toward the hold
+        while not is_stopped():
+            remaining = deadline - monotonic()
+            if remaining <= 0: break
+            wait(remaining)
 
     # --- Cleanup on Thread Exit ---
     print("Random movement thread stopping. Setting velocity to 0 and disabling torque.")
-    for servo_id in SERVO_IDS:
-        try:
-            print(f"[RandomMove Cleanup] Setting velocity 0 for {servo_id}")
-            set_goal_velocity(servo_id, 0) # Handles locking
-            # No need for sleep here
-            print(f"[RandomMove Cleanup] Disabling torque for {servo_id}")
-            set_torque(servo_id, False) # Handles locking
-            # No need for sleep here
-        except Exception as e:
-            print(f"[RandomMove] Warning: Error during cleanup for servo {servo_id}: {e}")
+    try:
+        write_goal_velocities({servo_id: 0 for servo_id in SERVO_IDS}, force=True)
+        torque_off = sync_write(torque_sync_writer, {servo_id: TORQUE_DISABLE for servo_id in SERVO_IDS})
+        servo_torque[:] = 0 if torque_off else STATE_UNKNOWN
+    except Exception as e:
+        print(f"[RandomMove] Warning: Error during cleanup: {e}")
     print("Random movement thread finished.")
 
 # --- Main Execution ---
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get('DYNAMIXEL_LOG_LEVEL', 'INFO').upper(), format='[%(levelname)s] %(message)s')
+
     # --- Set initial mode and disable torque ---
     # Torque MUST be disabled before changing Operating Mode.
     # Use SERVO_IDS, MODE_POSITION_CONTROL, TORQUE_DISABLE from config
-    for servo_id in SERVO_IDS:
-        print(f"\nInitializing Servo ID: {servo_id}")
-        # Disable Torque First (handles lock)
-        set_torque(servo_id, False) # Use False instead of TORQUE_DISABLE
-        # No sleep needed here, lock release/acquire handles separation
-        # Set to Position Control Mode initially (handles lock)
-        set_operating_mode(servo_id, MODE_POSITION_CONTROL)
-        # No sleep needed here
+    # One Sync Write for torque off and one for Position Control Mode, for all servos at once
+    if SERVO_IDS:
+        print(f"\nInitializing Servo IDs: {SERVO_IDS}")
+        set_all_servos(MODE_POSITION_CONTROL, enable=False)
         # Torque remains disabled until user enables it via GUI
 
+    # Return Delay Time is EEPROM, so it is set here while torque is still off.
+    # 0 makes every status packet come back immediately instead of after the 500 us default.
+    # Read first and write only the servos not already at 0 (or unreadable), sparing the EEPROM a write per start.
+    return_delays = _run_io(lambda: {servo_id: packetHandler.read1ByteTxRx(portHandler, servo_id, ADDR_RETURN_DELAY_TIME)
+                                     for servo_id in SERVO_IDS})
+    delayed = {servo_id: 0 for servo_id, (value, dxl_comm_result, dxl_error) in return_delays.items()
+               if dxl_comm_result != COMM_SUCCESS or dxl_error != 0 or value != 0}
+    if delayed and not sync_write(return_delay_sync_writer, delayed):
+        print("Warning: Failed to set Return Delay Time to 0. Continuing.")
+
+    # Goal-velocity packet templates, so the first write from the GUI doesn't build one
+    for servo_id in SERVO_IDS:
+        _sync_write4_template(servo_id, ADDR_GOAL_VELOCITY)
+
+    # Everything built so far (config, SDK objects, servo state arrays) lives for the whole run;
+    # move it to the permanent generation so collections don't rescan it mid-sweep
+    gc.collect()
+    gc.freeze()
+
     print("\nStarting GUI...")
     root = tk.Tk()
     app = DynamixelControlApp(root)
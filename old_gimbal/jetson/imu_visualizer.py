@@ -3,15 +3,16 @@ import time
 import yaml
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
+import matplotlib.style as mplstyle
+from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
+import queue
 import numpy as np
-from PIL import Image, ImageTk, ImageDraw
 import math
-import colorsys
+import struct
 import board
 import busio
 import adafruit_bno055
@@ -20,7 +21,7 @@ import adafruit_bno055
 CONFIG_FILE = 'config.yaml'
 try:
     with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)) # libyaml when available
 except Exception as e:
     print(f"Error loading config file: {e}")
     config = {}
@@ -36,9 +37,24 @@ SUCCESS_COLOR = "#2ecc71"
 DANGER_COLOR = "#e74c3c"
 
 # Performance settings
-REDRAW_INTERVAL = 10  # ms between redraws
+REDRAW_INTERVAL = 33  # ms between redraws (~30 Hz)
+IMU_READ_INTERVAL = 0.01  # s between IMU reads (BNO055 fusion output runs at 100 Hz)
+CAL_POLL_INTERVAL = 1.0  # s between calibration status reads
+SAMPLE_QUEUE_SIZE = 32  # Samples buffered between the IMU thread and the UI; oldest dropped when full
+REDRAW_THRESHOLD = 0.05  # deg; smaller changes in the filtered angles don't trigger a redraw
 DATA_HISTORY_LENGTH = 200  # Number of data points to keep
-QUIVER_SCALE = 30  # Scale of the direction arrow
+ARROW_SCALE = 30  # Scale of the direction arrow
+SHOW_HISTORY_PLOT = False  # Matplotlib 3D history plot; slow on TkAgg, so off unless debugging
+ORIENTATION_VIEW_SIZE = 400  # px, 2D orientation view
+VIEW_AZIMUTH = 45  # deg, fixed camera for the orientation view
+VIEW_ELEVATION = 25  # deg
+
+# BNO055 Euler output registers, read as one block
+BNO055_ADDRESS = 0x28
+I2C_FREQUENCY = 400_000  # Hz; BNO055 supports fast mode
+EULER_REGISTER = b'\x1a'  # EUL_HEADING_LSB; heading, roll, pitch follow as 3 little-endian int16
+EULER_STRUCT = struct.Struct('<3h')
+EULER_LSB_PER_DEGREE = 16.0
 
 class AngleUnwrapper:
     """Handles continuous angle tracking across 0/360 boundary"""
@@ -64,44 +80,103 @@ class AngleUnwrapper:
         self.previous_angle = None
         self.offset = 0
 
+    @staticmethod
+    def unwrap_batch(angles_deg):
+        """Unwrap a whole array of angles (degrees) in one pass, with the same jumps as unwrap()"""
+        angles = np.array(angles_deg, dtype=np.float64)
+        if angles.size > 1:
+            diff = np.diff(angles)
+            steps = np.where(diff > 180, -360.0, np.where(diff < -180, 360.0, 0.0))
+            angles[1:] += np.cumsum(steps)
+        return angles
+
+# The model is fixed: F = [[I, I], [0, I]] (constant rate) and H = [I, 0] (angles measured),
+# so both steps are written out block-wise instead of as generic 6x6 matrix products.
+def kf_predict(state, cov, Q):
+    """Kalman predict step, in place: x = F x, P = F P F^T + Q."""
+    state[0:3] += state[3:6]
+    cov[0:3, 0:3] += cov[0:3, 3:6] + cov[3:6, 0:3] + cov[3:6, 3:6]
+    cov[0:3, 3:6] += cov[3:6, 3:6]
+    cov[3:6, 0:3] += cov[3:6, 3:6]
+    cov += Q
+
+def kf_update(state, cov, measurement, R):
+    """Kalman update step, in place: S = P00 + R, K = P H^T S^-1, x += K (z - x0), P -= K H P."""
+    S = cov[0:3, 0:3] + R
+    PHt = cov[:, 0:3].copy()
+    # K = PHt S^-1, via a 3x3 solve (K^T = S^-T PHt^T) rather than forming the inverse
+    K = np.ascontiguousarray(np.linalg.solve(np.ascontiguousarray(S.T), np.ascontiguousarray(PHt.T)).T)
+    state += np.dot(K, measurement - state[0:3])
+    cov -= np.dot(K, np.ascontiguousarray(cov[0:3, :]))
+
 class KalmanFilter3D:
     """3D Kalman filter for orientation data"""
+    _steps = None  # (predict, update), resolved on first instantiation
+    
+    @classmethod
+    def _get_steps(cls):
+        """JIT-compile the steps with numba if it is installed. numba is imported here rather than at
+        module load so that paths which never build a filter don't pay for the import."""
+        if cls._steps is None:
+            try:
+                from numba import njit
+            except ImportError:
+                cls._steps = (kf_predict, kf_update)
+                return cls._steps
+            try:
+                cls._steps = (
+                    njit("void(f8[::1], f8[:, ::1], f8[:, ::1])", cache=True)(kf_predict),
+                    njit("void(f8[::1], f8[:, ::1], f8[::1], f8[:, ::1])", cache=True)(kf_update),
+                )
+            except Exception as e:
+                # e.g. numba's np.linalg needs SciPy's LAPACK; the NumPy steps give the same results
+                print(f"Could not JIT-compile the Kalman filter ({e}), using NumPy instead")
+                cls._steps = (kf_predict, kf_update)
+        return cls._steps
+    
     def __init__(self, process_noise=0.1, measurement_noise=1.0):
+        self._predict, self._update = self._get_steps()
         self.state = np.zeros(6)  # [yaw, pitch, roll, yaw_rate, pitch_rate, roll_rate]
         self.covariance = np.eye(6) * 1000
         self.Q = np.eye(6) * process_noise
         self.R = np.eye(3) * measurement_noise
-        self.F = np.eye(6)
-        self.F[0:3, 3:6] = np.eye(3)
-        self.H = np.zeros((3, 6))
-        self.H[0:3, 0:3] = np.eye(3)
         self.dt = 0.01
         
     def predict(self):
-        self.state = self.F @ self.state
-        self.covariance = self.F @ self.covariance @ self.F.T + self.Q
+        self._predict(self.state, self.covariance, self.Q)
         
     def update(self, measurement):
-        K = self.covariance @ self.H.T @ np.linalg.inv(self.H @ self.covariance @ self.H.T + self.R)
-        innovation = measurement - self.H @ self.state
-        self.state = self.state + K @ innovation
-        self.covariance = (np.eye(6) - K @ self.H) @ self.covariance
+        self._update(self.state, self.covariance, np.asarray(measurement, dtype=np.float64), self.R)
         return self.state[0:3]
 
 class BNO055_IMU:
     """Interface for BNO055 IMU sensor"""
+    _unpack_euler = EULER_STRUCT.unpack_from  # Bound once; unpacks straight from the reused buffer
+
     def __init__(self):
-        self.i2c = busio.I2C(board.SCL, board.SDA)
+        self.i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
         try:
-            self.sensor = adafruit_bno055.BNO055_I2C(self.i2c)
+            self.sensor = adafruit_bno055.BNO055_I2C(self.i2c, address=BNO055_ADDRESS)
             print("BNO055 initialized successfully")
         except Exception as e:
             print(f"Error initializing BNO055: {e}")
             raise
+        self._i2c_device = self.sensor.i2c_device
+        self._euler_buf = bytearray(6)
+
+    def read_euler_fast(self):
+        """Read heading, roll, pitch (degrees) with a single 6-byte I2C transaction"""
+        with self._i2c_device as device:  # Locks the bus for the one write-then-read
+            device.write_then_readinto(EULER_REGISTER, self._euler_buf)
+        heading, roll, pitch = self._unpack_euler(self._euler_buf)
+        return heading / EULER_LSB_PER_DEGREE, roll / EULER_LSB_PER_DEGREE, pitch / EULER_LSB_PER_DEGREE
 
     def read_euler(self):
         try:
-            euler = self.sensor.euler
+            try:
+                euler = self.read_euler_fast()
+            except Exception:
+                euler = self.sensor.euler  # Fall back to the driver's register access
             if euler is not None:
                 yaw, roll, pitch = euler
                 yaw = (yaw + 360) % 360
@@ -136,6 +211,64 @@ class BNO055_IMU:
         except Exception as e:
             print(f"Error closing I2C: {e}")
 
+def _view_projection(azimuth, elevation):
+    """2x3 matrix taking world (x, y, z) to screen (right, up) for a camera at azimuth/elevation (deg)"""
+    az, el = math.radians(azimuth), math.radians(elevation)
+    rot_z = np.array([[math.cos(az), -math.sin(az), 0],
+                      [math.sin(az), math.cos(az), 0],
+                      [0, 0, 1]])
+    rot_x = np.array([[1, 0, 0],
+                      [0, math.cos(el), -math.sin(el)],
+                      [0, math.sin(el), math.cos(el)]])
+    return (rot_x @ rot_z)[[0, 2]]
+
+class OrientationView:
+    """Live orientation indicator on a plain tk.Canvas: a cube and direction arrow rotated by
+    yaw/pitch/roll and projected in NumPy, updated by moving existing canvas items"""
+    # Cube corners indexed by bits (x, y, z); edges join corners differing in one bit
+    CORNERS = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64) * 0.5
+    EDGES = [(i, j) for i in range(8) for j in range(i + 1, 8) if bin(i ^ j).count('1') == 1]
+    
+    def __init__(self, parent, size=ORIENTATION_VIEW_SIZE):
+        self.canvas = tk.Canvas(parent, width=size, height=size, bg=DARKER_BG, highlightthickness=0)
+        # Model points: 8 corners, then arrow start (origin) and tip along the body x axis
+        self.points = np.vstack((self.CORNERS, [[0, 0, 0], [1.2, 0, 0]]))
+        self.view = _view_projection(VIEW_AZIMUTH, VIEW_ELEVATION)
+        self.rotation = np.empty((3, 3))
+        self.edge_items = [self.canvas.create_line(0, 0, 0, 0, fill=HIGHLIGHT, width=2) for _ in self.EDGES]
+        self.arrow_item = self.canvas.create_line(0, 0, 0, 0, fill=DANGER_COLOR, width=3, arrow=tk.LAST)
+        self.center = size / 2
+        self.scale = size / 3.5
+        self.canvas.bind('<Configure>', self._on_resize)
+    
+    def _on_resize(self, event):
+        self.center = min(event.width, event.height) / 2
+        self.scale = min(event.width, event.height) / 3.5
+    
+    def update(self, yaw, pitch, roll):
+        """Redraw for the given orientation (degrees); yaw about z, pitch nose-up, roll about x"""
+        yaw_rad, pitch_rad, roll_rad = math.radians(yaw), math.radians(pitch), math.radians(roll)
+        cy, sy = math.cos(yaw_rad), math.sin(yaw_rad)
+        cp, sp = math.cos(pitch_rad), math.sin(pitch_rad)
+        cr, sr = math.cos(roll_rad), math.sin(roll_rad)
+        
+        # R = Rz(yaw) Ry(-pitch) Rx(roll); R @ [1, 0, 0] matches the history plot's arrow direction
+        r = self.rotation
+        r[0, 0], r[0, 1], r[0, 2] = cy * cp, -cy * sp * sr - sy * cr, -cy * sp * cr + sy * sr
+        r[1, 0], r[1, 1], r[1, 2] = sy * cp, -sy * sp * sr + cy * cr, -sy * sp * cr - cy * sr
+        r[2, 0], r[2, 1], r[2, 2] = sp, cp * sr, cp * cr
+        
+        # Project all points at once, then flip y for screen coordinates
+        screen = self.points @ (self.view @ r).T
+        screen *= self.scale
+        screen[:, 1] *= -1
+        screen += self.center
+        
+        coords = self.canvas.coords
+        for item, (i, j) in zip(self.edge_items, self.EDGES):
+            coords(item, screen[i, 0], screen[i, 1], screen[j, 0], screen[j, 1])
+        coords(self.arrow_item, screen[8, 0], screen[8, 1], screen[9, 0], screen[9, 1])
+
 class IMUVisualizer:
     """Main visualization class"""
     def __init__(self, root):
@@ -150,18 +283,35 @@ class IMUVisualizer:
             print(f"Failed to initialize BNO055: {e}")
             sys.exit(1)
 
-        # Setup data storage
-        self.x_data, self.y_data, self.z_data = [], [], []
-        self.x_filtered, self.y_filtered, self.z_filtered = [], [], []
-        self.kalman_filter = KalmanFilter3D()
-        self.yaw_unwrapper = AngleUnwrapper()
+        # Setup data storage: ring buffer of raw yaw/pitch/roll and filtered yaw/pitch/roll
+        self._buf = np.empty((6, DATA_HISTORY_LENGTH), dtype=np.float32)
+        self._head = 0  # Column the next sample goes into
+        self._count = 0  # Number of valid columns
+        self._plot_buf = np.empty((6, DATA_HISTORY_LENGTH), dtype=np.float32)  # History unrolled oldest-first
+        self._ring_positions = np.arange(DATA_HISTORY_LENGTH)
+        self._dir_out = np.empty(3)  # Arrow direction, filled in place by _fill_dir
+        self._arrow_xyz = np.empty((3, 2))  # Arrow x/y/z rows, start and end columns
+        self.kalman_filter = None  # Built and owned by the IMU thread
+        self.yaw_unwrapper = AngleUnwrapper()  # Owned by the IMU thread
+        
+        # IMU thread -> UI handoff: (raw + filtered sample, calibration status or None)
+        self._sample_q = queue.Queue(maxsize=SAMPLE_QUEUE_SIZE)
+        self._zero_requested = threading.Event()
+        self._continuous_yaw = True
+        
+        # Redraw gating: views are only redrawn when the filtered angles have moved
+        self._last_drawn = None
+        self._plot_dirty = False
+        self._animation_paused = False
         
         # Setup UI
         self.setup_ui()
         
-        # Start update loop
+        # Start the IMU thread and the redraw loop
         self.update_active = True
-        self.root.after(10, self.update_loop)
+        self._imu_thread = threading.Thread(target=self._imu_worker, daemon=True)
+        self._imu_thread.start()
+        self.root.after(REDRAW_INTERVAL, self.update_loop)
 
     def setup_ui(self):
         """Setup the user interface"""
@@ -169,8 +319,11 @@ class IMUVisualizer:
         self.main_frame = ttk.Frame(self.root, padding="10")
         self.main_frame.grid(row=0, column=0, sticky="nsew")
         
-        # Setup matplotlib figure
-        self.setup_plot()
+        # Setup orientation view, plus the matplotlib history plot if enabled
+        self.orientation_view = OrientationView(self.main_frame)
+        self.orientation_view.canvas.grid(row=0, column=1, sticky="nsew")
+        if SHOW_HISTORY_PLOT:
+            self.setup_plot()
         
         # Setup controls
         self.setup_controls()
@@ -179,12 +332,13 @@ class IMUVisualizer:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         self.main_frame.columnconfigure(1, weight=1)
+        self.main_frame.columnconfigure(2, weight=1)
         self.main_frame.rowconfigure(0, weight=1)
 
     def setup_plot(self):
         """Setup the matplotlib plot"""
-        plt.style.use('dark_background')
-        self.fig = plt.figure(figsize=(8, 6), facecolor=DARK_BG)
+        mplstyle.use('dark_background')
+        self.fig = Figure(figsize=(8, 6), facecolor=DARK_BG)
         self.ax = self.fig.add_subplot(111, projection='3d')
         self.ax.set_facecolor(DARKER_BG)
         
@@ -192,8 +346,10 @@ class IMUVisualizer:
         self.line, = self.ax.plot([], [], [], lw=2, color=HIGHLIGHT)
         self.filtered_line, = self.ax.plot([], [], [], lw=2, color=SUCCESS_COLOR)
         self.dot = self.ax.plot([], [], [], 'o', color=ACCENT_COLOR, markersize=8)[0]
-        self.quiver = self.ax.quiver([0], [0], [0], [0], [0], [1], color=DANGER_COLOR,
-                                   length=QUIVER_SCALE, normalize=True)
+        self.arrow, = self.ax.plot([0, 0], [0, 0], [0, ARROW_SCALE], lw=2, color=DANGER_COLOR)
+        
+        # Dynamic artists, blitted by the animation over a cached background
+        self.animated_artists = (self.line, self.filtered_line, self.dot, self.arrow)
         
         # Set labels and limits
         self.ax.set_xlim(-180, 180)
@@ -205,8 +361,12 @@ class IMUVisualizer:
         
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.main_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=2, sticky="nsew")
+        
+        # FuncAnimation owns the blitting (background capture on full draws, artist redraws)
+        self.animation = FuncAnimation(self.fig, self._animate, interval=REDRAW_INTERVAL,
+                                       blit=True, cache_frame_data=False)
         self.canvas.draw()
-        self.canvas.get_tk_widget().grid(row=0, column=1, sticky="nsew")
 
     def setup_controls(self):
         """Setup control panel"""
@@ -216,7 +376,8 @@ class IMUVisualizer:
         # Continuous yaw tracking
         self.continuous_yaw_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(control_frame, text="Continuous Yaw",
-                       variable=self.continuous_yaw_var).pack(pady=5)
+                       variable=self.continuous_yaw_var,
+                       command=self.on_continuous_yaw_toggle).pack(pady=5)
         
         # Zero IMU button
         ttk.Button(control_frame, text="Zero IMU",
@@ -230,75 +391,130 @@ class IMUVisualizer:
         self.angles_var = tk.StringVar(value="Yaw: 0°\nPitch: 0°\nRoll: 0°")
         ttk.Label(control_frame, textvariable=self.angles_var).pack(pady=5)
 
-    def update_loop(self):
-        """Main update loop"""
-        if not self.update_active:
-            return
-            
-        # Read from IMU
-        euler = self.imu.read_euler()
-        if euler:
-            yaw, pitch, roll = euler
-            
-            # Apply continuous yaw if enabled
-            if self.continuous_yaw_var.get():
-                yaw = self.yaw_unwrapper.unwrap(yaw)
-            
-            # Apply Kalman filter
-            measurement = np.array([yaw, pitch, roll])
-            self.kalman_filter.predict()
-            filtered = self.kalman_filter.update(measurement)
+    def _imu_worker(self):
+        """Read the IMU and run the filter at the sensor rate, handing samples to the UI via the queue"""
+        # The first filter compiles the numba steps (or loads them from the on-disk cache),
+        # which can take seconds; building it here keeps that off the Tk thread
+        self.kalman_filter = KalmanFilter3D()
+        next_cal = 0.0
+        while self.update_active:
+            start = time.monotonic()
             
-            # Update data arrays
-            self.x_data.append(yaw)
-            self.y_data.append(pitch)
-            self.z_data.append(roll)
+            # Zeroing touches the sensor, so it runs here rather than on the Tk thread
+            if self._zero_requested.is_set():
+                self._zero_requested.clear()
+                if self.imu.zero_imu():
+                    self.kalman_filter = KalmanFilter3D()
+                    self.yaw_unwrapper.reset()
             
-            self.x_filtered.append(filtered[0])
-            self.y_filtered.append(filtered[1])
-            self.z_filtered.append(filtered[2])
+            euler = self.imu.read_euler()
+            if euler:
+                yaw, pitch, roll = euler
+                
+                # Apply continuous yaw if enabled
+                if self._continuous_yaw:
+                    yaw = self.yaw_unwrapper.unwrap(yaw)
+                
+                # Apply Kalman filter
+                self.kalman_filter.predict()
+                filtered = self.kalman_filter.update((yaw, pitch, roll))
+                
+                cal = None
+                if start >= next_cal:
+                    cal = self.imu.get_calibration_status()
+                    next_cal = start + CAL_POLL_INTERVAL
+                
+                item = ((yaw, pitch, roll, *filtered), cal)
+                try:
+                    self._sample_q.put_nowait(item)
+                except queue.Full:
+                    # UI is behind: drop the oldest sample rather than block the reads
+                    try:
+                        self._sample_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._sample_q.put_nowait(item)
             
-            # Limit history
-            if len(self.x_data) > DATA_HISTORY_LENGTH:
-                self.x_data = self.x_data[-DATA_HISTORY_LENGTH:]
-                self.y_data = self.y_data[-DATA_HISTORY_LENGTH:]
-                self.z_data = self.z_data[-DATA_HISTORY_LENGTH:]
-                self.x_filtered = self.x_filtered[-DATA_HISTORY_LENGTH:]
-                self.y_filtered = self.y_filtered[-DATA_HISTORY_LENGTH:]
-                self.z_filtered = self.z_filtered[-DATA_HISTORY_LENGTH:]
+            time.sleep(max(0.0, IMU_READ_INTERVAL - (time.monotonic() - start)))
+
+    def update_loop(self):
+        """Main update loop: drain samples from the IMU thread and redraw"""
+        if not self.update_active:
+            return
+        
+        latest = None
+        cal = None
+        while True:
+            try:
+                sample, sample_cal = self._sample_q.get_nowait()
+            except queue.Empty:
+                break
             
-            # Update plot
-            self.update_plot()
+            # Write the sample into the ring buffer, overwriting the oldest once full
+            self._buf[:, self._head] = sample
+            self._head = (self._head + 1) % DATA_HISTORY_LENGTH
+            self._count = min(self._count + 1, DATA_HISTORY_LENGTH)
+            latest = sample
+            if sample_cal is not None:
+                cal = sample_cal
+        
+        if latest is not None:
+            filtered = latest[3:6]
+            if self._last_drawn is None or max(abs(a - b) for a, b in zip(filtered, self._last_drawn)) > REDRAW_THRESHOLD:
+                self._last_drawn = filtered
+                # Update orientation view; the history plot is redrawn by its FuncAnimation
+                self.orientation_view.update(*filtered)
+                self._plot_dirty = True
+                if self._animation_paused:
+                    self._animation_paused = False
+                    self.animation.resume()
             
             # Update status displays
-            self.update_status(filtered)
+            self.update_status(latest[3:6], cal)
         
         # Schedule next update
-        self.root.after(10, self.update_loop)
+        self.root.after(REDRAW_INTERVAL, self.update_loop)
 
     def update_plot(self):
         """Update the plot with new data"""
-        if len(self.x_data) > 0:
+        if self._count > 0:
+            # Unroll the ring oldest-first into the reused plot buffer
+            n = self._count
+            history = self._plot_buf[:, :n]
+            np.take(self._buf, self._head - n + self._ring_positions[:n], axis=1, out=history, mode='wrap')
+            xs, ys, zs, xf, yf, zf = history
+            
             # Update lines
-            self.line.set_data(self.x_data, self.y_data)
-            self.line.set_3d_properties(self.z_data)
+            self.line.set_data(xs, ys)
+            self.line.set_3d_properties(zs)
             
-            self.filtered_line.set_data(self.x_filtered, self.y_filtered)
-            self.filtered_line.set_3d_properties(self.z_filtered)
+            self.filtered_line.set_data(xf, yf)
+            self.filtered_line.set_3d_properties(zf)
             
             # Update current position dot
-            self.dot.set_data([self.x_filtered[-1]], [self.y_filtered[-1]])
-            self.dot.set_3d_properties([self.z_filtered[-1]])
+            self.dot.set_data(xf[-1:], yf[-1:])
+            self.dot.set_3d_properties(zf[-1:])
             
             # Update direction arrow
-            pos = np.array([[self.x_filtered[-1], self.y_filtered[-1], self.z_filtered[-1]]])
-            direction = self.euler_to_vector(self.x_filtered[-1], self.y_filtered[-1], self.z_filtered[-1])
-            self.quiver.set_segments([np.concatenate((pos, pos + direction * QUIVER_SCALE))])
-            
-            # Redraw
-            self.canvas.draw()
+            xyz = self._arrow_xyz
+            xyz[:, 0] = history[3:6, -1]
+            self._fill_dir(xf[-1], yf[-1])
+            np.multiply(self._dir_out, ARROW_SCALE, out=xyz[:, 1])
+            xyz[:, 1] += xyz[:, 0]
+            self.arrow.set_data_3d(xyz[0], xyz[1], xyz[2])
 
-    def update_status(self, filtered):
+    def _animate(self, frame):
+        """FuncAnimation callback: refresh the history plot artists from the ring buffer,
+        pausing the animation while there is nothing new to draw (update_loop resumes it)"""
+        if self._plot_dirty:
+            self._plot_dirty = False
+            self.update_plot()
+        elif self._count > 0:
+            self._animation_paused = True
+            self.animation.pause()
+        return self.animated_artists
+
+    def update_status(self, filtered, cal=None):
         """Update status displays"""
         # Update angles display
         self.angles_var.set(
@@ -307,8 +523,7 @@ class IMUVisualizer:
             f"Roll: {filtered[2]:.1f}°"
         )
         
-        # Update calibration status
-        cal = self.imu.get_calibration_status()
+        # Update calibration status (polled by the IMU thread)
         if cal:
             sys, gyro, accel, mag = cal
             self.cal_status_var.set(
@@ -320,27 +535,30 @@ class IMUVisualizer:
             )
 
     def zero_imu(self):
-        """Zero the IMU"""
-        if self.imu.zero_imu():
-            self.kalman_filter = KalmanFilter3D()
-            self.yaw_unwrapper.reset()
+        """Zero the IMU (carried out by the IMU thread)"""
+        self._zero_requested.set()
 
-    @staticmethod
-    def euler_to_vector(yaw, pitch, roll):
-        """Convert Euler angles to direction vector"""
+    def on_continuous_yaw_toggle(self):
+        self._continuous_yaw = self.continuous_yaw_var.get()
+
+    def _fill_dir(self, yaw, pitch):
+        """Write the direction vector for yaw/pitch (degrees) into self._dir_out (roll doesn't move it)"""
         yaw_rad = math.radians(yaw)
         pitch_rad = math.radians(pitch)
-        roll_rad = math.radians(roll)
-        
-        x = math.cos(yaw_rad) * math.cos(pitch_rad)
-        y = math.sin(yaw_rad) * math.cos(pitch_rad)
-        z = math.sin(pitch_rad)
+        cos_pitch = math.cos(pitch_rad)
         
-        return np.array([x, y, z])
+        out = self._dir_out
+        out[0] = math.cos(yaw_rad) * cos_pitch
+        out[1] = math.sin(yaw_rad) * cos_pitch
+        out[2] = math.sin(pitch_rad)
 
     def cleanup(self):
         """Clean up resources"""
         self.update_active = False
+        if hasattr(self, 'animation'):
+            self.animation.event_source.stop()
+        if hasattr(self, '_imu_thread'):
+            self._imu_thread.join(timeout=1.0)
         if hasattr(self, 'imu'):
             self.imu.close()
         print("IMU Visualizer closed")
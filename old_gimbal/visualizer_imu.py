@@ -1,111 +1,33 @@
 import serial
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import re
+import matplotlib.style as mplstyle
+from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D  # for 3D plotting
 import tkinter as tk
 from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
+import queue
 import time
 import numpy as np
 import serial.tools.list_ports
-from PIL import Image, ImageTk, ImageDraw  # For custom widget rendering
 import math
-import colorsys
+from imu_common import (
+    DARK_BG, DARKER_BG, HIGHLIGHT, TEXT_COLOR, ACCENT_COLOR, SUCCESS_COLOR, DANGER_COLOR,
+    parse_euler, decimate_history, AngleUnwrapper, KalmanFilter3D,
+)
 
 # Performance settings
 REDRAW_INTERVAL = 10  # ms between redraws (higher = less CPU usage but less smooth)
 DATA_HISTORY_LENGTH = 200  # Reduce history length to improve performance
 QUIVER_SCALE = 30  # Scale of the direction arrow
-
-# Angle unwrapping for yaw (prevents discontinuities at 0/360)
-class AngleUnwrapper:
-    def __init__(self):
-        self.previous_angle = None
-        self.offset = 0
-        
-    def unwrap(self, angle):
-        """Unwrap angle to avoid jumps when crossing 0/360 boundary"""
-        # First angle we get, just return it
-        if self.previous_angle is None:
-            self.previous_angle = angle
-            return angle
-        
-        # Detect if we've crossed the discontinuity
-        diff = angle - self.previous_angle
-        
-        # If the difference is more than 180 degrees, we've wrapped around
-        if diff > 180:
-            self.offset -= 360
-        elif diff < -180:
-            self.offset += 360
-            
-        # Save current angle for next comparison
-        self.previous_angle = angle
-        
-        # Return unwrapped angle
-        return angle + self.offset
-    
-    def reset(self):
-        """Reset the unwrapper"""
-        self.previous_angle = None
-        self.offset = 0
-
-# Kalman Filter implementation for 3D orientation
-class KalmanFilter3D:
-    def __init__(self, process_noise=0.1, measurement_noise=1.0):
-        # State vector: [yaw, pitch, roll, yaw_rate, pitch_rate, roll_rate]
-        self.state = np.zeros(6)
-        self.covariance = np.eye(6) * 1000  # Initial uncertainty
-        
-        # Process noise covariance
-        self.Q = np.eye(6) * process_noise
-        
-        # Measurement noise covariance
-        self.R = np.eye(3) * measurement_noise
-        
-        # State transition matrix (assuming constant velocity model)
-        self.F = np.eye(6)
-        self.F[0:3, 3:6] = np.eye(3)  # Position depends on velocity
-        
-        # Measurement matrix (we only measure position)
-        self.H = np.zeros((3, 6))
-        self.H[0:3, 0:3] = np.eye(3)
-        
-        # Time step (in seconds)
-        self.dt = 0.01  # 10ms update rate
-        
-    def predict(self):
-        # Predict state
-        self.state = self.F @ self.state
-        
-        # Predict covariance
-        self.covariance = self.F @ self.covariance @ self.F.T + self.Q
-        
-    def update(self, measurement):
-        # Kalman gain
-        K = self.covariance @ self.H.T @ np.linalg.inv(self.H @ self.covariance @ self.H.T + self.R)
-        
-        # Update state
-        innovation = measurement - self.H @ self.state
-        self.state = self.state + K @ innovation
-        
-        # Update covariance
-        self.covariance = (np.eye(6) - K @ self.H) @ self.covariance
-        
-        # Return filtered measurement
-        return self.state[0:3]
-
-# Custom theme and style constants
-DARK_BG = "#2E2E2E"
-DARKER_BG = "#252525"
-HIGHLIGHT = "#3498db"
-TEXT_COLOR = "#FFFFFF"
-ACCENT_COLOR = "#F39C12"
-SLIDER_COLOR = "#3498db"
-SUCCESS_COLOR = "#2ecc71"
-DANGER_COLOR = "#e74c3c"
+PLOT_MAX_POINTS = 64  # Most history samples drawn per trace; more are not resolvable on screen
+PLOT_RANGE_STEP = 10  # Auto-resize limits snap up to multiples of this many degrees
+MAX_LINES_PER_TICK = 32  # Samples drained per update_plot tick before yielding to Tk
+SAMPLE_QUEUE_SIZE = 256  # Parsed samples buffered between the serial thread and Tk
+UPDATE_INTERVAL_ACTIVE = 10  # ms between update_plot ticks while samples are arriving
+UPDATE_INTERVAL_IDLE = 100  # ms between update_plot ticks after a tick with no samples
+ARROW_UPDATE_THRESHOLD = 1.0  # deg; smaller orientation changes don't move the XYZ arrows
+SERIAL_MAX_LINE_LENGTH = 1024  # Drop a partial serial line that grows past this
 
 # Find Arduino port automatically
 def find_port():
@@ -171,17 +93,38 @@ except serial.SerialException as e:
         print(f" - {port.device}: {port.description}")
     raise
 
-# Lists to hold Euler angle data: x (yaw), y (pitch), z (roll)
-x_data, y_data, z_data = [], [], []
-x_filtered, y_filtered, z_filtered = [], [], []
+# Ring buffer of the last DATA_HISTORY_LENGTH samples. Rows: raw yaw, pitch, roll, then filtered yaw, pitch, roll
+history = np.zeros((6, DATA_HISTORY_LENGTH), dtype=np.float32)
+history_write_idx = 0  # Column the next sample goes into
+history_count = 0  # Number of valid columns
+ring_positions = np.arange(DATA_HISTORY_LENGTH)
+
+# Samples drained in one tick are staged here, then written into the ring in one vectorized copy
+batch_scratch = np.empty((MAX_LINES_PER_TICK, 6), dtype=np.float32)
+
+# Preallocated float32 arrays the history is unrolled into (oldest first) before handing it to matplotlib
+plot_buffer = np.empty((6, DATA_HISTORY_LENGTH), dtype=np.float32)
+
+def ingest_batch(k):
+    """Append the first k rows of batch_scratch to the history ring."""
+    global history_write_idx, history_count
+    columns = (history_write_idx + ring_positions[:k]) % DATA_HISTORY_LENGTH
+    history[:, columns] = batch_scratch[:k].T
+    history_write_idx = (history_write_idx + k) % DATA_HISTORY_LENGTH
+    history_count = min(history_count + k, DATA_HISTORY_LENGTH)
+
+def unroll_history():
+    """Copy the ring into plot_buffer in chronological order and return the valid (6, n) view."""
+    n = history_count
+    start = history_write_idx - n
+    out = plot_buffer[:, :n]
+    np.take(history, start + ring_positions[:n], axis=1, out=out, mode='wrap')
+    return out
 
 # Initialize Kalman filter and angle unwrapper
 kalman_filter = KalmanFilter3D(process_noise=0.1, measurement_noise=1.0)
 yaw_unwrapper = AngleUnwrapper()
 
-# Regular expression to parse serial data of the form: "Euler: 45.0, -30.0, 10.0"
-euler_regex = re.compile(r"Euler:\s*([\d\.-]+),\s*([\d\.-]+),\s*([\d\.-]+)")
-
 # Auto-resize plot flag
 auto_resize = True
 plot_range = 180  # Initial plot range
@@ -189,7 +132,9 @@ show_controls = True  # Control panel visibility
 
 # Flags for optimization
 redraw_needed = False
+full_redraw_needed = False  # Axes changed: re-render everything and recapture the blit background
 last_redraw_time = 0
+blit_background = None  # Figure pixels without the animated artists, captured after each full draw
 
 # Create main Tkinter window
 root = tk.Tk()
@@ -269,8 +214,8 @@ paned_window.add(plot_frame, weight=3)
 paned_window.add(control_frame, weight=1)
 
 # Create matplotlib figure with dark theme
-plt.style.use('dark_background')
-fig = plt.figure(figsize=(8, 6), facecolor=DARK_BG)
+mplstyle.use('dark_background')
+fig = Figure(figsize=(8, 6), facecolor=DARK_BG)
 ax = fig.add_subplot(111, projection='3d')
 ax.set_facecolor(DARKER_BG)
 
@@ -287,12 +232,18 @@ quiver = ax.quiver([0], [0], [0], [0], [0], [1], color=DANGER_COLOR,
 ax.set_xlim(-plot_range, plot_range)
 ax.set_ylim(-plot_range, plot_range)
 ax.set_zlim(-plot_range, plot_range)
+ax.set_autoscale_on(False)  # Limits are managed by update_plot_limits only
 ax.set_xlabel("Yaw", color=TEXT_COLOR)
 ax.set_ylabel("Pitch", color=TEXT_COLOR)
 ax.set_zlabel("Roll", color=TEXT_COLOR)
 ax.tick_params(colors=TEXT_COLOR)
 ax.grid(True, linestyle='--', alpha=0.3)
 
+# Artists that change every sample are drawn on top of a cached background (blitting)
+animated_artists = (line, filtered_line, dot, quiver)
+for artist in animated_artists:
+    artist.set_animated(True)
+
 # Embed matplotlib figure in Tkinter
 canvas_frame = ttk.Frame(plot_frame)
 canvas_frame.grid(column=0, row=0, sticky=(tk.N, tk.W, tk.E, tk.S))
@@ -301,6 +252,21 @@ canvas_frame.rowconfigure(0, weight=1)
 
 # Create the matplotlib canvas
 figure_canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
+
+def draw_animated_artists():
+    """Draw the animated artists over the current canvas contents."""
+    for artist in animated_artists:
+        if hasattr(artist, 'do_3d_projection'):  # 3D collections are projected by the axes, not in draw()
+            artist.do_3d_projection()
+        ax.draw_artist(artist)
+
+def on_full_draw(event):
+    """After any full draw (resize, view rotation, limit change) recapture the background and overlay the artists."""
+    global blit_background
+    blit_background = figure_canvas.copy_from_bbox(fig.bbox)
+    draw_animated_artists()
+
+figure_canvas.mpl_connect('draw_event', on_full_draw)
 figure_canvas.draw()
 canvas_widget = figure_canvas.get_tk_widget()
 canvas_widget.grid(column=0, row=0, sticky=(tk.N, tk.W, tk.E, tk.S))
@@ -335,7 +301,7 @@ def configure_paned_window(event=None):
             readouts_frame.update_idletasks()
             # Update the XYZ arrows visualization
             if hasattr(xyz_arrows, '_last_yaw'):
-                xyz_arrows.update_arrows(xyz_arrows._last_yaw, xyz_arrows._last_pitch, xyz_arrows._last_roll)
+                xyz_arrows.draw_arrows(xyz_arrows._last_yaw, xyz_arrows._last_pitch, xyz_arrows._last_roll)
 
 # Bind to configure event to ensure proper sizing
 paned_window.bind("<Configure>", configure_paned_window)
@@ -370,6 +336,23 @@ redraw_slider.pack(fill=tk.X, pady=5)
 redraw_value_label = ttk.Label(performance_frame, textvariable=redraw_var)
 redraw_value_label.pack(anchor=tk.E)
 
+# Cached copy of redraw_var for redraw_if_needed; slider drags are coalesced into one update per 100 ms
+redraw_interval_ms = REDRAW_INTERVAL
+redraw_update_pending = False
+
+def apply_redraw_interval():
+    global redraw_interval_ms, redraw_update_pending
+    redraw_update_pending = False
+    redraw_interval_ms = redraw_var.get()
+
+def on_redraw_var_changed(*args):
+    global redraw_update_pending
+    if not redraw_update_pending:
+        redraw_update_pending = True
+        root.after(100, apply_redraw_interval)
+
+redraw_var.trace_add("write", on_redraw_var_changed)
+
 # Controls tab content
 controls_tab.columnconfigure(0, weight=1)
 
@@ -392,17 +375,13 @@ continuous_yaw_check.pack(anchor=tk.W, pady=5)
 
 # Reset plot button
 def reset_plot():
-    global x_data, y_data, z_data, x_filtered, y_filtered, z_filtered
-    x_data.clear()
-    y_data.clear()
-    z_data.clear()
-    x_filtered.clear()
-    y_filtered.clear()
-    z_filtered.clear()
+    global history_write_idx, history_count
+    history_write_idx = 0
+    history_count = 0
     # Reset angle unwrapper
     yaw_unwrapper.reset()
     update_plot_limits()
-    schedule_redraw()
+    schedule_redraw(full=True)
 
 ttk.Button(plot_frame_controls, text="Reset Plot", command=reset_plot).pack(anchor=tk.W, pady=5, fill=tk.X)
 
@@ -412,15 +391,29 @@ imu_frame.pack(fill=tk.X, pady=10)
 imu_frame.columnconfigure(0, weight=1)
 
 # Zero IMU button with better styling
-def zero_imu():
-    ser.write(b"ZERO\n")
-    ser.flush()
+# Repeated Zero IMU clicks within 100 ms are coalesced into one serial write
+zero_pending = False
+
+def send_commands(*commands):
+    """Send one or more newline-terminated commands to the Arduino in a single write.
+    No flush(): it would block the Tk thread until the UART drains, and write() already hands the bytes to the OS."""
+    ser.write(b"".join(commands))
+
+def send_zero():
+    global zero_pending, kalman_filter
+    zero_pending = False
+    send_commands(b"ZERO\n")
     print("Zeroing IMU")
     # Reset Kalman filter
-    global kalman_filter, yaw_unwrapper
     kalman_filter = KalmanFilter3D(process_noise=0.1, measurement_noise=1.0)
     yaw_unwrapper.reset()
 
+def zero_imu():
+    global zero_pending
+    if not zero_pending:
+        zero_pending = True
+        root.after(100, send_zero)
+
 ttk.Button(imu_frame, text="Zero IMU", command=zero_imu).pack(fill=tk.X, pady=5)
 
 # Status frame with better visualization
@@ -455,71 +448,57 @@ style.configure("Yaw.Horizontal.TProgressbar", background=HIGHLIGHT)
 style.configure("Pitch.Horizontal.TProgressbar", background=SUCCESS_COLOR)
 style.configure("Roll.Horizontal.TProgressbar", background=ACCENT_COLOR)
 
+# Build one label / progress bar / value row per angle from a table instead of three copied blocks
+def make_angle_row(parent, row, name, var, style_name):
+    """Create the widgets for one angle readout row and return (label, progress, value)."""
+    label = ttk.Label(parent, text=f"{name}:", font=('Helvetica', 10, 'bold'))
+    label.grid(row=row, column=0, sticky=tk.W, pady=4)
+    progress = ttk.Progressbar(parent, orient=tk.HORIZONTAL, mode='determinate',
+                               maximum=180, value=90, style=style_name)
+    progress.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=8, pady=4)
+    value = ttk.Label(parent, textvariable=var, font=('Helvetica', 10, 'bold'))
+    value.grid(row=row, column=2, sticky=tk.E, pady=4)
+    return label, progress, value
+
+angle_rows = [
+    make_angle_row(angle_display, row, name, var, style_name)
+    for row, (name, var, style_name) in enumerate((
+        ("Yaw", yaw_var, "Yaw.Horizontal.TProgressbar"),
+        ("Pitch", pitch_var, "Pitch.Horizontal.TProgressbar"),
+        ("Roll", roll_var, "Roll.Horizontal.TProgressbar"),
+    ))
+]
+(yaw_label, yaw_progress, yaw_value), (pitch_label, pitch_progress, pitch_value), \
+    (roll_label, roll_progress, roll_value) = angle_rows
+
+# Font size and padding last applied by update_angle_display_fonts
+angle_display_metrics = None
+
 # Create a function to update font sizes based on window size
 def update_angle_display_fonts(event=None):
+    global angle_display_metrics
     # Get the current width of the angle display frame
     width = angle_display.winfo_width()
     if width < 10:  # If width is not yet available, use a default
         width = 300
     
-    # Calculate font size based on width (scale with window size)
+    # Calculate font size and padding based on width (scale with window size)
     base_font_size = max(8, int(width / 40))
-    label_font = ('Helvetica', base_font_size, 'bold')
-    value_font = ('Helvetica', base_font_size, 'bold')
-    
-    # Update font for all labels
-    yaw_label.configure(font=label_font)
-    pitch_label.configure(font=label_font)
-    roll_label.configure(font=label_font)
-    
-    # Update font for all value labels
-    yaw_value.configure(font=value_font)
-    pitch_value.configure(font=value_font)
-    roll_value.configure(font=value_font)
-    
-    # Update padding based on width
     pad_x = max(4, int(width / 30))
     pad_y = max(2, int(width / 100))
     
-    # Update padding for all widgets
-    yaw_progress.grid(padx=pad_x, pady=pad_y)
-    pitch_progress.grid(padx=pad_x, pady=pad_y)
-    roll_progress.grid(padx=pad_x, pady=pad_y)
-    
-    yaw_label.grid(pady=pad_y)
-    pitch_label.grid(pady=pad_y)
-    roll_label.grid(pady=pad_y)
+    # Configure events fire often; only touch the widgets when the result changes
+    if angle_display_metrics == (base_font_size, pad_x, pad_y):
+        return
+    angle_display_metrics = (base_font_size, pad_x, pad_y)
     
-    yaw_value.grid(pady=pad_y)
-    pitch_value.grid(pady=pad_y)
-    roll_value.grid(pady=pad_y)
-
-# Yaw display
-yaw_label = ttk.Label(angle_display, text="Yaw:", font=('Helvetica', 10, 'bold'))
-yaw_label.grid(row=0, column=0, sticky=tk.W, pady=4)
-yaw_progress = ttk.Progressbar(angle_display, orient=tk.HORIZONTAL, mode='determinate',
-                              maximum=180, value=90, style="Yaw.Horizontal.TProgressbar")
-yaw_progress.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=8, pady=4)
-yaw_value = ttk.Label(angle_display, textvariable=yaw_var, font=('Helvetica', 10, 'bold'))
-yaw_value.grid(row=0, column=2, sticky=tk.E, pady=4)
-
-# Pitch display
-pitch_label = ttk.Label(angle_display, text="Pitch:", font=('Helvetica', 10, 'bold'))
-pitch_label.grid(row=1, column=0, sticky=tk.W, pady=4)
-pitch_progress = ttk.Progressbar(angle_display, orient=tk.HORIZONTAL, mode='determinate',
-                               maximum=180, value=90, style="Pitch.Horizontal.TProgressbar")
-pitch_progress.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=8, pady=4)
-pitch_value = ttk.Label(angle_display, textvariable=pitch_var, font=('Helvetica', 10, 'bold'))
-pitch_value.grid(row=1, column=2, sticky=tk.E, pady=4)
-
-# Roll display
-roll_label = ttk.Label(angle_display, text="Roll:", font=('Helvetica', 10, 'bold'))
-roll_label.grid(row=2, column=0, sticky=tk.W, pady=4)
-roll_progress = ttk.Progressbar(angle_display, orient=tk.HORIZONTAL, mode='determinate',
-                              maximum=180, value=90, style="Roll.Horizontal.TProgressbar")
-roll_progress.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=8, pady=4)
-roll_value = ttk.Label(angle_display, textvariable=roll_var, font=('Helvetica', 10, 'bold'))
-roll_value.grid(row=2, column=2, sticky=tk.E, pady=4)
+    font = ('Helvetica', base_font_size, 'bold')
+    for label, progress, value in angle_rows:
+        label.configure(font=font)
+        value.configure(font=font)
+        progress.grid(padx=pad_x, pady=pad_y)
+        label.grid(pady=pad_y)
+        value.grid(pady=pad_y)
 
 # Bind resize event to update fonts
 angle_display.bind('<Configure>', update_angle_display_fonts)
@@ -530,6 +509,10 @@ ttk.Separator(readouts_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
 
 # Create XYZ Arrow visualization class
 class XYZArrows(tk.Canvas):
+    # Whole-degree trig tables; the arrows never move by less than ARROW_UPDATE_THRESHOLD anyway
+    _COS = tuple(math.cos(math.radians(d)) for d in range(360))
+    _SIN = tuple(math.sin(math.radians(d)) for d in range(360))
+    
     def __init__(self, parent, size=100, bg=DARK_BG, fg=TEXT_COLOR, highlightthickness=0):
         # Calculate size based on parent dimensions for better high-res display support
         parent_width = parent.winfo_width()
@@ -553,47 +536,51 @@ class XYZArrows(tk.Canvas):
         self.center_y = self.size // 2
         self.arrow_length = self.size // 3
         
-        # Create background circle for better visibility
-        self.create_oval(
-            self.center_x - self.arrow_length - 15,
-            self.center_y - self.arrow_length - 15,
-            self.center_x + self.arrow_length + 15,
-            self.center_y + self.arrow_length + 15,
-            fill=DARKER_BG, outline=TEXT_COLOR, width=1
-        )
-        
-        # Create initial arrows
+        # Create every item once; resizes only move and restyle them
+        self.circle = self.create_oval(0, 0, 0, 0, fill=DARKER_BG, outline=TEXT_COLOR, width=1)
         self.x_arrow = self.create_line(0, 0, 0, 0, fill='red', width=4, arrow=tk.LAST)
         self.y_arrow = self.create_line(0, 0, 0, 0, fill='green', width=4, arrow=tk.LAST)
         self.z_arrow = self.create_line(0, 0, 0, 0, fill='blue', width=4, arrow=tk.LAST)
-        
-        # Create labels with larger, bold font - scale font size with widget size
-        font_size = max(14, int(self.size / 15))  # Scale font size with widget size
-        self.create_text(self.center_x + self.arrow_length + 12, self.center_y, 
-                        text="X", fill='red', font=('Helvetica', font_size, 'bold'))
-        self.create_text(self.center_x, self.center_y - self.arrow_length - 12, 
-                        text="Y", fill='green', font=('Helvetica', font_size, 'bold'))
-        self.create_text(self.center_x + 12, self.center_y + 12, 
-                        text="Z", fill='blue', font=('Helvetica', font_size, 'bold'))
-        
-        # Create a small legend in the corner with better spacing
-        legend_x = 15
-        legend_y = self.size - 80  # Move up to avoid overlap
-        legend_font_size = max(10, int(self.size / 22))  # Scale legend font size
-        legend_spacing = max(20, int(self.size / 20))  # Scale spacing with size
-        
-        self.create_text(legend_x, legend_y, text="X: Roll", fill='red', 
-                        font=('Helvetica', legend_font_size, 'bold'), anchor=tk.W)
-        self.create_text(legend_x, legend_y + legend_spacing, text="Y: Pitch", fill='green', 
-                        font=('Helvetica', legend_font_size, 'bold'), anchor=tk.W)
-        self.create_text(legend_x, legend_y + legend_spacing * 2, text="Z: Yaw", fill='blue', 
-                        font=('Helvetica', legend_font_size, 'bold'), anchor=tk.W)
-        
-        self.update_arrows(0, 0, 0)
+        self.x_label = self.create_text(0, 0, text="X", fill='red')
+        self.y_label = self.create_text(0, 0, text="Y", fill='green')
+        self.z_label = self.create_text(0, 0, text="Z", fill='blue')
+        self.legend = [
+            self.create_text(0, 0, text="X: Roll", fill='red', anchor=tk.W),
+            self.create_text(0, 0, text="Y: Pitch", fill='green', anchor=tk.W),
+            self.create_text(0, 0, text="Z: Yaw", fill='blue', anchor=tk.W),
+        ]
+        
+        self._last_yaw = self._last_pitch = self._last_roll = 0
+        self.layout(arrow_width=4)
         
         # Bind resize event to update the visualization
         self.bind('<Configure>', self.on_resize)
         
+    def layout(self, arrow_width):
+        """Place and size the static items for the current center and arrow length"""
+        r = self.arrow_length + 15
+        self.coords(self.circle, self.center_x - r, self.center_y - r, self.center_x + r, self.center_y + r)
+        for arrow in (self.x_arrow, self.y_arrow, self.z_arrow):
+            self.itemconfigure(arrow, width=arrow_width)
+        
+        # Labels with larger, bold font - scale font size with widget size
+        font = ('Helvetica', max(14, int(self.size / 15)), 'bold')
+        self.coords(self.x_label, self.center_x + self.arrow_length + 12, self.center_y)
+        self.coords(self.y_label, self.center_x, self.center_y - self.arrow_length - 12)
+        self.coords(self.z_label, self.center_x + 12, self.center_y + 12)
+        for label in (self.x_label, self.y_label, self.z_label):
+            self.itemconfigure(label, font=font)
+        
+        # Small legend in the corner with spacing scaled to the widget
+        legend_y = self.size - 80  # Move up to avoid overlap
+        legend_font = ('Helvetica', max(10, int(self.size / 22)), 'bold')
+        legend_spacing = max(20, int(self.size / 20))
+        for i, item in enumerate(self.legend):
+            self.coords(item, 15, legend_y + legend_spacing * i)
+            self.itemconfigure(item, font=legend_font)
+        
+        self.draw_arrows(self._last_yaw, self._last_pitch, self._last_roll)
+        
     def on_resize(self, event):
         """Handle resize events to update the visualization"""
         # Only update if the size has changed significantly
@@ -603,107 +590,39 @@ class XYZArrows(tk.Canvas):
             self.center_x = event.width // 2
             self.center_y = event.height // 2
             self.arrow_length = self.size // 3
-            
-            # Clear and redraw
-            self.delete("all")
-            
-            # Redraw background circle
-            self.create_oval(
-                self.center_x - self.arrow_length - 15,
-                self.center_y - self.arrow_length - 15,
-                self.center_x + self.arrow_length + 15,
-                self.center_y + self.arrow_length + 15,
-                fill=DARKER_BG, outline=TEXT_COLOR, width=1
-            )
-            
-            # Redraw arrows with scaled width
-            arrow_width = max(4, int(self.size / 55))  # Scale arrow width with size
-            self.x_arrow = self.create_line(0, 0, 0, 0, fill='red', width=arrow_width, arrow=tk.LAST)
-            self.y_arrow = self.create_line(0, 0, 0, 0, fill='green', width=arrow_width, arrow=tk.LAST)
-            self.z_arrow = self.create_line(0, 0, 0, 0, fill='blue', width=arrow_width, arrow=tk.LAST)
-            
-            # Redraw labels with scaled font size
-            font_size = max(14, int(self.size / 15))
-            self.create_text(self.center_x + self.arrow_length + 12, self.center_y, 
-                            text="X", fill='red', font=('Helvetica', font_size, 'bold'))
-            self.create_text(self.center_x, self.center_y - self.arrow_length - 12, 
-                            text="Y", fill='green', font=('Helvetica', font_size, 'bold'))
-            self.create_text(self.center_x + 12, self.center_y + 12, 
-                            text="Z", fill='blue', font=('Helvetica', font_size, 'bold'))
-            
-            # Redraw legend with scaled font size and spacing
-            legend_x = 15
-            legend_y = self.size - 80  # Move up to avoid overlap
-            legend_font_size = max(10, int(self.size / 22))
-            legend_spacing = max(20, int(self.size / 20))  # Scale spacing with size
-            
-            self.create_text(legend_x, legend_y, text="X: Roll", fill='red', 
-                            font=('Helvetica', legend_font_size, 'bold'), anchor=tk.W)
-            self.create_text(legend_x, legend_y + legend_spacing, text="Y: Pitch", fill='green', 
-                            font=('Helvetica', legend_font_size, 'bold'), anchor=tk.W)
-            self.create_text(legend_x, legend_y + legend_spacing * 2, text="Z: Yaw", fill='blue', 
-                            font=('Helvetica', legend_font_size, 'bold'), anchor=tk.W)
-            
-            # Update arrows with current values
-            if hasattr(self, '_last_yaw'):
-                self.update_arrows(self._last_yaw, self._last_pitch, self._last_roll)
+            self.layout(arrow_width=max(4, int(self.size / 55)))  # Scale arrow width with size
         
     def update_arrows(self, yaw, pitch, roll):
-        """Update arrow positions based on IMU orientation"""
+        """Update arrow positions based on IMU orientation, skipping changes too small to see"""
+        if (abs(yaw - self._last_yaw) < ARROW_UPDATE_THRESHOLD
+                and abs(pitch - self._last_pitch) < ARROW_UPDATE_THRESHOLD
+                and abs(roll - self._last_roll) < ARROW_UPDATE_THRESHOLD):
+            return
+        self.draw_arrows(yaw, pitch, roll)
+        
+    def draw_arrows(self, yaw, pitch, roll):
+        """Move the arrows to the given orientation unconditionally"""
         # Store last values for resize handling
         self._last_yaw = yaw
         self._last_pitch = pitch
         self._last_roll = roll
         
-        # Convert angles to radians
-        yaw_rad = math.radians(yaw)
-        pitch_rad = math.radians(pitch)
-        roll_rad = math.radians(roll)
-        
-        # Create rotation matrices
-        def rot_z(angle):  # yaw
-            c = math.cos(angle)
-            s = math.sin(angle)
-            return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
-            
-        def rot_y(angle):  # pitch
-            c = math.cos(angle)
-            s = math.sin(angle)
-            return np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
-            
-        def rot_x(angle):  # roll
-            c = math.cos(angle)
-            s = math.sin(angle)
-            return np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
-        
-        # Combined rotation matrix
-        R = rot_z(yaw_rad) @ rot_y(pitch_rad) @ rot_x(roll_rad)
-        
-        # Base vectors
-        x_base = np.array([1, 0, 0]) * self.arrow_length
-        y_base = np.array([0, 1, 0]) * self.arrow_length
-        z_base = np.array([0, 0, 1]) * self.arrow_length
-        
-        # Rotate vectors
-        x_rot = R @ x_base
-        y_rot = R @ y_base
-        z_rot = R @ z_base
-        
-        # Update arrows (project 3D to 2D)
-        # X arrow (red)
-        self.coords(self.x_arrow,
-                   self.center_x, self.center_y,
-                   self.center_x + x_rot[0], self.center_y - x_rot[1])
-        
-        # Y arrow (green)
-        self.coords(self.y_arrow,
-                   self.center_x, self.center_y,
-                   self.center_x + y_rot[0], self.center_y - y_rot[1])
-        
-        # Z arrow (blue)
-        self.coords(self.z_arrow,
-                   self.center_x, self.center_y,
-                   self.center_x + z_rot[0], self.center_y - z_rot[1])
+        # Combined rotation R = Rz(yaw) @ Ry(pitch) @ Rx(roll); its columns are the rotated unit axes
+        cos, sin = self._COS, self._SIN
+        iy, ip, ir = round(yaw) % 360, round(pitch) % 360, round(roll) % 360
+        cy, sy = cos[iy], sin[iy]
+        cp, sp = cos[ip], sin[ip]
+        cr, sr = cos[ir], sin[ir]
+        R = np.array([
+            [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+            [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        ])
+        
+        # Project all three arrow tips to canvas coordinates at once (only the x/y rows are needed)
+        tips_x = self.center_x + R[0] * self.arrow_length
+        tips_y = self.center_y - R[1] * self.arrow_length
+        for arrow, tip_x, tip_y in zip((self.x_arrow, self.y_arrow, self.z_arrow), tips_x, tips_y):
+            self.coords(arrow, self.center_x, self.center_y, tip_x, tip_y)
 
 # Create XYZ arrows visualization with flexible resizing
 arrows_frame = ttk.LabelFrame(readouts_frame, text="IMU Orientation", padding="10")
@@ -746,14 +665,24 @@ def update_arrows_frame_size(event=None):
     
     # Force update of the arrows visualization
     if hasattr(xyz_arrows, '_last_yaw'):
-        xyz_arrows.update_arrows(xyz_arrows._last_yaw, xyz_arrows._last_pitch, xyz_arrows._last_roll)
+        xyz_arrows.draw_arrows(xyz_arrows._last_yaw, xyz_arrows._last_pitch, xyz_arrows._last_roll)
 
 # Bind resize event to update arrows frame size
 readouts_frame.bind('<Configure>', update_arrows_frame_size)
 
+# Angles last shown, in tenths of a degree (the .1f display resolution)
+last_displayed_angles = None
+
 # Update angle display function without gauge references
 def update_angle_display(yaw, pitch, roll):
     """Update the angle display with current values"""
+    global last_displayed_angles
+    # Skip the Tk updates when nothing would visibly change (e.g. a stationary IMU)
+    key = (round(yaw * 10), round(pitch * 10), round(roll * 10))
+    if key == last_displayed_angles:
+        return
+    last_displayed_angles = key
+    
     # Update variables
     yaw_var.set(f"{yaw:.1f}°")
     pitch_var.set(f"{pitch:.1f}°")
@@ -770,28 +699,27 @@ def update_angle_display(yaw, pitch, roll):
 
 # Function to update plot limits based on data
 def update_plot_limits():
-    if not auto_resize_var.get() or not x_data:
+    global plot_range
+    if not auto_resize_var.get() or not history_count:
         return
     
-    # Calculate needed range with some padding using filtered data
-    x_min, x_max = min(x_filtered), max(x_filtered)
-    y_min, y_max = min(y_filtered), max(y_filtered)
-    z_min, z_max = min(z_filtered), max(z_filtered)
-    
-    # Add 10% padding
-    x_range = max(abs(x_min), abs(x_max)) * 1.1
-    y_range = max(abs(y_min), abs(y_max)) * 1.1
-    z_range = max(abs(z_min), abs(z_max)) * 1.1
-    
-    # Use the largest range for all axes to maintain aspect ratio
-    max_range = max(x_range, y_range, z_range, 20)  # Minimum range of 20 degrees
+    # Largest absolute filtered angle in one reduction over plot_buffer rows 3-5,
+    # which update_plot filled with the filtered history just before calling this.
+    # Add 10% padding and use the same range for all axes to maintain aspect ratio
+    max_range = max(float(np.abs(plot_buffer[3:6, :history_count]).max()) * 1.1, 20)  # Minimum range of 20 degrees
+    # Snap to PLOT_RANGE_STEP so small drifts don't change the limits, and skip the
+    # set_*lim calls (and the full redraw they force) when the range is unchanged
+    max_range = math.ceil(max_range / PLOT_RANGE_STEP) * PLOT_RANGE_STEP
+    if max_range == plot_range:
+        return
+    plot_range = max_range
     
     ax.set_xlim(-max_range, max_range)
     ax.set_ylim(-max_range, max_range)
     ax.set_zlim(-max_range, max_range)
     
-    # Mark for redraw
-    schedule_redraw()
+    # Mark for redraw; the axes changed so the blit background must be rebuilt
+    schedule_redraw(full=True)
 
 # Function to convert Euler angles to direction vector
 def euler_to_vector(yaw, pitch, roll):
@@ -810,130 +738,166 @@ def euler_to_vector(yaw, pitch, roll):
     return [x, y, z]
 
 # Throttle redraws for better performance
-def schedule_redraw():
-    global redraw_needed
+def schedule_redraw(full=False):
+    global redraw_needed, full_redraw_needed
     redraw_needed = True
+    if full:
+        full_redraw_needed = True
 
 # Actual redraw function that runs periodically
 def redraw_if_needed():
-    global redraw_needed, last_redraw_time
+    global redraw_needed, full_redraw_needed, last_redraw_time
     current_time = time.time() * 1000  # current time in ms
     
-    if redraw_needed and (current_time - last_redraw_time) > redraw_var.get():
-        figure_canvas.draw()
+    if redraw_needed and (current_time - last_redraw_time) > redraw_interval_ms:
+        if full_redraw_needed or blit_background is None:
+            figure_canvas.draw()  # on_full_draw recaptures the background
+            full_redraw_needed = False
+        else:
+            # Only repaint the animated artists over the cached axes background
+            figure_canvas.restore_region(blit_background)
+            draw_animated_artists()
+            figure_canvas.blit(fig.bbox)
         redraw_needed = False
         last_redraw_time = current_time
     
     # Schedule next check
     root.after(10, redraw_if_needed)
 
-# Function to update the plot
-def update_plot():
-    global x_data, y_data, z_data, x_filtered, y_filtered, z_filtered
-    
-    # Read all available data from the serial port
-    data_updated = False
-    
-    while ser.in_waiting > 0:
+# Parsed (yaw, pitch, roll) samples from the serial reader thread to the Tk thread
+sample_q = queue.Queue(maxsize=SAMPLE_QUEUE_SIZE)
+reader_running = threading.Event()
+
+def serial_reader():
+    """Read and parse serial lines on a background thread so blocking reads never stall Tk."""
+    # Whatever is pending in one read (or a single byte when idle, blocking up to the port timeout),
+    # split into lines here instead of pyserial's byte-at-a-time readline()
+    remainder = b""
+    while reader_running.is_set():
         try:
-            line_raw = ser.readline().decode('utf-8', errors='replace').strip()
-            
-            match = euler_regex.match(line_raw)
-            
-            if match:
-                yaw = float(match.group(1))
-                pitch = float(match.group(2))
-                roll = float(match.group(3))
-                
-                # Apply angle unwrapping if enabled
-                if continuous_yaw_var.get():
-                    yaw = yaw_unwrapper.unwrap(yaw)
-                
-                # Apply Kalman filter
-                measurement = np.array([yaw, pitch, roll])
-                kalman_filter.predict()
-                filtered = kalman_filter.update(measurement)
-                
-                # Store raw data
-                x_data.append(yaw)
-                y_data.append(pitch)
-                z_data.append(roll)
-                
-                # Store filtered data
-                x_filtered.append(filtered[0])
-                y_filtered.append(filtered[1])
-                z_filtered.append(filtered[2])
-                
-                # Update visual angle displays with filtered values
-                # For display, convert back to standard 0-360 range
-                display_yaw = filtered[0]
-                if not continuous_yaw_var.get():
-                    display_yaw = display_yaw % 360
-                update_angle_display(display_yaw, filtered[1], filtered[2])
-                
-                # Limit history to reduce memory and processing
-                if len(x_data) > DATA_HISTORY_LENGTH:
-                    x_data = x_data[-DATA_HISTORY_LENGTH:]
-                    y_data = y_data[-DATA_HISTORY_LENGTH:]
-                    z_data = z_data[-DATA_HISTORY_LENGTH:]
-                    x_filtered = x_filtered[-DATA_HISTORY_LENGTH:]
-                    y_filtered = y_filtered[-DATA_HISTORY_LENGTH:]
-                    z_filtered = z_filtered[-DATA_HISTORY_LENGTH:]
-                
-                data_updated = True
-            else:
-                # Print non-matching lines for debugging
-                if line_raw and not line_raw.startswith("Euler:"):
-                    print(f"Received: {line_raw}")
+            data = ser.read(ser.in_waiting or 1)
         except Exception as e:
+            if not reader_running.is_set():
+                break  # Port closed during shutdown
             # Handle serial read errors
             print(f"Serial read error: {e}")
             # Try to flush the input buffer if there's an issue
-            if ser.in_waiting > 100:  # If buffer is filling up with bad data
-                ser.reset_input_buffer()
-                print("Reset input buffer due to overflow")
+            try:
+                if ser.in_waiting > 100:  # If buffer is filling up with bad data
+                    ser.reset_input_buffer()
+                    print("Reset input buffer due to overflow")
+            except Exception:
+                pass
+            continue
+        
+        lines = (remainder + data).split(b"\n")
+        # Keep any trailing partial line for the next read
+        remainder = lines.pop()
+        if len(remainder) > SERIAL_MAX_LINE_LENGTH:
+            remainder = b""
+        
+        for line_raw in lines:
+            angles = parse_euler(line_raw.strip())
+            if angles:
+                try:
+                    sample_q.put_nowait(angles)
+                except queue.Full:
+                    # Drop the oldest sample so the display stays current
+                    try:
+                        sample_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    sample_q.put_nowait(angles)
+            elif line_raw.strip() and not line_raw.startswith(b"Euler:"):
+                # Print non-matching lines for debugging
+                print(f"Received: {line_raw.decode('utf-8', errors='replace').strip()}")
+
+reader_thread = threading.Thread(target=serial_reader, name="serial-reader", daemon=True)
+
+# Function to update the plot
+def update_plot():
+    # Drain queued samples (bounded per tick), then update the displays once with the latest sample
+    latest = None
+    k = 0
+    continuous_yaw = continuous_yaw_var.get()  # Read the Tk variable once per tick, not per sample
+    
+    while k < MAX_LINES_PER_TICK:
+        try:
+            yaw, pitch, roll = sample_q.get_nowait()
+        except queue.Empty:
+            break
+        
+        # Apply angle unwrapping if enabled
+        if continuous_yaw:
+            yaw = yaw_unwrapper.unwrap(yaw)
+        
+        # Apply Kalman filter
+        measurement = np.array([yaw, pitch, roll])
+        kalman_filter.predict()
+        filtered = kalman_filter.update(measurement)
+        
+        # Stage raw and filtered data; the batch goes into the history ring in one copy below
+        batch_scratch[k, 0:3] = yaw, pitch, roll
+        batch_scratch[k, 3:6] = filtered
+        k += 1
+        latest = filtered
+    
+    if k:
+        ingest_batch(k)
+    
+    # Update visual angle displays with the latest filtered values
+    if latest is not None:
+        # For display, convert back to standard 0-360 range
+        display_yaw = latest[0]
+        if not continuous_yaw:
+            display_yaw = display_yaw % 360
+        update_angle_display(display_yaw, latest[1], latest[2])
     
     # Update visualization if data changed
-    if data_updated and len(x_data) > 0:
+    if latest is not None:
+        # Unroll the history ring into the reused arrays and plot strided views of them
+        xs, ys, zs, xf, yf, zf = decimate_history(unroll_history(), PLOT_MAX_POINTS)
+
         # Update the plotted lines
-        line.set_data(x_data, y_data)
-        line.set_3d_properties(z_data)
-        filtered_line.set_data(x_filtered, y_filtered)
-        filtered_line.set_3d_properties(z_filtered)
+        line.set_data(xs, ys)
+        line.set_3d_properties(zs)
+        filtered_line.set_data(xf, yf)
+        filtered_line.set_3d_properties(zf)
         
         # Update the current position dot
-        dot.set_data([x_filtered[-1]], [y_filtered[-1]])
-        dot.set_3d_properties([z_filtered[-1]])
+        dot.set_data(xf[-1:], yf[-1:])
+        dot.set_3d_properties(zf[-1:])
         
         # Update the direction arrow (more efficiently)
-        if len(x_filtered) > 0:
-            # Get current position
-            pos = np.array([[x_filtered[-1], y_filtered[-1], z_filtered[-1]]])
-            
-            # For direction vector, use modular angles (0-360) for correct vector calculation
-            # but keep the arrow at the unwrapped position
-            yaw_for_vector = x_filtered[-1]
-            if continuous_yaw_var.get():
-                yaw_for_vector = yaw_for_vector % 360
-            
-            # Calculate direction vector
-            direction = euler_to_vector(yaw_for_vector, y_filtered[-1], z_filtered[-1])
-            direction = np.array([[direction[0], direction[1], direction[2]]])
-            
-            # Update quiver directly without recreating
-            quiver.set_segments([np.concatenate((pos, pos + direction * QUIVER_SCALE))])
+        # Get current position
+        pos = np.array([[latest[0], latest[1], latest[2]]])
+        
+        # For direction vector, use modular angles (0-360) for correct vector calculation
+        # but keep the arrow at the unwrapped position
+        yaw_for_vector = latest[0]
+        if continuous_yaw:
+            yaw_for_vector = yaw_for_vector % 360
+        
+        # Calculate direction vector
+        direction = euler_to_vector(yaw_for_vector, latest[1], latest[2])
+        direction = np.array([[direction[0], direction[1], direction[2]]])
+        
+        # Update quiver directly without recreating
+        quiver.set_segments([np.concatenate((pos, pos + direction * QUIVER_SCALE))])
         
         # Update plot limits if auto-resize is enabled
-        if len(x_data) > 1 and len(x_data) % 10 == 0:  # Only check every 10 points
+        if history_count > 1 and history_count % 10 == 0:  # Only check every 10 points
             update_plot_limits()
         
         # Schedule a redraw (actual redraw happens in redraw_if_needed)
         schedule_redraw()
     
-    # Schedule the next update
-    root.after(10, update_plot)
+    # Schedule the next update, polling less often while the IMU is quiet
+    root.after(UPDATE_INTERVAL_ACTIVE if latest is not None else UPDATE_INTERVAL_IDLE, update_plot)
 
-# Start the update and redraw processes
+# Start the serial reader, then the update and redraw processes
+reader_running.set()
+reader_thread.start()
 root.after(10, update_plot)
 root.after(10, redraw_if_needed)
 
@@ -955,7 +919,7 @@ def on_window_resize(event):
         
         # Update the XYZ arrows visualization
         if hasattr(xyz_arrows, '_last_yaw'):
-            xyz_arrows.update_arrows(xyz_arrows._last_yaw, xyz_arrows._last_pitch, xyz_arrows._last_roll)
+            xyz_arrows.draw_arrows(xyz_arrows._last_yaw, xyz_arrows._last_pitch, xyz_arrows._last_roll)
         
         # Update the paned window
         configure_paned_window()
@@ -970,5 +934,7 @@ root.bind('<Configure>', on_window_resize)
 root.mainloop()
 
 # Clean up when the window is closed
+reader_running.clear()
+reader_thread.join(timeout=2)  # readline() returns within the 1 s serial timeout
 ser.close()
 print("Serial connection closed.")